@@ -0,0 +1,292 @@
+"""
+Incremental reading of applicant uploads (NDJSON or CSV) and NDJSON output
+
+Bulk uploads can hold 100k+ applicants, so nothing here buffers a whole
+file: lines are split off the byte stream as it arrives, turned into one
+payload dict per record, and validated and scored in fixed-size chunks by
+the caller. Per-record problems (bad JSON, a bad CSV cell, a failed
+validation) become error records instead of aborting the upload.
+
+NDJSON: one applicant object per line; blank lines are skipped.
+
+CSV: a header row of ApplicantData field names. An empty cell leaves an
+optional field out (so its default applies) and is an empty string for a
+required one. List or dict fields (ap_courses, extracurriculars,
+ethnicity, gpa_by_year, ...) hold JSON, e.g. ["Asian"]. Quoted cells may
+span lines.
+
+Records carry the (first) line number they came from, so results and
+errors can be matched back to the upload. record_chunks() splits raw lines
+between records without parsing them, so other processes can do the
+parsing (bulk_score.py).
+"""
+
+import codecs
+import csv
+import json
+import typing
+from typing import AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from pydantic import ValidationError
+
+FORMATS = ("ndjson", "csv")
+
+# Longest line accepted; longer lines become an error record and are skipped
+MAX_LINE_BYTES = 1_000_000
+
+
+class Record(NamedTuple):
+    """One uploaded record: a payload dict to validate, or an error message"""
+    line: int
+    payload: Optional[Dict]
+    error: Optional[str] = None
+
+
+def format_for(content_type: Optional[str], filename: Optional[str] = None) -> str:
+    """'csv' for text/csv or a .csv file, otherwise 'ndjson'"""
+    if content_type and content_type.split(";")[0].strip().lower() in ("text/csv", "application/csv"):
+        return "csv"
+    if filename and filename.lower().endswith(".csv"):
+        return "csv"
+    return "ndjson"
+
+
+def json_columns(model) -> List[str]:
+    """Fields of a pydantic model whose CSV cells hold JSON (lists and dicts)"""
+    columns = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if typing.get_origin(annotation) is typing.Union:
+            annotation = next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+        if typing.get_origin(annotation) in (list, dict):
+            columns.append(name)
+    return columns
+
+
+class RecordParser:
+    """
+    Turns lines (without their newline) into Records, one line at a time.
+    feed(None) marks a line that was too long and has been dropped. The
+    pydantic model tells CSV cells how to read: JSON or plain, optional or not.
+    """
+
+    def __init__(self, fmt: str, model, header: Optional[str] = None, first_line: int = 1):
+        """header: CSV header line, for a chunk that starts after it"""
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format {fmt!r} (choose from {', '.join(FORMATS)})")
+        self.fmt = fmt
+        self.json_fields = set(json_columns(model))
+        self.required_fields = {name for name, field in model.model_fields.items() if field.is_required()}
+        self.header: Optional[List[str]] = None
+        if header is not None:
+            self.header = [cell.strip() for cell in next(csv.reader([header]))]
+        self.line = first_line - 1
+        # CSV record still inside a quoted cell: (first line number, lines so far)
+        self._open: Optional[Tuple[int, List[str]]] = None
+
+    def feed(self, text: Optional[str]) -> Optional[Record]:
+        self.line += 1
+        if text is None:
+            self._open = None
+            return Record(self.line, None, f"Line longer than {MAX_LINE_BYTES} bytes")
+        if self.fmt == "ndjson":
+            return self._ndjson(text)
+        return self._csv(text)
+
+    def close(self) -> Optional[Record]:
+        """Call at end of input: reports a CSV record left inside an unterminated quote"""
+        if self._open is not None:
+            start, _ = self._open
+            self._open = None
+            return Record(start, None, "Unterminated quoted CSV cell")
+        return None
+
+    def _ndjson(self, text: str) -> Optional[Record]:
+        if not text.strip():
+            return None
+        try:
+            payload = json.loads(text)
+        except ValueError as exc:
+            return Record(self.line, None, f"Invalid JSON: {exc}")
+        if not isinstance(payload, dict):
+            return Record(self.line, None, "Expected a JSON object")
+        return Record(self.line, payload)
+
+    def _csv(self, text: str) -> Optional[Record]:
+        # A record is complete once its quotes balance ("" escapes are even)
+        if self._open is None:
+            if text.count('"') % 2 == 0:
+                return self._csv_record(self.line, text)
+            self._open = (self.line, [text])
+            return None
+        start, lines = self._open
+        lines.append(text)
+        if text.count('"') % 2 == 0:
+            return None
+        self._open = None
+        return self._csv_record(start, "\n".join(lines))
+
+    def _csv_record(self, line: int, text: str) -> Optional[Record]:
+        if not text.strip():
+            return None
+        try:
+            cells = next(csv.reader([text]))
+        except csv.Error as exc:
+            return Record(line, None, f"Invalid CSV: {exc}")
+
+        if self.header is None:
+            self.header = [cell.strip() for cell in cells]
+            return None
+        if len(cells) != len(self.header):
+            return Record(line, None, f"Expected {len(self.header)} CSV cells, got {len(cells)}")
+
+        payload = {}
+        for name, cell in zip(self.header, cells):
+            if cell == "" and name not in self.required_fields:
+                continue
+            if name in self.json_fields:
+                try:
+                    payload[name] = json.loads(cell)
+                except ValueError as exc:
+                    return Record(line, None, f"Invalid JSON in column {name!r}: {exc}")
+            else:
+                payload[name] = cell
+        return Record(line, payload)
+
+
+def read_records(lines: Iterable[str], fmt: str, model, header: Optional[str] = None,
+                 first_line: int = 1) -> Iterator[Record]:
+    """Records from an iterable of text lines (e.g. an open file or a chunk from record_chunks)"""
+    parser = RecordParser(fmt, model, header, first_line)
+    for text in lines:
+        if len(text) > MAX_LINE_BYTES:
+            text = None
+        else:
+            text = text.rstrip("\r\n")
+        record = parser.feed(text)
+        if record is not None:
+            yield record
+    record = parser.close()
+    if record is not None:
+        yield record
+
+
+def record_chunks(lines: Iterable[str], fmt: str, size: int, start_line: int = 1) -> Iterator[Tuple[int, List[str]]]:
+    """
+    Raw lines in groups of `size` records, split only between records, as
+    (number of the group's first line, lines). A CSV header is not part of
+    any group: read it off `lines` first and pass start_line=2.
+    """
+    chunk: List[str] = []
+    first_line = records = 0
+    inside_quotes = False
+    for line, text in enumerate(lines, start=start_line):
+        if not chunk:
+            first_line = line
+        chunk.append(text)
+        if fmt == "csv" and text.count('"') % 2:
+            inside_quotes = not inside_quotes
+        if inside_quotes or not text.strip():
+            continue
+        records += 1
+        if records == size:
+            yield first_line, chunk
+            chunk, records = [], 0
+    if chunk:
+        yield first_line, chunk
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[Optional[str]]:
+    """
+    Decoded lines from a byte stream, holding at most one line in memory.
+    Yields None in place of a line longer than MAX_LINE_BYTES.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    skipping = False
+    async for chunk in chunks:
+        text = decoder.decode(chunk)
+        if "\n" not in text:
+            pending += text
+            if len(pending) > MAX_LINE_BYTES:
+                if not skipping:
+                    yield None
+                skipping = True
+                pending = ""
+            continue
+        *lines, pending = (pending + text).split("\n")
+        for line in lines:
+            if skipping:
+                skipping = False
+                continue
+            if len(line) > MAX_LINE_BYTES:
+                # Arrived whole, in one chunk with its newline
+                yield None
+                continue
+            yield line.rstrip("\r")
+        if len(pending) > MAX_LINE_BYTES:
+            if not skipping:
+                yield None
+            skipping = True
+            pending = ""
+    pending += decoder.decode(b"", final=True)
+    if pending and not skipping:
+        yield None if len(pending) > MAX_LINE_BYTES else pending.rstrip("\r")
+
+
+async def aread_records(chunks: AsyncIterable[bytes], fmt: str, model) -> AsyncIterator[Record]:
+    """Records from a byte stream such as Request.stream()"""
+    parser = RecordParser(fmt, model)
+    async for text in iter_lines(chunks):
+        record = parser.feed(text)
+        if record is not None:
+            yield record
+    record = parser.close()
+    if record is not None:
+        yield record
+
+
+def validate_records(validate: Callable[[Dict], object],
+                     records: List[Record]) -> Tuple[List[Tuple[int, object]], List[Tuple[int, object]]]:
+    """
+    Validate a chunk of records with a pydantic validator (Model.model_validate,
+    TypeAdapter.validate_python): ([(line, instance)], [(line, error)]),
+    errors as JSON-ready values
+    """
+    valid, errors = [], []
+    for record in records:
+        if record.error is not None:
+            errors.append((record.line, record.error))
+            continue
+        try:
+            valid.append((record.line, validate(record.payload)))
+        except ValidationError as exc:
+            errors.append((record.line, json.loads(exc.json(include_url=False, include_input=False))))
+    return valid, errors
+
+
+def score_records(evaluator, validate: Callable[[Dict], object], records: List[Record], fields: Sequence[str],
+                  narrative: bool = True) -> Tuple[List[Dict], int, int]:
+    """
+    Validate and score one chunk with evaluator.evaluate_batch():
+    ([{"line", "result"} or {"line", "error"} in upload order], scored, errors).
+    Results keep only `fields`; narrative=False skips generating the text ones.
+    If evaluation itself fails, the chunk's valid records become error
+    records, so one bad chunk does not end the upload.
+    """
+    valid, errors = validate_records(validate, records)
+    try:
+        results = evaluator.evaluate_batch([instance for _, instance in valid], narrative=narrative)
+    except Exception as e:
+        print(f"Evaluation of a {len(valid)}-record chunk failed: {type(e).__name__}: {e}")
+        errors.extend((line, f"Evaluation failed: {type(e).__name__}") for line, _ in valid)
+        valid, results = [], []
+    rows = [{"line": line, "result": {name: result[name] for name in fields}}
+            for (line, _), result in zip(valid, results)]
+    rows.extend({"line": line, "error": error} for line, error in errors)
+    rows.sort(key=lambda row: row["line"])
+    return rows, len(valid), len(errors)
+
+
+def ndjson_line(obj) -> bytes:
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
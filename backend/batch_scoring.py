@@ -0,0 +1,235 @@
+"""
+Vectorized (NumPy) versions of the rule-based scores in evaluator.py
+Used by Top50AdmissionsEvaluator.evaluate_batch - every function mirrors its
+scalar counterpart operation by operation so batch results match exactly
+"""
+
+from itertools import repeat
+from typing import List
+
+import numpy as np
+
+from keyword_matcher import KeywordMatcher
+from school_table import SchoolTable
+
+# Keyword tables shared by the scalar and vectorized scorers
+RESEARCH_KEYWORDS = ["published", "paper", "journal", "conference", "lab", "professor", "independent"]
+LEADERSHIP_KEYWORDS = ["president", "founder", "captain", "lead", "director", "chair"]
+PRESTIGIOUS_COMPETITION_KEYWORDS = ["international", "national", "olympiad", "intel", "regeneron", "siemens"]
+CURRICULUM_DIFFICULTY_POINTS = {"low": 3, "medium": 6, "high": 9, "very_high": 10}
+RURAL_STATES = ["Wyoming", "Montana", "North Dakota", "South Dakota", "Alaska"]
+
+PROFILE_KEYWORDS = KeywordMatcher({
+    "research": RESEARCH_KEYWORDS,
+    "leadership": LEADERSHIP_KEYWORDS,
+    "prestigious_competition": PRESTIGIOUS_COMPETITION_KEYWORDS,
+})
+
+# selectivity -> (exponent, ceiling) of the curve in _calculate_probability
+SELECTIVITY_CURVES = {
+    "most_competitive": (2, 0.8),
+    "highly_competitive": (1.5, 0.85),
+    "very_competitive": (1.3, 0.90),
+}
+COMPETITIVE_CEILING = 0.92
+
+
+class ApplicantColumns:
+    """Per-applicant inputs of the rule-based scorers, one NumPy array per field"""
+
+    @classmethod
+    def from_applicants(cls, applicants: List) -> "ApplicantColumns":
+        gpa_unweighted, gpa_trend_points, sat_score = [], [], []
+        num_aps, avg_ap_score, difficulty_points = [], [], []
+        international, toefl_score, ielts_score = [], [], []
+        research_keyword_count, num_activities, has_leadership = [], [], []
+        num_competitions, has_prestigious_competition = [], []
+        lor_quality, essay_quality = [], []
+        rural_state, first_generation, legacy_status, recruited_athlete = [], [], [], []
+
+        for applicant in applicants:
+            gpa_unweighted.append(applicant.gpa_unweighted)
+            gpa_trend_points.append(
+                5 if applicant.gpa_trend == "upward" else -8 if applicant.gpa_trend == "downward" else 0
+            )
+            sat_score.append(applicant.sat_score or 0)
+
+            ap_courses = applicant.ap_courses
+            num_aps.append(len(ap_courses))
+            avg_ap_score.append(sum(ap.score for ap in ap_courses) / len(ap_courses) if ap_courses else 0.0)
+            difficulty_points.append(CURRICULUM_DIFFICULTY_POINTS.get(applicant.curriculum_difficulty, 5))
+
+            international.append(applicant.country != "United States")
+            toefl_score.append(applicant.toefl_score or 0)
+            ielts_score.append(applicant.ielts_score or 0)
+
+            research = applicant.research_experience
+            if research and len(research) > 50:
+                research_keyword_count.append(len(PROFILE_KEYWORDS.keywords_in(research, "research")))
+            else:
+                research_keyword_count.append(0)
+
+            num_activities.append(len(applicant.extracurriculars))
+            has_leadership.append("leadership" in PROFILE_KEYWORDS.scan_all(
+                [activity.role for activity in applicant.extracurriculars]
+            ))
+            num_competitions.append(len(applicant.competitions))
+            has_prestigious_competition.append("prestigious_competition" in PROFILE_KEYWORDS.scan_all(
+                [comp.level for comp in applicant.competitions]
+            ))
+
+            lor_quality.append(applicant.lor_quality)
+            essay_quality.append(applicant.essay_quality)
+
+            rural_state.append(applicant.state_province in RURAL_STATES)
+            first_generation.append(applicant.first_generation)
+            legacy_status.append(applicant.legacy_status)
+            recruited_athlete.append(applicant.recruited_athlete)
+
+        columns = cls()
+        columns.size = len(applicants)
+        columns.gpa_unweighted = np.array(gpa_unweighted, dtype=np.float64)
+        columns.gpa_trend_points = np.array(gpa_trend_points, dtype=np.float64)
+        columns.sat_score = np.array(sat_score, dtype=np.float64)
+        columns.num_aps = np.array(num_aps, dtype=np.int64)
+        columns.avg_ap_score = np.array(avg_ap_score, dtype=np.float64)
+        columns.difficulty_points = np.array(difficulty_points, dtype=np.float64)
+        columns.international = np.array(international, dtype=bool)
+        columns.toefl_score = np.array(toefl_score, dtype=np.float64)
+        columns.ielts_score = np.array(ielts_score, dtype=np.float64)
+        columns.research_keyword_count = np.array(research_keyword_count, dtype=np.int64)
+        columns.num_activities = np.array(num_activities, dtype=np.int64)
+        columns.has_leadership = np.array(has_leadership, dtype=bool)
+        columns.num_competitions = np.array(num_competitions, dtype=np.int64)
+        columns.has_prestigious_competition = np.array(has_prestigious_competition, dtype=bool)
+        columns.lor_quality = np.array(lor_quality, dtype=np.float64)
+        columns.essay_quality = np.array(essay_quality, dtype=np.float64)
+        columns.rural_state = np.array(rural_state, dtype=bool)
+        columns.first_generation = np.array(first_generation, dtype=bool)
+        columns.legacy_status = np.array(legacy_status, dtype=bool)
+        columns.recruited_athlete = np.array(recruited_athlete, dtype=bool)
+        return columns
+
+    def repeat(self, count: int) -> "ApplicantColumns":
+        """Repeat every row count times (one applicant against many schools)"""
+        repeated = ApplicantColumns()
+        for name, values in vars(self).items():
+            setattr(repeated, name, np.repeat(values, count) if isinstance(values, np.ndarray) else values)
+        repeated.size = self.size * count
+        return repeated
+
+
+def exact_power(values: np.ndarray, exponent: float) -> np.ndarray:
+    """
+    Element-wise values ** exponent using the same libm pow as Python floats.
+    np.power may dispatch to SIMD kernels that differ in the last bit, which
+    would break parity with the scalar evaluator.
+    """
+    return np.fromiter(map(pow, values.tolist(), repeat(exponent)), dtype=np.float64, count=len(values))
+
+
+def academic_scores(columns: ApplicantColumns, schools: SchoolTable) -> np.ndarray:
+    """Vectorized _calculate_academic_score (before the cap at 100)"""
+    score = np.zeros(columns.size)
+
+    # GPA score (40% of academic)
+    gpa_percentile = np.minimum(columns.gpa_unweighted / schools.avg_gpa_unweighted, 1.2)
+    score += gpa_percentile * 40
+
+    # GPA trend bonus/penalty
+    score += columns.gpa_trend_points
+
+    # SAT score (35% of academic)
+    sat = columns.sat_score
+    sat_min, sat_max = schools.sat_min, schools.sat_max
+    sat_mid = (sat_min + sat_max) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        upper_half = 25 + ((sat - sat_mid) / (sat_max - sat_mid)) * 10
+        lower_half = np.maximum(0, 15 + ((sat - sat_min) / (sat_mid - sat_min)) * 10)
+    sat_points = np.where(sat >= sat_max, 35, np.where(sat >= sat_mid, upper_half, lower_half))
+    score += np.where(sat > 0, sat_points, 0)
+
+    # AP courses (15% of academic)
+    ap_score = np.minimum(columns.num_aps / 10, 1.0) * 10
+    ap_score += np.where(columns.num_aps > 0, (columns.avg_ap_score / 5) * 5, 0)
+    score += ap_score
+
+    # Curriculum difficulty (10% of academic)
+    score += columns.difficulty_points
+
+    # TOEFL/IELTS for international students
+    toefl, ielts = columns.toefl_score, columns.ielts_score
+    weak_english = ((toefl != 0) & (toefl < 90)) | ((ielts != 0) & (ielts < 6.5))
+    english_points = np.where(toefl >= 100, 3, np.where(ielts >= 7.0, 3, np.where(weak_english, -5, 0)))
+    score += np.where(columns.international, english_points, 0)
+
+    return score
+
+
+def extracurricular_scores(columns: ApplicantColumns) -> np.ndarray:
+    """Vectorized _calculate_extracurricular_score (before the cap at 100)"""
+    score = np.zeros(columns.size)
+
+    # Research experience (35% of EC)
+    score += np.minimum(columns.research_keyword_count * 5, 35)
+
+    # Extracurriculars (40% of EC)
+    n = columns.num_activities
+    score += np.where(n >= 8, 40, np.where(n >= 5, 30, np.where(n >= 3, 20, n * 5)))
+
+    # Leadership keywords bonus
+    score += np.where(columns.has_leadership, 5, 0)
+
+    # Competitions and awards (25% of EC)
+    n = columns.num_competitions
+    score += np.where(n >= 5, 25, np.where(n >= 3, 18, np.where(n >= 1, 10, 0)))
+
+    # Prestigious competition bonus
+    score += np.where(columns.has_prestigious_competition, 10, 0)
+
+    return score
+
+
+def application_scores(columns: ApplicantColumns) -> np.ndarray:
+    """Vectorized _calculate_application_score (before the cap at 100)"""
+    score = np.zeros(columns.size)
+    score += (columns.lor_quality / 5) * 50
+    score += (columns.essay_quality / 5) * 50
+    return score
+
+
+def demographic_scores(columns: ApplicantColumns) -> np.ndarray:
+    """Vectorized _calculate_demographic_score (before the cap at 100)"""
+    score = np.full(columns.size, 50.0)
+    score += np.where(columns.international, 15, np.where(columns.rural_state, 5, 0))
+    score += np.where(columns.first_generation, 10, 0)
+    score += np.where(columns.legacy_status, 5, 0)
+    score += np.where(columns.recruited_athlete, 20, 0)
+    return score
+
+
+def probabilities(total_score: np.ndarray, schools: SchoolTable) -> np.ndarray:
+    """Vectorized _calculate_probability over (score, school) pairs"""
+    normalized_score = total_score / 100
+    base_acceptance = schools.acceptance_rate
+
+    # competitive is the fallback curve for any unlisted selectivity
+    probability = base_acceptance + normalized_score * (COMPETITIVE_CEILING - base_acceptance)
+    for code, selectivity in enumerate(schools.selectivity_levels):
+        if selectivity not in SELECTIVITY_CURVES:
+            continue
+        exponent, ceiling = SELECTIVITY_CURVES[selectivity]
+        rows = np.flatnonzero(schools.selectivity == code)
+        if len(rows):
+            base = base_acceptance[rows]
+            probability[rows] = base + exact_power(normalized_score[rows], exponent) * (ceiling - base)
+
+    return np.minimum(np.maximum(probability, 0.01), 0.95)
+
+
+def to_python_scores(raw_scores: np.ndarray) -> List:
+    """
+    Capped scores as Python numbers, the way min(score, 100) returns them in
+    the scalar path (the int 100 when the cap applies)
+    """
+    return [100 if value > 100 else value for value in raw_scores.tolist()]
@@ -0,0 +1,113 @@
+"""
+Request-ingestion benchmark: ApplicantData models vs the fast ApplicantRecord path
+
+For each payload set, times what FastAPI does with a request body (json.loads,
+then validation) two ways:
+  - ApplicantData.model_validate  (models for the applicant and every AP
+    course, activity and competition)
+  - FastApplicantData via TypeAdapter.validate_python  (same core schema,
+    typed dicts, then a __slots__ ApplicantRecord; see fast_applicant.py)
+and reports microseconds per applicant.
+
+Before timing it checks that both paths agree: the same canonical profile
+(everything evaluation reads) for every valid payload, and the same errors
+for a set of invalid ones.
+
+Usage:
+    python benchmark_ingest.py [profiles]
+"""
+
+import copy
+import json
+import random
+import sys
+import time
+
+from pydantic import ValidationError
+
+from applicant_models import ApplicantData, fast_applicant_adapter
+from result_cache import canonical_profile
+from sample_profiles import sample_applicant_payload, synthetic_applicant_payloads
+
+REPEATS = 5
+INVALID_VALUES = [None, "x", -5, 99999, 3.7, [], {}, "", [1]]
+
+
+def errors_of(validate, payload):
+    try:
+        validate(payload)
+    except ValidationError as exc:
+        return exc.errors(include_url=False)
+    return None
+
+
+def invalid_payloads(payloads, count: int, seed: int = 0):
+    """Copies of payloads with a few fields (top-level or nested) replaced or removed"""
+    rng = random.Random(seed)
+    fields = list(ApplicantData.model_fields)
+    result = []
+    for _ in range(count):
+        payload = copy.deepcopy(rng.choice(payloads))
+        for _ in range(rng.randint(1, 3)):
+            name = rng.choice(fields)
+            items = payload.get(name)
+            if isinstance(items, list) and items and isinstance(items[0], dict):
+                item = rng.choice(items)
+                item[rng.choice(list(item))] = rng.choice(INVALID_VALUES)
+            elif rng.random() < 0.2:
+                payload.pop(name, None)
+            else:
+                payload[name] = rng.choice(INVALID_VALUES)
+        result.append(payload)
+    return result
+
+
+def best_time(fn) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def compare(label: str, payloads):
+    bodies = [json.dumps(payload).encode("utf-8") for payload in payloads]
+    size = sum(len(body) for body in bodies) / len(bodies)
+
+    models = best_time(lambda: [ApplicantData.model_validate(json.loads(body)) for body in bodies])
+    records = best_time(lambda: [fast_applicant_adapter.validate_python(json.loads(body)) for body in bodies])
+    decode = best_time(lambda: [json.loads(body) for body in bodies])
+
+    per = 1e6 / len(bodies)
+    print(f"{label} ({len(bodies)} bodies, {size:.0f} bytes on average)")
+    print(f"  json.loads alone:                 {decode * per:7.1f} us")
+    print(f"  json.loads + ApplicantData:       {models * per:7.1f} us")
+    print(f"  json.loads + ApplicantRecord:     {records * per:7.1f} us "
+          f"({models / records:.2f}x, validation alone {(models - decode) / (records - decode):.2f}x)")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    synthetic = synthetic_applicant_payloads(count)
+
+    mismatched = sum(
+        canonical_profile(ApplicantData.model_validate(payload))
+        != canonical_profile(fast_applicant_adapter.validate_python(payload))
+        for payload in synthetic
+    )
+    invalid = invalid_payloads(synthetic, count)
+    different_errors = sum(
+        errors_of(ApplicantData.model_validate, payload) != errors_of(fast_applicant_adapter.validate_python, payload)
+        for payload in invalid
+    )
+    print(f"valid payloads with a different record: {mismatched}/{count}")
+    print(f"invalid payloads with different errors: {different_errors}/{len(invalid)}")
+    print()
+
+    compare("sample profile", [sample_applicant_payload() for _ in range(count)])
+    compare("synthetic profiles", synthetic)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Keyword-matching benchmark on synthetic profiles
+
+Compares the shared KeywordMatcher (batch_scoring.PROFILE_KEYWORDS) with
+the per-keyword loops the scorers used before. The workload is research
+keyword counting plus the leadership and prestigious-competition checks,
+over N synthetic applicants with long research texts and many activities.
+It checks that both give identical answers, then reports the time per
+profile, and the time for ApplicantColumns.from_applicants over the whole
+set (the batch scoring input).
+
+Usage:
+    python benchmark_keywords.py [profiles]
+"""
+
+import sys
+import time
+
+from batch_scoring import (
+    ApplicantColumns, PROFILE_KEYWORDS,
+    RESEARCH_KEYWORDS, LEADERSHIP_KEYWORDS, PRESTIGIOUS_COMPETITION_KEYWORDS
+)
+from applicant_models import ApplicantData
+from sample_profiles import synthetic_applicant_payloads
+
+REPEATS = 5
+
+
+def loop_features(applicant):
+    """The scorers' original keyword loops"""
+    research = applicant.research_experience
+    research_count = sum(1 for kw in RESEARCH_KEYWORDS if kw.lower() in research.lower())
+    leadership = False
+    for activity in applicant.extracurriculars:
+        if any(kw in activity.role.lower() for kw in LEADERSHIP_KEYWORDS):
+            leadership = True
+            break
+    prestigious = False
+    for comp in applicant.competitions:
+        if any(p in comp.level.lower() for p in PRESTIGIOUS_COMPETITION_KEYWORDS):
+            prestigious = True
+            break
+    return research_count, leadership, prestigious
+
+
+def matcher_features(applicant):
+    return (
+        len(PROFILE_KEYWORDS.keywords_in(applicant.research_experience, "research")),
+        "leadership" in PROFILE_KEYWORDS.scan_all([activity.role for activity in applicant.extracurriculars]),
+        "prestigious_competition" in PROFILE_KEYWORDS.scan_all([comp.level for comp in applicant.competitions]),
+    )
+
+
+def best_time(fn, *args) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    applicants = [ApplicantData(**payload) for payload in synthetic_applicant_payloads(count)]
+    words = sum(len(a.research_experience.split()) for a in applicants) / count
+    activities = sum(len(a.extracurriculars) for a in applicants) / count
+    print(f"{count} profiles: {words:.0f} research words, {activities:.1f} activities on average")
+
+    mismatches = sum(loop_features(a) != matcher_features(a) for a in applicants)
+    print(f"mismatches: {mismatches}")
+
+    loops = best_time(lambda: [loop_features(a) for a in applicants])
+    matcher = best_time(lambda: [matcher_features(a) for a in applicants])
+    print(f"keyword loops:   {loops / count * 1e6:7.2f} us/profile")
+    print(f"KeywordMatcher:  {matcher / count * 1e6:7.2f} us/profile ({loops / matcher:.1f}x)")
+
+    columns = best_time(ApplicantColumns.from_applicants, applicants)
+    print(f"ApplicantColumns.from_applicants: {columns * 1e3:.1f} ms for {count} profiles")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Latency under mixed traffic, with and without the evaluation thread pool
+
+Starts the API with uvicorn once per configuration and drives it at fixed
+request rates (open loop, so a stalled server shows up as latency):
+  - single-applicant POST /evaluate requests,
+  - heavy POST /evaluate/batch requests,
+  - the cheap GET /schools route.
+
+Reports p50/p99 latency per route and how many requests got 503.
+EVALUATION_WORKERS=0 is the old behaviour (evaluation on the event loop).
+
+Usage:
+    python benchmark_latency.py [seconds_per_config]
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+
+from sample_profiles import sample_applicant_payload
+
+PORT = 8765
+BASE_URL = f"http://127.0.0.1:{PORT}"
+CONFIGS = [
+    ("inline (event loop)", {"EVALUATION_WORKERS": "0", "EVALUATION_QUEUE_DEPTH": "64"}),
+    ("thread pool, 4 workers", {"EVALUATION_WORKERS": "4", "EVALUATION_QUEUE_DEPTH": "64"}),
+]
+# Requests per second per route
+RATES = {'/schools': 20, '/evaluate': 40, '/evaluate/batch': 1}
+BATCH_SIZE = 200
+
+
+def start_server(env_overrides: Dict[str, str]) -> subprocess.Popen:
+    env = dict(os.environ, **env_overrides)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(PORT), "--log-level", "warning"],
+        cwd=Path(__file__).parent, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        try:
+            httpx.get(f"{BASE_URL}/", timeout=1)
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("Server did not start")
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return float('nan')
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def drive(duration: float) -> Dict[str, Dict]:
+    payload = sample_applicant_payload()
+    batch = [payload] * BATCH_SIZE
+    stats = {route: {'latencies': [], 'busy': 0} for route in ('/schools', '/evaluate', '/evaluate/batch')}
+    stop_at = time.perf_counter() + duration
+
+    async def timed(client, route, method, **kwargs):
+        start = time.perf_counter()
+        response = await client.request(method, route, **kwargs)
+        elapsed = (time.perf_counter() - start) * 1000
+        if response.status_code == 503:
+            stats[route]['busy'] += 1
+        else:
+            response.raise_for_status()
+            stats[route]['latencies'].append(elapsed)
+
+    async def send_at_rate(client, route, method, **kwargs):
+        """Fire requests on a fixed schedule without waiting for responses"""
+        interval = 1 / RATES[route]
+        next_send = time.perf_counter()
+        in_flight = []
+        while next_send < stop_at:
+            in_flight.append(asyncio.create_task(timed(client, route, method, **kwargs)))
+            next_send += interval
+            await asyncio.sleep(max(0.0, next_send - time.perf_counter()))
+        await asyncio.gather(*in_flight)
+
+    limits = httpx.Limits(max_connections=None)
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=60, limits=limits) as client:
+        await asyncio.gather(
+            send_at_rate(client, '/schools', 'GET'),
+            send_at_rate(client, '/evaluate', 'POST', json=payload),
+            send_at_rate(client, '/evaluate/batch', 'POST', json=batch),
+        )
+    return stats
+
+
+def main():
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+
+    print(f"{'config':<26}{'route':<18}{'requests':>9}{'503s':>7}{'p50 ms':>9}{'p99 ms':>9}")
+    for name, env in CONFIGS:
+        server = start_server(env)
+        try:
+            stats = asyncio.run(drive(duration))
+        finally:
+            server.terminate()
+            server.wait()
+
+        for route, route_stats in stats.items():
+            latencies = route_stats['latencies']
+            print(f"{name:<26}{route:<18}{len(latencies):>9}{route_stats['busy']:>7}"
+                  f"{percentile(latencies, 50):>9.1f}{percentile(latencies, 99):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
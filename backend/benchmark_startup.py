@@ -0,0 +1,75 @@
+"""
+Startup-time benchmark: how long until the API answers, and until the ML
+model is warm
+
+For each run, starts the shipped launcher (prefork.serve(), which
+run_server.py and start_server.py call) in a fresh process and polls
+  - GET /schools  -> time to first response (static routes are up)
+  - GET /ready    -> time until the model has loaded (200 instead of 503)
+and reports the median over all runs. With one worker the server answers
+before the model is loaded; with more, the master loads it before forking.
+
+Usage:
+    python benchmark_startup.py [runs] [workers]
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+PORT = 8766
+BASE_URL = f"http://127.0.0.1:{PORT}"
+POLL_INTERVAL = 0.01
+TIMEOUT = 120
+
+
+def wait_for(path: str, started: float, expect_status: int = 200) -> float:
+    """Seconds from `started` until GET path returns expect_status"""
+    while time.perf_counter() - started < TIMEOUT:
+        try:
+            if httpx.get(BASE_URL + path, timeout=1).status_code == expect_status:
+                return time.perf_counter() - started
+        except httpx.HTTPError:
+            pass
+        time.sleep(POLL_INTERVAL)
+    raise RuntimeError(f"{path} did not return {expect_status} within {TIMEOUT}s")
+
+
+def measure_once(workers: int):
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "prefork.py", str(workers), str(PORT)],
+        cwd=Path(__file__).parent, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        first_response = wait_for("/schools", started)
+        ready = wait_for("/ready", started)
+    finally:
+        server.terminate()
+        server.wait()
+    return first_response, ready
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    first_responses, readies = [], []
+    for run in range(runs):
+        first_response, ready = measure_once(workers)
+        first_responses.append(first_response)
+        readies.append(ready)
+        print(f"run {run + 1}: first response {first_response:.2f}s, model ready {ready:.2f}s")
+
+    print()
+    print(f"{workers} worker(s)")
+    print(f"median time to first response: {statistics.median(first_responses):.2f}s")
+    print(f"median time to model ready:    {statistics.median(readies):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+"""
+Offline bulk scoring of an applicant file on every core
+
+    python bulk_score.py applicants.csv scores.ndjson
+    python bulk_score.py applicants.ndjson scores.parquet --workers 32 --detail summary
+
+Input is NDJSON or CSV (see applicant_io for both formats), chosen by file
+extension. Output is NDJSON ({"line": n, "result": {...}} or
+{"line": n, "error": ...} per record, as from /evaluate/stream), CSV, or,
+when pyarrow is installed, Parquet. CSV and Parquet get one column per
+score; other nested values are stored as JSON text. Parquet output is a
+directory with one part file per chunk, which pandas.read_parquet() reads
+as one table.
+
+The parent process only cuts the input into chunks of raw lines at record
+boundaries and writes finished chunks in input order. Parsing, validation
+and scoring run on a spawned ProcessPoolExecutor whose workers each build
+one Top50AdmissionsEvaluator (with its ML predictor) in their initializer.
+At most CHUNKS_PER_WORKER chunks per worker are in flight, so memory does
+not grow with the input, and every worker runs single-threaded so N
+workers keep N cores busy without oversubscribing them.
+
+After every chunk written, OUTPUT.checkpoint records how far the run got.
+Re-running the same command after an interruption resumes from there
+(--restart starts over); the checkpoint is removed once the run completes.
+
+Usage:
+    python bulk_score.py INPUT OUTPUT [--workers N] [--chunk-size ROWS]
+                         [--detail full|summary] [--fields a,b,...] [--restart]
+"""
+
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import applicant_io
+from evaluator import NARRATIVE_FIELDS, Top50AdmissionsEvaluator
+from applicant_models import ApplicantData, RESULT_FIELDS, SUMMARY_FIELDS, fast_applicant_adapter
+
+DEFAULT_CHUNK_SIZE = 1000
+CHUNKS_PER_WORKER = 2
+PROGRESS_INTERVAL = 10.0
+
+OUTPUT_FORMATS = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv", ".parquet": "parquet"}
+
+# Result dicts with a fixed set of keys get one CSV/Parquet column per key
+EXPANDED_FIELDS = {
+    "score_breakdown": ["academic", "extracurricular", "application", "demographic", "total"],
+    "application_round_impact": ["round", "multiplier", "base_probability", "final_probability"],
+}
+NUMERIC_COLUMNS = {
+    "admission_probability",
+    "score_breakdown.academic", "score_breakdown.extracurricular", "score_breakdown.application",
+    "score_breakdown.demographic", "score_breakdown.total",
+    "application_round_impact.multiplier", "application_round_impact.base_probability",
+    "application_round_impact.final_probability",
+}
+
+
+def output_format(path: str) -> str:
+    return OUTPUT_FORMATS.get(Path(path).suffix.lower(), "ndjson")
+
+
+def flat_columns(fields: List[str]) -> List[str]:
+    columns = ["line", "error"]
+    for name in fields:
+        if name in EXPANDED_FIELDS:
+            columns.extend(f"{name}.{key}" for key in EXPANDED_FIELDS[name])
+        else:
+            columns.append(name)
+    return columns
+
+
+def flat_row(row: Dict, fields: List[str]) -> List:
+    """One output row as a list of scalars in flat_columns() order"""
+    error = row.get("error")
+    values = [row["line"], error if error is None or isinstance(error, str) else json.dumps(error)]
+    result = row.get("result")
+    for name in fields:
+        keys = EXPANDED_FIELDS.get(name)
+        if result is None:
+            values.extend([None] * (len(keys) if keys else 1))
+        elif keys:
+            values.extend(result[name].get(key) for key in keys)
+        elif isinstance(result[name], (list, dict)):
+            values.append(json.dumps(result[name]))
+        else:
+            values.append(result[name])
+    return values
+
+
+def part_path(directory: Path, index: int) -> Path:
+    return directory / f"part-{index:06d}.parquet"
+
+
+# -- worker process -----------------------------------------------------------
+
+_worker: Dict = {}
+
+
+def _init_worker(input_format: str, header: Optional[str], out_format: str, fields: List[str],
+                 narrative: bool, output: str):
+    """Build this worker's evaluator and predictor once"""
+    _worker.update(
+        evaluator=Top50AdmissionsEvaluator(),
+        input_format=input_format, header=header, out_format=out_format,
+        fields=fields, narrative=narrative, output=Path(output)
+    )
+
+
+def _score_chunk(index: int, first_line: int, lines: List[str]) -> Tuple[bytes, int, int, float]:
+    """Score one chunk: (encoded output, scored, errors, seconds); Parquet parts are written here"""
+    started = time.perf_counter()
+    fields = _worker["fields"]
+    records = list(applicant_io.read_records(
+        lines, _worker["input_format"], ApplicantData, _worker["header"], first_line
+    ))
+    rows, scored, errors = applicant_io.score_records(
+        _worker["evaluator"], fast_applicant_adapter.validate_python, records, fields, _worker["narrative"]
+    )
+
+    out_format = _worker["out_format"]
+    if out_format == "ndjson":
+        data = b"".join(applicant_io.ndjson_line(row) for row in rows)
+    elif out_format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(flat_row(row, fields) for row in rows)
+        data = buffer.getvalue().encode("utf-8")
+    else:
+        _write_parquet_part(part_path(_worker["output"], index), rows, fields)
+        data = b""
+    return data, scored, errors, time.perf_counter() - started
+
+
+def _write_parquet_part(path: Path, rows: List[Dict], fields: List[str]):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = flat_columns(fields)
+    schema = pa.schema([
+        (name, pa.int64() if name == "line" else pa.float64() if name in NUMERIC_COLUMNS else pa.string())
+        for name in columns
+    ])
+    values = list(zip(*(flat_row(row, fields) for row in rows))) or [()] * len(columns)
+    table = pa.table(
+        {name: [None if v is None else str(v) if schema.field(name).type == pa.string() else v for v in column]
+         for name, column in zip(columns, values)},
+        schema=schema
+    )
+    temporary = path.with_suffix(".tmp")
+    pq.write_table(table, temporary)
+    os.replace(temporary, path)
+
+
+# -- parent process -----------------------------------------------------------
+
+def _decoded_lines(f) -> Iterator[str]:
+    for raw in f:
+        yield raw.decode("utf-8", errors="replace")
+
+
+def _settings(args, fields: List[str]) -> Dict:
+    """What a checkpoint must match to be resumed"""
+    stat = os.stat(args.input)
+    return {
+        "input": str(Path(args.input).resolve()),
+        "input_bytes": stat.st_size,
+        "input_mtime_ns": stat.st_mtime_ns,
+        "chunk_size": args.chunk_size,
+        "fields": fields,
+    }
+
+
+def _load_checkpoint(path: Path, settings: Dict) -> Optional[Dict]:
+    if not path.exists():
+        return None
+    with open(path) as f:
+        checkpoint = json.load(f)
+    if checkpoint["settings"] != settings:
+        raise SystemExit(
+            f"{path} belongs to a different input, chunk size or field selection; "
+            f"re-run with --restart to start over"
+        )
+    return checkpoint
+
+
+def _save_checkpoint(path: Path, checkpoint: Dict):
+    temporary = path.with_suffix(".tmp")
+    with open(temporary, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(temporary, path)
+
+
+def _open_output(output: Path, out_format: str, fields: List[str], checkpoint: Optional[Dict]):
+    """The output file (None for Parquet), truncated to the checkpoint when resuming"""
+    if out_format == "parquet":
+        output.mkdir(parents=True, exist_ok=True)
+        done = checkpoint["chunks"] if checkpoint else 0
+        for part in output.glob("part-*.parquet"):
+            if int(part.stem.split("-")[1]) >= done:
+                part.unlink()
+        return None
+
+    if checkpoint:
+        f = open(output, "r+b")
+        f.truncate(checkpoint["output_bytes"])
+        f.seek(0, os.SEEK_END)
+        return f
+    f = open(output, "wb")
+    if out_format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(flat_columns(fields))
+        f.write(buffer.getvalue().encode("utf-8"))
+    return f
+
+
+def bulk_score(args, fields: List[str], narrative: bool):
+    input_format = applicant_io.format_for(None, args.input)
+    out_format = output_format(args.output)
+    output = Path(args.output)
+    checkpoint_path = Path(args.output + ".checkpoint")
+    settings = _settings(args, fields)
+    checkpoint = None if args.restart else _load_checkpoint(checkpoint_path, settings)
+    if checkpoint is None:
+        checkpoint = {"settings": settings, "chunks": 0, "rows": 0, "errors": 0,
+                      "input_offset": 0, "next_line": 1, "output_bytes": 0}
+        resuming = False
+    else:
+        resuming = True
+        print(f"Resuming after {checkpoint['chunks']} chunks ({checkpoint['rows']} rows) "
+              f"from line {checkpoint['next_line']}")
+
+    workers = args.workers
+    total_bytes = settings["input_bytes"]
+    out = _open_output(output, out_format, fields, checkpoint if resuming else None)
+
+    with open(args.input, "rb") as f:
+        header = None
+        if input_format == "csv":
+            header = f.readline().decode("utf-8-sig").rstrip("\r\n")
+            if not resuming:
+                checkpoint.update(input_offset=f.tell(), next_line=2)
+        f.seek(checkpoint["input_offset"])
+        chunks = applicant_io.record_chunks(
+            _decoded_lines(f), input_format, args.chunk_size, checkpoint["next_line"]
+        )
+
+        # Spawned workers inherit the environment: one OpenMP/BLAS thread each
+        for variable in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+            os.environ.setdefault(variable, "1")
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(input_format, header, out_format, fields, narrative, str(output))
+        )
+
+        started = time.perf_counter()
+        last_report = started
+        rows_at_start = checkpoint["rows"]
+        start_fraction = checkpoint["input_offset"] / total_bytes if total_bytes else 0.0
+        busy = 0.0
+        pending = deque()
+
+        def write_oldest():
+            nonlocal busy, last_report
+            future, input_offset, next_line = pending.popleft()
+            data, scored, errors, seconds = future.result()
+            busy += seconds
+            if out is not None:
+                out.write(data)
+                out.flush()
+                os.fsync(out.fileno())
+                checkpoint["output_bytes"] = out.tell()
+            checkpoint["chunks"] += 1
+            checkpoint["rows"] += scored + errors
+            checkpoint["errors"] += errors
+            checkpoint.update(input_offset=input_offset, next_line=next_line)
+            _save_checkpoint(checkpoint_path, checkpoint)
+
+            now = time.perf_counter()
+            if now - last_report >= PROGRESS_INTERVAL:
+                last_report = now
+                rate = (checkpoint["rows"] - rows_at_start) / (now - started)
+                done = input_offset / total_bytes if total_bytes else 1.0
+                eta = (now - started) * (1 - done) / max(done - start_fraction, 1e-9)
+                print(f"[{done:6.1%}] {checkpoint['rows']} rows, {rate:.0f} rows/s "
+                      f"({rate / workers:.0f}/s per worker), about {eta:.0f}s left", flush=True)
+
+        try:
+            with executor:
+                index = checkpoint["chunks"]
+                for first_line, lines in chunks:
+                    future = executor.submit(_score_chunk, index, first_line, lines)
+                    pending.append((future, f.tell(), first_line + len(lines)))
+                    index += 1
+                    if len(pending) >= workers * CHUNKS_PER_WORKER:
+                        write_oldest()
+                while pending:
+                    write_oldest()
+        finally:
+            if out is not None:
+                out.close()
+
+    elapsed = time.perf_counter() - started
+    rows = checkpoint["rows"] - rows_at_start
+    checkpoint_path.unlink()
+    print(f"Scored {rows} rows in {elapsed:.1f}s ({checkpoint['errors']} errors in total): "
+          f"{rows / elapsed:.0f} rows/s, {rows / elapsed / workers:.0f} rows/s per worker "
+          f"({workers} workers, busy {busy / (elapsed * workers):.0%} of the time)")
+    print(f"Results written to {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score an NDJSON or CSV file of applicants on all cores")
+    parser.add_argument("input", help="applicants, .ndjson/.jsonl or .csv")
+    parser.add_argument("output", help="results, .ndjson/.jsonl, .csv or .parquet (needs pyarrow)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="records per task")
+    parser.add_argument("--detail", choices=["full", "summary"], default="full",
+                        help="summary: probability and scores only, no narrative")
+    parser.add_argument("--fields", help="comma-separated result fields (overrides --detail)")
+    parser.add_argument("--restart", action="store_true", help="ignore an existing checkpoint")
+    args = parser.parse_args()
+
+    if args.fields:
+        fields = [name.strip() for name in args.fields.split(",") if name.strip()]
+        unknown = [name for name in fields if name not in RESULT_FIELDS]
+        if unknown:
+            parser.error(f"unknown fields {', '.join(unknown)} (choose from {', '.join(RESULT_FIELDS)})")
+    else:
+        fields = SUMMARY_FIELDS if args.detail == "summary" else RESULT_FIELDS
+    narrative = any(name in NARRATIVE_FIELDS for name in fields)
+
+    if output_format(args.output) == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            sys.exit("Parquet output needs pyarrow (pip install pyarrow); use .ndjson or .csv instead")
+
+    bulk_score(args, list(fields), narrative)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Pre-encoded responses for the static catalog routes
+
+/schools, /ap-subjects, /countries and /us-states return the same lists on
+every call. Each list is serialized once (at startup, and for /schools again
+after a data reload) into bytes with a strong ETag, so a request costs a
+header comparison and a 304 when the client already has the current copy.
+"""
+
+import hashlib
+import json
+from typing import Optional
+
+from fastapi import Response
+
+CATALOG_CACHE_CONTROL = "public, max-age=300"
+
+
+class PrecomputedJSON:
+    """A JSON body encoded once, plus its strong ETag"""
+
+    def __init__(self, content, cache_control: str = CATALOG_CACHE_CONTROL):
+        # Same encoding as FastAPI's JSONResponse, so the bytes are unchanged
+        self.body = json.dumps(
+            content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:32] + '"'
+        self.headers = {"ETag": self.etag, "Cache-Control": cache_control}
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """If-None-Match uses weak comparison: W/"x" matches "x" """
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*" or tag.removeprefix("W/") == self.etag:
+                return True
+        return False
+
+    def response(self, if_none_match: Optional[str] = None) -> Response:
+        if self.matches(if_none_match):
+            return Response(status_code=304, headers=self.headers)
+        return Response(content=self.body, media_type="application/json", headers=self.headers)
@@ -0,0 +1,94 @@
+"""
+Bounded thread pool for CPU-bound evaluation
+
+Routes are async, so running evaluator.evaluate() (rule scoring plus model
+inference) directly on the event loop stalls every other connection,
+including cheap routes like /schools. EvaluationPool runs that work on a
+fixed number of worker threads and caps how many evaluation requests may be
+admitted at once; beyond the cap the route answers 503 with Retry-After
+instead of queueing without bound.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+class PoolBusy(Exception):
+    """Every worker is busy and the wait queue is full"""
+
+
+class EvaluationPool:
+    """
+    admit() and run() must be used from the event loop thread; the counters
+    are only touched there, so they need no lock.
+
+    workers=0 evaluates inline on the event loop (the old behaviour, kept for
+    benchmarking). Admission limits still apply.
+    """
+
+    def __init__(self, workers: int = 4, queue_depth: int = 64):
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self.executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="evaluate") if workers > 0 else None
+        )
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def capacity(self) -> int:
+        """Requests that may be admitted at once: one per worker plus the queue"""
+        return max(self.workers, 1) + self.queue_depth
+
+    @contextmanager
+    def admit(self):
+        """Hold a slot for the whole request; raises PoolBusy when none is free"""
+        if self.in_flight >= self.capacity:
+            self.rejected += 1
+            raise PoolBusy()
+
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def run(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) on a worker thread and await the result"""
+        if self.executor is None:
+            return fn(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(fn, *args, **kwargs))
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def stats(self) -> Dict:
+        return {
+            'workers': self.workers,
+            'queue_depth': self.queue_depth,
+            'in_flight': self.in_flight,
+            'peak_in_flight': self.peak_in_flight,
+            'completed': self.completed,
+            'rejected': self.rejected
+        }
+
+
+def pool_from_env() -> EvaluationPool:
+    """EVALUATION_WORKERS (default: CPU count, max 4; 0 = inline) and EVALUATION_QUEUE_DEPTH (default 64)"""
+    default_workers = min(4, os.cpu_count() or 1)
+    return EvaluationPool(
+        workers=int(os.environ.get('EVALUATION_WORKERS', default_workers)),
+        queue_depth=int(os.environ.get('EVALUATION_QUEUE_DEPTH', 64))
+    )
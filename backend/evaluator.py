@@ -10,20 +10,52 @@ import sys
 import os
 from pathlib import Path
 
+import numpy as np
+
+import batch_scoring
+import sweep
+from school_data import load_school_table
+from school_table import SchoolRecord, SchoolTable
+from batch_scoring import (
+    ApplicantColumns, PROFILE_KEYWORDS,
+    CURRICULUM_DIFFICULTY_POINTS, RURAL_STATES
+)
+
 # Add ml directory to path for imports
 ml_dir = Path(__file__).parent.parent / 'ml'
 sys.path.insert(0, str(ml_dir))
 
-try:
-    from ml_integration import HybridAdmissionsPredictor
-    ML_AVAILABLE = True
-except ImportError:
-    ML_AVAILABLE = False
-    print("Warning: ML integration not available, using rule-based system only")
+MODEL_PATH = ml_dir / 'admissions_model.pkl'
+
+# Default for evaluate(ml_probability=...): run the ML model inline. Callers
+# that batch ML predictions themselves (ml_batcher.py) pass the probability.
+PREDICT_ML = object()
+
+# Result keys built by _narrative(); evaluate(..., narrative=False) leaves them out
+NARRATIVE_FIELDS = ("reasoning", "detailed_analysis", "strengths", "weaknesses", "advice", "fit_analysis")
+
+
+def load_predictor(model_path: str):
+    """
+    Import ml_integration and load the model. This is the slow part of
+    startup (joblib, sklearn and xgboost imports), so it only runs when a
+    predictor is actually wanted.
+    """
+    try:
+        from ml_integration import HybridAdmissionsPredictor
+    except ImportError:
+        print("Warning: ML integration not available, using rule-based system only")
+        return None
+    return HybridAdmissionsPredictor(str(model_path))
+
 
 class Top50AdmissionsEvaluator:
-    def __init__(self):
-        self.schools_data = self._load_schools_data()
+    def __init__(self, school_table: SchoolTable = None, model_path: str = None, load_model: bool = True):
+        """
+        load_model=False builds a rule-based-only evaluator whose ml_status is
+        'loading'; the server swaps in a full one once the model has warmed up.
+        """
+        self.school_table = school_table if school_table is not None else load_school_table()
         self.application_round_multipliers = {
             "Early Decision (ED)": 3.0,
             "Early Decision I (ED1)": 3.0,
@@ -36,1367 +68,78 @@ class Top50AdmissionsEvaluator:
         }
 
         # Initialize ML hybrid predictor
-        if ML_AVAILABLE:
-            model_path = Path(__file__).parent.parent / 'ml' / 'admissions_model.pkl'
-            self.hybrid_predictor = HybridAdmissionsPredictor(str(model_path))
+        if load_model:
+            self.hybrid_predictor = load_predictor(model_path or MODEL_PATH)
+            self.ml_status = 'ready' if self.hybrid_predictor and self.hybrid_predictor.ml_available else 'unavailable'
         else:
             self.hybrid_predictor = None
+            self.ml_status = 'loading'
 
-    def _load_schools_data(self) -> Dict:
-        """Load all Top 50 US universities with complete data"""
+    @property
+    def version(self) -> Dict[str, str]:
+        """Versions of the school data and ML model this evaluator was built from"""
         return {
-            # Top 10
-            "Princeton University": {
-                "rank": 1,
-                "acceptance_rate": 0.039,
-                "avg_gpa_unweighted": 3.95,
-                "avg_gpa_weighted": 4.18,
-                "sat_range": (1470, 1570),
-                "sat_25th": 1470, "sat_75th": 1570,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["SCEA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": True
-            },
-            "MIT": {
-                "rank": 2,
-                "acceptance_rate": 0.04,
-                "avg_gpa_unweighted": 3.96,
-                "avg_gpa_weighted": 4.17,
-                "sat_range": (1520, 1580),
-                "sat_25th": 1520, "sat_75th": 1580,
-                "act_range": (34, 36),
-                "selectivity": "most_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": True
-            },
-            "Harvard University": {
-                "rank": 3,
-                "acceptance_rate": 0.033,
-                "avg_gpa_unweighted": 3.95,
-                "avg_gpa_weighted": 4.18,
-                "sat_range": (1460, 1580),
-                "sat_25th": 1460, "sat_75th": 1580,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["SCEA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": True
-            },
-            "Stanford University": {
-                "rank": 3,
-                "acceptance_rate": 0.035,
-                "avg_gpa_unweighted": 3.96,
-                "avg_gpa_weighted": 4.19,
-                "sat_range": (1470, 1570),
-                "sat_25th": 1470, "sat_75th": 1570,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["REA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": True
-            },
-            "Yale University": {
-                "rank": 5,
-                "acceptance_rate": 0.046,
-                "avg_gpa_unweighted": 3.95,
-                "avg_gpa_weighted": 4.19,
-                "sat_range": (1460, 1570),
-                "sat_25th": 1460, "sat_75th": 1570,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["SCEA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": True
-            },
-            "University of Pennsylvania": {
-                "rank": 6,
-                "acceptance_rate": 0.056,
-                "avg_gpa_unweighted": 3.90,
-                "avg_gpa_weighted": 4.16,
-                "sat_range": (1450, 1560),
-                "sat_25th": 1450, "sat_75th": 1560,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Caltech": {
-                "rank": 7,
-                "acceptance_rate": 0.029,
-                "avg_gpa_unweighted": 3.97,
-                "avg_gpa_weighted": 4.19,
-                "sat_range": (1530, 1580),
-                "sat_25th": 1530, "sat_75th": 1580,
-                "act_range": (35, 36),
-                "selectivity": "most_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": True
-            },
-            "Duke University": {
-                "rank": 7,
-                "acceptance_rate": 0.058,
-                "avg_gpa_unweighted": 3.94,
-                "avg_gpa_weighted": 4.17,
-                "sat_range": (1480, 1570),
-                "sat_25th": 1480, "sat_75th": 1570,
-                "act_range": (34, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Johns Hopkins University": {
-                "rank": 9,
-                "acceptance_rate": 0.073,
-                "avg_gpa_unweighted": 3.92,
-                "avg_gpa_weighted": 4.15,
-                "sat_range": (1480, 1570),
-                "sat_25th": 1480, "sat_75th": 1570,
-                "act_range": (34, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Northwestern University": {
-                "rank": 9,
-                "acceptance_rate": 0.070,
-                "avg_gpa_unweighted": 3.92,
-                "avg_gpa_weighted": 4.15,
-                "sat_range": (1450, 1550),
-                "sat_25th": 1450, "sat_75th": 1550,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            # 11-20
-            "Brown University": {
-                "rank": 11,
-                "acceptance_rate": 0.052,
-                "avg_gpa_unweighted": 3.94,
-                "avg_gpa_weighted": 4.16,
-                "sat_range": (1450, 1560),
-                "sat_25th": 1450, "sat_75th": 1560,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Cornell University": {
-                "rank": 11,
-                "acceptance_rate": 0.087,
-                "avg_gpa_unweighted": 3.90,
-                "avg_gpa_weighted": 4.14,
-                "sat_range": (1400, 1540),
-                "sat_25th": 1400, "sat_75th": 1540,
-                "act_range": (32, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Dartmouth College": {
-                "rank": 11,
-                "acceptance_rate": 0.062,
-                "avg_gpa_unweighted": 3.93,
-                "avg_gpa_weighted": 4.15,
-                "sat_range": (1440, 1560),
-                "sat_25th": 1440, "sat_75th": 1560,
-                "act_range": (32, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Columbia University": {
-                "rank": 14,
-                "acceptance_rate": 0.039,
-                "avg_gpa_unweighted": 3.95,
-                "avg_gpa_weighted": 4.17,
-                "sat_range": (1470, 1570),
-                "sat_25th": 1470, "sat_75th": 1570,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Vanderbilt University": {
-                "rank": 14,
-                "acceptance_rate": 0.066,
-                "avg_gpa_unweighted": 3.91,
-                "avg_gpa_weighted": 4.15,
-                "sat_range": (1460, 1570),
-                "sat_25th": 1460, "sat_75th": 1570,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Washington University in St. Louis": {
-                "rank": 14,
-                "acceptance_rate": 0.116,
-                "avg_gpa_unweighted": 3.92,
-                "avg_gpa_weighted": 4.15,
-                "sat_range": (1470, 1570),
-                "sat_25th": 1470, "sat_75th": 1570,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Rice University": {
-                "rank": 17,
-                "acceptance_rate": 0.087,
-                "avg_gpa_unweighted": 3.92,
-                "avg_gpa_weighted": 4.15,
-                "sat_range": (1470, 1570),
-                "sat_25th": 1470, "sat_75th": 1570,
-                "act_range": (34, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Notre Dame": {
-                "rank": 18,
-                "acceptance_rate": 0.128,
-                "avg_gpa_unweighted": 3.90,
-                "avg_gpa_weighted": 4.13,
-                "sat_range": (1400, 1550),
-                "sat_25th": 1400, "sat_75th": 1550,
-                "act_range": (32, 35),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["REA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "UCLA": {
-                "rank": 18,
-                "acceptance_rate": 0.090,
-                "avg_gpa_unweighted": 3.90,
-                "avg_gpa_weighted": 4.31,
-                "sat_range": (1290, 1510),
-                "sat_25th": 1290, "sat_75th": 1510,
-                "act_range": (27, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "UC Berkeley": {
-                "rank": 20,
-                "acceptance_rate": 0.113,
-                "avg_gpa_unweighted": 3.89,
-                "avg_gpa_weighted": 4.29,
-                "sat_range": (1330, 1530),
-                "sat_25th": 1330, "sat_75th": 1530,
-                "act_range": (28, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            # 21-30
-            "Emory University": {
-                "rank": 21,
-                "acceptance_rate": 0.113,
-                "avg_gpa_unweighted": 3.88,
-                "avg_gpa_weighted": 4.12,
-                "sat_range": (1370, 1520),
-                "sat_25th": 1370, "sat_75th": 1520,
-                "act_range": (31, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Georgetown University": {
-                "rank": 21,
-                "acceptance_rate": 0.120,
-                "avg_gpa_unweighted": 3.89,
-                "avg_gpa_weighted": 4.13,
-                "sat_range": (1380, 1530),
-                "sat_25th": 1380, "sat_75th": 1530,
-                "act_range": (31, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["REA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Michigan": {
-                "rank": 23,
-                "acceptance_rate": 0.180,
-                "avg_gpa_unweighted": 3.88,
-                "avg_gpa_weighted": 4.11,
-                "sat_range": (1340, 1530),
-                "sat_25th": 1340, "sat_75th": 1530,
-                "act_range": (31, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Carnegie Mellon University": {
-                "rank": 24,
-                "acceptance_rate": 0.114,
-                "avg_gpa_unweighted": 3.91,
-                "avg_gpa_weighted": 4.14,
-                "sat_range": (1460, 1560),
-                "sat_25th": 1460, "sat_75th": 1560,
-                "act_range": (33, 35),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Southern California": {
-                "rank": 24,
-                "acceptance_rate": 0.095,
-                "avg_gpa_unweighted": 3.86,
-                "avg_gpa_weighted": 4.10,
-                "sat_range": (1380, 1530),
-                "sat_25th": 1380, "sat_75th": 1530,
-                "act_range": (31, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Virginia": {
-                "rank": 24,
-                "acceptance_rate": 0.191,
-                "avg_gpa_unweighted": 3.87,
-                "avg_gpa_weighted": 4.11,
-                "sat_range": (1370, 1520),
-                "sat_25th": 1370, "sat_75th": 1520,
-                "act_range": (31, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Wake Forest University": {
-                "rank": 27,
-                "acceptance_rate": 0.217,
-                "avg_gpa_unweighted": 3.84,
-                "avg_gpa_weighted": 4.08,
-                "sat_range": (1330, 1480),
-                "sat_25th": 1330, "sat_75th": 1480,
-                "act_range": (30, 33),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "New York University": {
-                "rank": 28,
-                "acceptance_rate": 0.120,
-                "avg_gpa_unweighted": 3.69,
-                "avg_gpa_weighted": 3.95,
-                "sat_range": (1350, 1530),
-                "sat_25th": 1350, "sat_75th": 1530,
-                "act_range": (31, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Tufts University": {
-                "rank": 28,
-                "acceptance_rate": 0.095,
-                "avg_gpa_unweighted": 3.91,
-                "avg_gpa_weighted": 4.13,
-                "sat_range": (1420, 1540),
-                "sat_25th": 1420, "sat_75th": 1540,
-                "act_range": (32, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of North Carolina at Chapel Hill": {
-                "rank": 28,
-                "acceptance_rate": 0.167,
-                "avg_gpa_unweighted": 3.87,
-                "avg_gpa_weighted": 4.39,
-                "sat_range": (1300, 1480),
-                "sat_25th": 1300, "sat_75th": 1480,
-                "act_range": (29, 33),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            # 31-40
-            "UC Santa Barbara": {
-                "rank": 31,
-                "acceptance_rate": 0.257,
-                "avg_gpa_unweighted": 3.85,
-                "avg_gpa_weighted": 4.22,
-                "sat_range": (1230, 1480),
-                "sat_25th": 1230, "sat_75th": 1480,
-                "act_range": (27, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Florida": {
-                "rank": 32,
-                "acceptance_rate": 0.230,
-                "avg_gpa_unweighted": 3.85,
-                "avg_gpa_weighted": 4.42,
-                "sat_range": (1280, 1450),
-                "sat_25th": 1280, "sat_75th": 1450,
-                "act_range": (28, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "UC Irvine": {
-                "rank": 32,
-                "acceptance_rate": 0.211,
-                "avg_gpa_unweighted": 3.83,
-                "avg_gpa_weighted": 4.18,
-                "sat_range": (1230, 1450),
-                "sat_25th": 1230, "sat_75th": 1450,
-                "act_range": (26, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Boston College": {
-                "rank": 34,
-                "acceptance_rate": 0.167,
-                "avg_gpa_unweighted": 3.86,
-                "avg_gpa_weighted": 4.09,
-                "sat_range": (1370, 1500),
-                "sat_25th": 1370, "sat_75th": 1500,
-                "act_range": (31, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "UC San Diego": {
-                "rank": 34,
-                "acceptance_rate": 0.238,
-                "avg_gpa_unweighted": 3.87,
-                "avg_gpa_weighted": 4.23,
-                "sat_range": (1250, 1490),
-                "sat_25th": 1250, "sat_75th": 1490,
-                "act_range": (27, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Rochester": {
-                "rank": 36,
-                "acceptance_rate": 0.387,
-                "avg_gpa_unweighted": 3.80,
-                "avg_gpa_weighted": 4.05,
-                "sat_range": (1330, 1510),
-                "sat_25th": 1330, "sat_75th": 1510,
-                "act_range": (30, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Boston University": {
-                "rank": 37,
-                "acceptance_rate": 0.140,
-                "avg_gpa_unweighted": 3.71,
-                "avg_gpa_weighted": 3.96,
-                "sat_range": (1310, 1500),
-                "sat_25th": 1310, "sat_75th": 1500,
-                "act_range": (30, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "UC Davis": {
-                "rank": 37,
-                "acceptance_rate": 0.372,
-                "avg_gpa_unweighted": 3.82,
-                "avg_gpa_weighted": 4.16,
-                "sat_range": (1160, 1430),
-                "sat_25th": 1160, "sat_75th": 1430,
-                "act_range": (25, 32),
-                "selectivity": "very_competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Brandeis University": {
-                "rank": 39,
-                "acceptance_rate": 0.310,
-                "avg_gpa_unweighted": 3.79,
-                "avg_gpa_weighted": 4.03,
-                "sat_range": (1330, 1500),
-                "sat_25th": 1330, "sat_75th": 1500,
-                "act_range": (30, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Case Western Reserve University": {
-                "rank": 39,
-                "acceptance_rate": 0.267,
-                "avg_gpa_unweighted": 3.78,
-                "avg_gpa_weighted": 4.02,
-                "sat_range": (1330, 1500),
-                "sat_25th": 1330, "sat_75th": 1500,
-                "act_range": (31, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "College of William & Mary": {
-                "rank": 39,
-                "acceptance_rate": 0.333,
-                "avg_gpa_unweighted": 3.84,
-                "avg_gpa_weighted": 4.28,
-                "sat_range": (1330, 1490),
-                "sat_25th": 1330, "sat_75th": 1490,
-                "act_range": (30, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            # 41-50
-            "Georgia Institute of Technology": {
-                "rank": 42,
-                "acceptance_rate": 0.161,
-                "avg_gpa_unweighted": 3.87,
-                "avg_gpa_weighted": 4.18,
-                "sat_range": (1370, 1530),
-                "sat_25th": 1370, "sat_75th": 1530,
-                "act_range": (31, 35),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Tulane University": {
-                "rank": 42,
-                "acceptance_rate": 0.089,
-                "avg_gpa_unweighted": 3.76,
-                "avg_gpa_weighted": 4.00,
-                "sat_range": (1340, 1490),
-                "sat_25th": 1340, "sat_75th": 1490,
-                "act_range": (30, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Wisconsin-Madison": {
-                "rank": 42,
-                "acceptance_rate": 0.494,
-                "avg_gpa_unweighted": 3.82,
-                "avg_gpa_weighted": 4.05,
-                "sat_range": (1300, 1480),
-                "sat_25th": 1300, "sat_75th": 1480,
-                "act_range": (28, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Illinois Urbana-Champaign": {
-                "rank": 45,
-                "acceptance_rate": 0.447,
-                "avg_gpa_unweighted": 3.80,
-                "avg_gpa_weighted": 4.04,
-                "sat_range": (1280, 1490),
-                "sat_25th": 1280, "sat_75th": 1490,
-                "act_range": (28, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Lehigh University": {
-                "rank": 45,
-                "acceptance_rate": 0.323,
-                "avg_gpa_unweighted": 3.75,
-                "avg_gpa_weighted": 3.99,
-                "sat_range": (1320, 1480),
-                "sat_25th": 1320, "sat_75th": 1480,
-                "act_range": (30, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Northeastern University": {
-                "rank": 45,
-                "acceptance_rate": 0.066,
-                "avg_gpa_unweighted": 3.82,
-                "avg_gpa_weighted": 4.06,
-                "sat_range": (1390, 1530),
-                "sat_25th": 1390, "sat_75th": 1530,
-                "act_range": (32, 35),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["ED1", "ED2", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Pepperdine University": {
-                "rank": 45,
-                "acceptance_rate": 0.317,
-                "avg_gpa_unweighted": 3.73,
-                "avg_gpa_weighted": 3.97,
-                "sat_range": (1230, 1420),
-                "sat_25th": 1230, "sat_75th": 1420,
-                "act_range": (27, 32),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Ohio State University": {
-                "rank": 49,
-                "acceptance_rate": 0.527,
-                "avg_gpa_unweighted": 3.76,
-                "avg_gpa_weighted": 4.00,
-                "sat_range": (1240, 1450),
-                "sat_25th": 1240, "sat_75th": 1450,
-                "act_range": (27, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Purdue University": {
-                "rank": 49,
-                "acceptance_rate": 0.528,
-                "avg_gpa_unweighted": 3.74,
-                "avg_gpa_weighted": 3.98,
-                "sat_range": (1190, 1440),
-                "sat_25th": 1190, "sat_75th": 1440,
-                "act_range": (26, 33),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Georgia": {
-                "rank": 49,
-                "acceptance_rate": 0.426,
-                "avg_gpa_unweighted": 3.79,
-                "avg_gpa_weighted": 4.02,
-                "sat_range": (1240, 1420),
-                "sat_25th": 1240, "sat_75th": 1420,
-                "act_range": (27, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Texas at Austin": {
-                "rank": 49,
-                "acceptance_rate": 0.298,
-                "avg_gpa_unweighted": 3.77,
-                "avg_gpa_weighted": 4.01,
-                "sat_range": (1230, 1480),
-                "sat_25th": 1230, "sat_75th": 1480,
-                "act_range": (27, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Villanova University": {
-                "rank": 49,
-                "acceptance_rate": 0.230,
-                "avg_gpa_unweighted": 3.78,
-                "avg_gpa_weighted": 4.01,
-                "sat_range": (1330, 1480),
-                "sat_25th": 1330, "sat_75th": 1480,
-                "act_range": (30, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            # 54-100 (Additional 47 schools)
-            "University of Washington": {
-                "rank": 54,
-                "acceptance_rate": 0.478,
-                "avg_gpa_unweighted": 3.75,
-                "avg_gpa_weighted": 3.99,
-                "sat_range": (1220, 1470),
-                "sat_25th": 1220, "sat_75th": 1470,
-                "act_range": (27, 33),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Connecticut": {
-                "rank": 54,
-                "acceptance_rate": 0.556,
-                "avg_gpa_unweighted": 3.72,
-                "avg_gpa_weighted": 3.96,
-                "sat_range": (1230, 1430),
-                "sat_25th": 1230, "sat_75th": 1430,
-                "act_range": (27, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Rensselaer Polytechnic Institute": {
-                "rank": 54,
-                "acceptance_rate": 0.534,
-                "avg_gpa_unweighted": 3.74,
-                "avg_gpa_weighted": 3.98,
-                "sat_range": (1330, 1510),
-                "sat_25th": 1330, "sat_75th": 1510,
-                "act_range": (30, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Santa Clara University": {
-                "rank": 54,
-                "acceptance_rate": 0.524,
-                "avg_gpa_unweighted": 3.70,
-                "avg_gpa_weighted": 3.94,
-                "sat_range": (1280, 1470),
-                "sat_25th": 1280, "sat_75th": 1470,
-                "act_range": (28, 33),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Syracuse University": {
-                "rank": 58,
-                "acceptance_rate": 0.517,
-                "avg_gpa_unweighted": 3.68,
-                "avg_gpa_weighted": 3.92,
-                "sat_range": (1180, 1380),
-                "sat_25th": 1180, "sat_75th": 1380,
-                "act_range": (26, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Maryland": {
-                "rank": 58,
-                "acceptance_rate": 0.447,
-                "avg_gpa_unweighted": 3.77,
-                "avg_gpa_weighted": 4.01,
-                "sat_range": (1300, 1490),
-                "sat_25th": 1300, "sat_75th": 1490,
-                "act_range": (29, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Pittsburgh": {
-                "rank": 58,
-                "acceptance_rate": 0.493,
-                "avg_gpa_unweighted": 3.73,
-                "avg_gpa_weighted": 3.97,
-                "sat_range": (1250, 1450),
-                "sat_25th": 1250, "sat_75th": 1450,
-                "act_range": (28, 33),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Rutgers University": {
-                "rank": 61,
-                "acceptance_rate": 0.664,
-                "avg_gpa_unweighted": 3.68,
-                "avg_gpa_weighted": 3.92,
-                "sat_range": (1190, 1420),
-                "sat_25th": 1190, "sat_75th": 1420,
-                "act_range": (26, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Penn State University": {
-                "rank": 61,
-                "acceptance_rate": 0.549,
-                "avg_gpa_unweighted": 3.67,
-                "avg_gpa_weighted": 3.91,
-                "sat_range": (1160, 1370),
-                "sat_25th": 1160, "sat_75th": 1370,
-                "act_range": (26, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Minnesota": {
-                "rank": 63,
-                "acceptance_rate": 0.757,
-                "avg_gpa_unweighted": 3.70,
-                "avg_gpa_weighted": 3.94,
-                "sat_range": (1270, 1480),
-                "sat_25th": 1270, "sat_75th": 1480,
-                "act_range": (27, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Texas A&M University": {
-                "rank": 63,
-                "acceptance_rate": 0.632,
-                "avg_gpa_unweighted": 3.68,
-                "avg_gpa_weighted": 3.92,
-                "sat_range": (1160, 1390),
-                "sat_25th": 1160, "sat_75th": 1390,
-                "act_range": (25, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Virginia Tech": {
-                "rank": 63,
-                "acceptance_rate": 0.657,
-                "avg_gpa_unweighted": 3.72,
-                "avg_gpa_weighted": 3.96,
-                "sat_range": (1180, 1390),
-                "sat_25th": 1180, "sat_75th": 1390,
-                "act_range": (26, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Worcester Polytechnic Institute": {
-                "rank": 66,
-                "acceptance_rate": 0.574,
-                "avg_gpa_unweighted": 3.71,
-                "avg_gpa_weighted": 3.95,
-                "sat_range": (1320, 1490),
-                "sat_25th": 1320, "sat_75th": 1490,
-                "act_range": (30, 34),
-                "selectivity": "competitive",
-                "available_rounds": ["ED1", "ED2", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Clemson University": {
-                "rank": 67,
-                "acceptance_rate": 0.434,
-                "avg_gpa_unweighted": 3.74,
-                "avg_gpa_weighted": 3.98,
-                "sat_range": (1230, 1410),
-                "sat_25th": 1230, "sat_75th": 1410,
-                "act_range": (27, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Fordham University": {
-                "rank": 67,
-                "acceptance_rate": 0.543,
-                "avg_gpa_unweighted": 3.66,
-                "avg_gpa_weighted": 3.90,
-                "sat_range": (1280, 1460),
-                "sat_25th": 1280, "sat_75th": 1460,
-                "act_range": (29, 33),
-                "selectivity": "competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Southern Methodist University": {
-                "rank": 67,
-                "acceptance_rate": 0.521,
-                "avg_gpa_unweighted": 3.69,
-                "avg_gpa_weighted": 3.93,
-                "sat_range": (1290, 1470),
-                "sat_25th": 1290, "sat_75th": 1470,
-                "act_range": (29, 33),
-                "selectivity": "competitive",
-                "available_rounds": ["ED1", "ED2", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Massachusetts Amherst": {
-                "rank": 67,
-                "acceptance_rate": 0.644,
-                "avg_gpa_unweighted": 3.70,
-                "avg_gpa_weighted": 3.94,
-                "sat_range": (1230, 1440),
-                "sat_25th": 1230, "sat_75th": 1440,
-                "act_range": (27, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Indiana University Bloomington": {
-                "rank": 71,
-                "acceptance_rate": 0.824,
-                "avg_gpa_unweighted": 3.65,
-                "avg_gpa_weighted": 3.89,
-                "sat_range": (1160, 1370),
-                "sat_25th": 1160, "sat_75th": 1370,
-                "act_range": (26, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Michigan State University": {
-                "rank": 71,
-                "acceptance_rate": 0.883,
-                "avg_gpa_unweighted": 3.64,
-                "avg_gpa_weighted": 3.88,
-                "sat_range": (1100, 1320),
-                "sat_25th": 1100, "sat_75th": 1320,
-                "act_range": (24, 30),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Stevens Institute of Technology": {
-                "rank": 71,
-                "acceptance_rate": 0.466,
-                "avg_gpa_unweighted": 3.72,
-                "avg_gpa_weighted": 3.96,
-                "sat_range": (1330, 1500),
-                "sat_25th": 1330, "sat_75th": 1500,
-                "act_range": (30, 34),
-                "selectivity": "competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Delaware": {
-                "rank": 71,
-                "acceptance_rate": 0.738,
-                "avg_gpa_unweighted": 3.66,
-                "avg_gpa_weighted": 3.90,
-                "sat_range": (1180, 1370),
-                "sat_25th": 1180, "sat_75th": 1370,
-                "act_range": (26, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Miami": {
-                "rank": 71,
-                "acceptance_rate": 0.192,
-                "avg_gpa_unweighted": 3.75,
-                "avg_gpa_weighted": 3.99,
-                "sat_range": (1280, 1450),
-                "sat_25th": 1280, "sat_75th": 1450,
-                "act_range": (29, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Baylor University": {
-                "rank": 76,
-                "acceptance_rate": 0.459,
-                "avg_gpa_unweighted": 3.68,
-                "avg_gpa_weighted": 3.92,
-                "sat_range": (1200, 1390),
-                "sat_25th": 1200, "sat_75th": 1390,
-                "act_range": (27, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Brigham Young University": {
-                "rank": 76,
-                "acceptance_rate": 0.673,
-                "avg_gpa_unweighted": 3.72,
-                "avg_gpa_weighted": 3.96,
-                "sat_range": (1190, 1410),
-                "sat_25th": 1190, "sat_75th": 1410,
-                "act_range": (26, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Gonzaga University": {
-                "rank": 76,
-                "acceptance_rate": 0.704,
-                "avg_gpa_unweighted": 3.67,
-                "avg_gpa_weighted": 3.91,
-                "sat_range": (1190, 1390),
-                "sat_25th": 1190, "sat_75th": 1390,
-                "act_range": (26, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "North Carolina State University": {
-                "rank": 76,
-                "acceptance_rate": 0.474,
-                "avg_gpa_unweighted": 3.70,
-                "avg_gpa_weighted": 3.94,
-                "sat_range": (1240, 1430),
-                "sat_25th": 1240, "sat_75th": 1430,
-                "act_range": (27, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Iowa": {
-                "rank": 76,
-                "acceptance_rate": 0.863,
-                "avg_gpa_unweighted": 3.63,
-                "avg_gpa_weighted": 3.87,
-                "sat_range": (1130, 1350),
-                "sat_25th": 1130, "sat_75th": 1350,
-                "act_range": (24, 30),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "American University": {
-                "rank": 81,
-                "acceptance_rate": 0.640,
-                "avg_gpa_unweighted": 3.65,
-                "avg_gpa_weighted": 3.89,
-                "sat_range": (1240, 1420),
-                "sat_25th": 1240, "sat_75th": 1420,
-                "act_range": (27, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Loyola Marymount University": {
-                "rank": 81,
-                "acceptance_rate": 0.504,
-                "avg_gpa_unweighted": 3.68,
-                "avg_gpa_weighted": 3.92,
-                "sat_range": (1230, 1410),
-                "sat_25th": 1230, "sat_75th": 1410,
-                "act_range": (27, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Marquette University": {
-                "rank": 81,
-                "acceptance_rate": 0.872,
-                "avg_gpa_unweighted": 3.62,
-                "avg_gpa_weighted": 3.86,
-                "sat_range": (1140, 1350),
-                "sat_25th": 1140, "sat_75th": 1350,
-                "act_range": (25, 30),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of California Santa Cruz": {
-                "rank": 81,
-                "acceptance_rate": 0.473,
-                "avg_gpa_unweighted": 3.68,
-                "avg_gpa_weighted": 3.92,
-                "sat_range": (1170, 1400),
-                "sat_25th": 1170, "sat_75th": 1400,
-                "act_range": (25, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of San Diego": {
-                "rank": 81,
-                "acceptance_rate": 0.534,
-                "avg_gpa_unweighted": 3.69,
-                "avg_gpa_weighted": 3.93,
-                "sat_range": (1220, 1400),
-                "sat_25th": 1220, "sat_75th": 1400,
-                "act_range": (27, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Tulsa": {
-                "rank": 81,
-                "acceptance_rate": 0.693,
-                "avg_gpa_unweighted": 3.64,
-                "avg_gpa_weighted": 3.88,
-                "sat_range": (1180, 1400),
-                "sat_25th": 1180, "sat_75th": 1400,
-                "act_range": (26, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Auburn University": {
-                "rank": 87,
-                "acceptance_rate": 0.710,
-                "avg_gpa_unweighted": 3.66,
-                "avg_gpa_weighted": 3.90,
-                "sat_range": (1160, 1350),
-                "sat_25th": 1160, "sat_75th": 1350,
-                "act_range": (25, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Colorado School of Mines": {
-                "rank": 87,
-                "acceptance_rate": 0.580,
-                "avg_gpa_unweighted": 3.74,
-                "avg_gpa_weighted": 3.98,
-                "sat_range": (1280, 1470),
-                "sat_25th": 1280, "sat_75th": 1470,
-                "act_range": (29, 33),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Denver": {
-                "rank": 87,
-                "acceptance_rate": 0.596,
-                "avg_gpa_unweighted": 3.67,
-                "avg_gpa_weighted": 3.91,
-                "sat_range": (1220, 1410),
-                "sat_25th": 1220, "sat_75th": 1410,
-                "act_range": (27, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Vermont": {
-                "rank": 87,
-                "acceptance_rate": 0.603,
-                "avg_gpa_unweighted": 3.66,
-                "avg_gpa_weighted": 3.90,
-                "sat_range": (1200, 1390),
-                "sat_25th": 1200, "sat_75th": 1390,
-                "act_range": (26, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Binghamton University": {
-                "rank": 91,
-                "acceptance_rate": 0.424,
-                "avg_gpa_unweighted": 3.71,
-                "avg_gpa_weighted": 3.95,
-                "sat_range": (1300, 1450),
-                "sat_25th": 1300, "sat_75th": 1450,
-                "act_range": (29, 33),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Drexel University": {
-                "rank": 91,
-                "acceptance_rate": 0.797,
-                "avg_gpa_unweighted": 3.62,
-                "avg_gpa_weighted": 3.86,
-                "sat_range": (1180, 1390),
-                "sat_25th": 1180, "sat_75th": 1390,
-                "act_range": (26, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Florida State University": {
-                "rank": 91,
-                "acceptance_rate": 0.253,
-                "avg_gpa_unweighted": 3.73,
-                "avg_gpa_weighted": 3.97,
-                "sat_range": (1210, 1360),
-                "sat_25th": 1210, "sat_75th": 1360,
-                "act_range": (27, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "St. Louis University": {
-                "rank": 91,
-                "acceptance_rate": 0.854,
-                "avg_gpa_unweighted": 3.63,
-                "avg_gpa_weighted": 3.87,
-                "sat_range": (1160, 1370),
-                "sat_25th": 1160, "sat_75th": 1370,
-                "act_range": (25, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Stony Brook University": {
-                "rank": 91,
-                "acceptance_rate": 0.492,
-                "avg_gpa_unweighted": 3.69,
-                "avg_gpa_weighted": 3.93,
-                "sat_range": (1280, 1470),
-                "sat_25th": 1280, "sat_75th": 1470,
-                "act_range": (28, 33),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Texas Christian University": {
-                "rank": 91,
-                "acceptance_rate": 0.517,
-                "avg_gpa_unweighted": 3.67,
-                "avg_gpa_weighted": 3.91,
-                "sat_range": (1160, 1350),
-                "sat_25th": 1160, "sat_75th": 1350,
-                "act_range": (26, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Alabama": {
-                "rank": 91,
-                "acceptance_rate": 0.803,
-                "avg_gpa_unweighted": 3.64,
-                "avg_gpa_weighted": 3.88,
-                "sat_range": (1060, 1280),
-                "sat_25th": 1060, "sat_75th": 1280,
-                "act_range": (23, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of California Riverside": {
-                "rank": 91,
-                "acceptance_rate": 0.693,
-                "avg_gpa_unweighted": 3.64,
-                "avg_gpa_weighted": 3.88,
-                "sat_range": (1130, 1380),
-                "sat_25th": 1130, "sat_75th": 1380,
-                "act_range": (24, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Colorado Boulder": {
-                "rank": 91,
-                "acceptance_rate": 0.814,
-                "avg_gpa_unweighted": 3.65,
-                "avg_gpa_weighted": 3.89,
-                "sat_range": (1160, 1380),
-                "sat_25th": 1160, "sat_75th": 1380,
-                "act_range": (26, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of South Carolina": {
-                "rank": 91,
-                "acceptance_rate": 0.644,
-                "avg_gpa_unweighted": 3.66,
-                "avg_gpa_weighted": 3.90,
-                "sat_range": (1180, 1360),
-                "sat_25th": 1180, "sat_75th": 1360,
-                "act_range": (26, 31),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            }
+            'school_data': self.school_table.version,
+            'model': self.hybrid_predictor.model_version if self.hybrid_predictor else None
         }
 
     def get_available_schools(self) -> List[str]:
         """Return list of all available schools"""
-        return sorted(list(self.schools_data.keys()))
+        return list(self.school_table.sorted_names)
 
-    def _get_application_round_multiplier(self, round_name: str, school_data: Dict) -> float:
+    def _get_application_round_multiplier(self, round_name: str, school: SchoolRecord) -> float:
         """Get multiplier for application round, checking if school offers it"""
-        # Extract just the round type (ED, EA, REA, etc.) from the full name
-        round_type = round_name.split("(")[1].rstrip(")") if "(" in round_name else round_name
-
-        # Check if school offers this round
-        available_rounds = school_data.get("available_rounds", ["RD"])
-
-        # Match the round type
-        for available in available_rounds:
-            if round_type in available or available in round_type:
-                return self.application_round_multipliers.get(round_name, 1.0)
+        # Check if school offers this round (ED matches ED/ED1/ED2, EA matches REA, ...)
+        if school.round_mask & self.school_table.round_match_mask(round_name):
+            return self.application_round_multipliers.get(round_name, 1.0)
 
         # If school doesn't offer this round, return RD multiplier
         return 1.0
 
-    def evaluate(self, applicant) -> Dict:
-        """Main evaluation method"""
-        school_data = self.schools_data.get(applicant.target_school)
+    def _round_multipliers(self, round_names: List[str], schools: SchoolTable) -> np.ndarray:
+        """Vectorized _get_application_round_multiplier, one round name per school row"""
+        match_masks = np.array([self.school_table.round_match_mask(name) for name in round_names], dtype=np.int64)
+        multipliers = np.array([self.application_round_multipliers.get(name, 1.0) for name in round_names])
+        return np.where(schools.round_mask & match_masks != 0, multipliers, 1.0)
 
-        if not school_data:
-            return {
-                "decision": "Unknown",
-                "admission_probability": 0.0,
-                "reasoning": [f"School '{applicant.target_school}' not found in database"],
-                "detailed_analysis": {},
-                "strengths": [],
-                "weaknesses": [],
-                "score_breakdown": {},
-                "advice": [],
-                "fit_analysis": {},
-                "application_round_impact": {}
-            }
+    def evaluate(self, applicant, ml_probability=PREDICT_ML, narrative: bool = True) -> Dict:
+        """Main evaluation method (narrative=False skips the NARRATIVE_FIELDS text)"""
+        school = self.school_table.get(applicant.target_school)
+
+        if not school:
+            return self._unknown_school_result(applicant)
 
         # Calculate component scores
-        academic_score = self._calculate_academic_score(applicant, school_data)
+        academic_score = self._calculate_academic_score(applicant, school)
         extracurricular_score = self._calculate_extracurricular_score(applicant)
         application_score = self._calculate_application_score(applicant)
         demographic_score = self._calculate_demographic_score(applicant)
 
+        return self.evaluate_components(
+            applicant, school,
+            academic_score, extracurricular_score, application_score, demographic_score,
+            ml_probability, narrative
+        )
+
+    def component_score(self, component: str, applicant, school: SchoolRecord = None) -> float:
+        """One component score by name (only 'academic' depends on the school)"""
+        if component == 'academic':
+            return self._calculate_academic_score(applicant, school)
+        if component == 'extracurricular':
+            return self._calculate_extracurricular_score(applicant)
+        if component == 'application':
+            return self._calculate_application_score(applicant)
+        if component == 'demographic':
+            return self._calculate_demographic_score(applicant)
+        raise ValueError(f"Unknown component {component!r}")
+
+    def evaluate_components(self, applicant, school: SchoolRecord,
+                            academic_score, extracurricular_score, application_score, demographic_score,
+                            ml_probability=PREDICT_ML, narrative: bool = True) -> Dict:
+        """
+        The rest of evaluate() from already computed component scores:
+        total, probability, round multiplier, ML blend and narrative
+        """
         # Weighted total score
         total_score = (
             academic_score * 0.45 +
@@ -1406,20 +149,396 @@ class Top50AdmissionsEvaluator:
         )
 
         # Calculate base admission probability
-        base_acceptance = school_data["acceptance_rate"]
+        base_acceptance = school.acceptance_rate
         base_probability = self._calculate_probability(
-            total_score, base_acceptance, school_data["selectivity"]
+            total_score, base_acceptance, school.selectivity
         )
 
         # Apply application round multiplier
         round_multiplier = self._get_application_round_multiplier(
-            applicant.application_round, school_data
+            applicant.application_round, school
         )
         rule_based_probability = min(base_probability * round_multiplier, 0.95)
 
         # Get hybrid prediction (ML + rule-based)
         if self.hybrid_predictor:
-            hybrid_result = self.hybrid_predictor.get_hybrid_prediction(applicant, rule_based_probability)
+            if ml_probability is PREDICT_ML:
+                ml_probability = self.hybrid_predictor.get_ml_prediction(applicant)
+            hybrid_result = self.hybrid_predictor.combine_predictions(ml_probability, rule_based_probability)
+        else:
+            hybrid_result = None
+
+        return self._build_result(
+            applicant, school,
+            academic_score, extracurricular_score, application_score, demographic_score,
+            total_score, base_probability, round_multiplier, rule_based_probability,
+            hybrid_result, narrative
+        )
+
+    def evaluate_batch(self, applicants: List, narrative: bool = True) -> List[Dict]:
+        """
+        Evaluate many applicants at once.
+
+        Component scores and probabilities are computed column-wise with NumPy
+        and the ML model is called once for the whole batch. Every result is
+        identical to what evaluate() returns for the same applicant.
+        """
+        results = [None] * len(applicants)
+        known = []
+        for i, applicant in enumerate(applicants):
+            school = self.school_table.get(applicant.target_school)
+            if school:
+                known.append((i, applicant, school))
+            else:
+                results[i] = self._unknown_school_result(applicant)
+
+        if not known:
+            return results
+
+        batch = [applicant for _, applicant, _ in known]
+        schools = self.school_table.take([school.row for _, _, school in known])
+        columns = ApplicantColumns.from_applicants(batch)
+
+        academic = batch_scoring.academic_scores(columns, schools)
+        extracurricular = batch_scoring.extracurricular_scores(columns)
+        application = batch_scoring.application_scores(columns)
+        demographic = batch_scoring.demographic_scores(columns)
+        total = (
+            np.minimum(academic, 100) * 0.45 +
+            np.minimum(extracurricular, 100) * 0.30 +
+            np.minimum(application, 100) * 0.20 +
+            np.minimum(demographic, 100) * 0.05
+        )
+        base = batch_scoring.probabilities(total, schools)
+
+        multipliers = self._round_multipliers([applicant.application_round for applicant in batch], schools)
+        rule_based = np.minimum(base * multipliers, 0.95)
+
+        if self.hybrid_predictor:
+            ml_probabilities = self.hybrid_predictor.get_ml_predictions(batch)
+        else:
+            ml_probabilities = None
+
+        academic = batch_scoring.to_python_scores(academic)
+        extracurricular = batch_scoring.to_python_scores(extracurricular)
+        application = batch_scoring.to_python_scores(application)
+        demographic = batch_scoring.to_python_scores(demographic)
+        total = total.tolist()
+        base = base.tolist()
+        multipliers = multipliers.tolist()
+        rule_based = rule_based.tolist()
+
+        for j, (i, applicant, school) in enumerate(known):
+            if self.hybrid_predictor:
+                ml_probability = ml_probabilities[j] if ml_probabilities is not None else None
+                hybrid_result = self.hybrid_predictor.combine_predictions(ml_probability, rule_based[j])
+            else:
+                hybrid_result = None
+            results[i] = self._build_result(
+                applicant, school,
+                academic[j], extracurricular[j], application[j], demographic[j],
+                total[j], base[j], multipliers[j], rule_based[j],
+                hybrid_result, narrative
+            )
+
+        return results
+
+    def evaluate_all_schools(self, applicant, ml_probability=PREDICT_ML) -> Dict:
+        """
+        Score one applicant against every school in a single pass.
+
+        The school-independent parts (extracurricular, application and
+        demographic scores and the ML prediction) are computed once; the
+        academic score, selectivity curve and round multiplier are broadcast
+        across all schools. applicant.target_school is ignored.
+        """
+        schools = self.school_table
+
+        extracurricular_score = self._calculate_extracurricular_score(applicant)
+        application_score = self._calculate_application_score(applicant)
+        demographic_score = self._calculate_demographic_score(applicant)
+
+        columns = ApplicantColumns.from_applicants([applicant]).repeat(schools.size)
+        academic = batch_scoring.academic_scores(columns, schools)
+        total = (
+            np.minimum(academic, 100) * 0.45 +
+            extracurricular_score * 0.30 +
+            application_score * 0.20 +
+            demographic_score * 0.05
+        )
+        base = batch_scoring.probabilities(total, schools)
+
+        multipliers = self._round_multipliers([applicant.application_round] * schools.size, schools)
+        rule_based = np.minimum(base * multipliers, 0.95)
+
+        if not self.hybrid_predictor:
+            ml_probability = None
+        elif ml_probability is PREDICT_ML:
+            ml_probability = self.hybrid_predictor.get_ml_prediction(applicant)
+
+        if ml_probability is not None:
+            probabilities = 0.7 * float(ml_probability) + 0.3 * rule_based
+            ml_info = {
+                'ml_available': True,
+                'ml_probability': round(float(ml_probability), 3) if ml_probability else None,
+                'method': 'hybrid',
+                'note': 'Hybrid prediction combines ML model (70%) with rule-based system (30%)'
+            }
+        else:
+            probabilities = rule_based
+            ml_info = {
+                'ml_available': False,
+                'ml_probability': None,
+                'method': 'rule_based_only',
+                'ml_status': self.ml_status,
+                'note': 'Using rule-based system only' if self.hybrid_predictor else self._rule_based_only_note()
+            }
+
+        results = []
+        for name, academic_score, total_score, multiplier, rule_probability, probability in zip(
+            schools.names, batch_scoring.to_python_scores(academic), total.tolist(),
+            multipliers.tolist(), rule_based.tolist(), probabilities.tolist()
+        ):
+            results.append({
+                "school": name,
+                "decision": self._decision(probability),
+                "admission_probability": round(probability, 3),
+                "rule_based_probability": round(rule_probability, 3),
+                "academic_score": round(academic_score, 2),
+                "total_score": round(total_score, 2),
+                "round_multiplier": multiplier
+            })
+        results.sort(key=lambda r: r["admission_probability"], reverse=True)
+
+        return {
+            "application_round": applicant.application_round,
+            "shared_scores": {
+                "extracurricular": round(extracurricular_score, 2),
+                "application": round(application_score, 2),
+                "demographic": round(demographic_score, 2)
+            },
+            "ml_info": ml_info,
+            "schools": results
+        }
+
+    def evaluate_sweep(self, applicant, axes: List[Tuple[str, List]]) -> Dict:
+        """
+        Admission probability at applicant.target_school for every
+        combination of the swept values (axes: one or two (field, values)
+        pairs, see sweep.py). Rule-based scores for the whole grid come from
+        one vectorized pass and the ML probabilities from one model call.
+        Returns None if the school is unknown.
+        """
+        school = self.school_table.get(applicant.target_school)
+        if not school:
+            return None
+
+        columns, ml_overrides = sweep.grid_columns(applicant, axes)
+        schools = self.school_table.take([school.row] * columns.size)
+
+        academic = batch_scoring.academic_scores(columns, schools)
+        extracurricular = batch_scoring.extracurricular_scores(columns)
+        application = batch_scoring.application_scores(columns)
+        demographic = batch_scoring.demographic_scores(columns)
+        total = (
+            np.minimum(academic, 100) * 0.45 +
+            np.minimum(extracurricular, 100) * 0.30 +
+            np.minimum(application, 100) * 0.20 +
+            np.minimum(demographic, 100) * 0.05
+        )
+        base = batch_scoring.probabilities(total, schools)
+        round_multiplier = self._get_application_round_multiplier(applicant.application_round, school)
+        rule_based = np.minimum(base * round_multiplier, 0.95)
+
+        if self.hybrid_predictor:
+            ml_probabilities = self.hybrid_predictor.get_sweep_predictions(applicant, ml_overrides, columns.size)
+        else:
+            ml_probabilities = None
+
+        if ml_probabilities is not None:
+            ml_probabilities = ml_probabilities.astype(np.float64)
+            probabilities = 0.7 * ml_probabilities + 0.3 * rule_based
+        else:
+            probabilities = rule_based
+        ml_info = self._vectorized_ml_info(ml_probabilities is not None)
+
+        shape = [len(values) for _, values in axes]
+
+        def grid(values):
+            # Python's round() (not np.round) so cells match evaluate() exactly
+            return np.array([round(value, 3) for value in values.tolist()], dtype=object).reshape(shape).tolist()
+
+        return {
+            "school": school.name,
+            "application_round": applicant.application_round,
+            "round_multiplier": round_multiplier,
+            "axes": [{"field": field, "values": values} for field, values in axes],
+            "probabilities": grid(probabilities),
+            "rule_based_probabilities": grid(rule_based),
+            "ml_probabilities": grid(ml_probabilities) if ml_probabilities is not None else None,
+            "ml_info": ml_info
+        }
+
+    def evaluate_thresholds(self, applicant, field: str, target_probability: float) -> Dict:
+        """
+        For every school, the lowest value of `field` (sat_score or
+        gpa_unweighted, on its reporting grid) at which the admission
+        probability reaches target_probability, everything else as submitted.
+
+        Only the academic score depends on the field, so the other components
+        are computed once; the academic score and selectivity curve run for
+        all (value, school) pairs in one vectorized pass and the ML model is
+        probed once per value, shared by all schools. The ML probability is
+        not monotone in SAT or GPA, so instead of bisecting, each school's
+        threshold is the first grid value that reaches the target;
+        stays_above_target says whether every higher value does too.
+        """
+        values = sweep.threshold_values(field)
+        schools = self.school_table
+        n_values, n_schools = len(values), schools.size
+
+        extracurricular_score = self._calculate_extracurricular_score(applicant)
+        application_score = self._calculate_application_score(applicant)
+        demographic_score = self._calculate_demographic_score(applicant)
+
+        # Row v * n_schools + s is value v at school s
+        columns, ml_overrides = sweep.grid_columns(applicant, [(field, values)])
+        columns = columns.repeat(n_schools)
+        grid_schools = schools.take(np.tile(np.arange(n_schools), n_values))
+
+        academic = batch_scoring.academic_scores(columns, grid_schools)
+        total = (
+            np.minimum(academic, 100) * 0.45 +
+            extracurricular_score * 0.30 +
+            application_score * 0.20 +
+            demographic_score * 0.05
+        )
+        base = batch_scoring.probabilities(total, grid_schools)
+        multipliers = self._round_multipliers([applicant.application_round] * n_schools, schools)
+        rule_based = np.minimum(base.reshape(n_values, n_schools) * multipliers, 0.95)
+
+        if self.hybrid_predictor:
+            ml_probabilities = self.hybrid_predictor.get_sweep_predictions(applicant, ml_overrides, n_values)
+        else:
+            ml_probabilities = None
+
+        if ml_probabilities is not None:
+            probabilities = 0.7 * ml_probabilities.astype(np.float64)[:, None] + 0.3 * rule_based
+        else:
+            probabilities = rule_based
+        ml_info = self._vectorized_ml_info(ml_probabilities is not None)
+
+        reached = probabilities >= target_probability
+        first = reached.argmax(axis=0)
+        # suffix_reached[v, s]: every value from v upwards reaches the target
+        suffix_reached = np.logical_and.accumulate(reached[::-1], axis=0)[::-1]
+
+        results = []
+        for s, name in enumerate(schools.names):
+            v = int(first[s])
+            if reached[v, s]:
+                minimum_value = values[v]
+                probability = round(float(probabilities[v, s]), 3)
+                stays_above = bool(suffix_reached[v, s])
+            else:
+                minimum_value = probability = None
+                stays_above = False
+            results.append({
+                "school": name,
+                "minimum_value": minimum_value,
+                "probability_at_minimum": probability,
+                "stays_above_target": stays_above,
+                "max_probability": round(float(probabilities[:, s].max()), 3),
+                "round_multiplier": float(multipliers[s])
+            })
+        results.sort(key=lambda r: (r["minimum_value"] is None, r["minimum_value"] or 0, -r["max_probability"]))
+
+        return {
+            "field": field,
+            "target_probability": target_probability,
+            "application_round": applicant.application_round,
+            "resolution": sweep.THRESHOLD_RESOLUTION[field],
+            "ml_info": ml_info,
+            "schools": results
+        }
+
+    def list_probabilities(self, applicant, entries: List[Tuple[str, str]],
+                           ml_probability=PREDICT_ML) -> Tuple[np.ndarray, Dict]:
+        """
+        Admission probability (unrounded, exactly as evaluate() computes it)
+        for each (school, round) pair of a college list, plus the ml_info
+        describing how it was computed. The school-independent components
+        and the ML prediction are computed once. Raises ValueError for
+        unknown schools.
+        """
+        unknown = [name for name, _ in entries if name not in self.school_table.index]
+        if unknown:
+            raise ValueError(f"Schools not found in database: {', '.join(unknown)}")
+
+        schools = self.school_table.take([self.school_table.index[name] for name, _ in entries])
+
+        extracurricular_score = self._calculate_extracurricular_score(applicant)
+        application_score = self._calculate_application_score(applicant)
+        demographic_score = self._calculate_demographic_score(applicant)
+
+        columns = ApplicantColumns.from_applicants([applicant]).repeat(schools.size)
+        academic = batch_scoring.academic_scores(columns, schools)
+        total = (
+            np.minimum(academic, 100) * 0.45 +
+            extracurricular_score * 0.30 +
+            application_score * 0.20 +
+            demographic_score * 0.05
+        )
+        base = batch_scoring.probabilities(total, schools)
+        multipliers = self._round_multipliers([round_name for _, round_name in entries], schools)
+        rule_based = np.minimum(base * multipliers, 0.95)
+
+        if not self.hybrid_predictor:
+            ml_probability = None
+        elif ml_probability is PREDICT_ML:
+            ml_probability = self.hybrid_predictor.get_ml_prediction(applicant)
+
+        if ml_probability is not None:
+            probabilities = 0.7 * float(ml_probability) + 0.3 * rule_based
+        else:
+            probabilities = rule_based
+        return probabilities, self._vectorized_ml_info(ml_probability is not None)
+
+    def _vectorized_ml_info(self, ml_available: bool) -> Dict:
+        """ml_info for results that blend one ML probability array with many rule-based ones"""
+        if ml_available:
+            return {
+                'ml_available': True,
+                'method': 'hybrid',
+                'note': 'Hybrid prediction combines ML model (70%) with rule-based system (30%)'
+            }
+        return {
+            'ml_available': False,
+            'method': 'rule_based_only',
+            'ml_status': self.ml_status,
+            'note': 'Using rule-based system only' if self.hybrid_predictor else self._rule_based_only_note()
+        }
+
+    def _unknown_school_result(self, applicant) -> Dict:
+        return {
+            "decision": "Unknown",
+            "admission_probability": 0.0,
+            "reasoning": [f"School '{applicant.target_school}' not found in database"],
+            "detailed_analysis": {},
+            "strengths": [],
+            "weaknesses": [],
+            "score_breakdown": {},
+            "advice": [],
+            "fit_analysis": {},
+            "application_round_impact": {},
+            "ml_info": {}
+        }
+
+    def _build_result(self, applicant, school, academic_score, extracurricular_score,
+                      application_score, demographic_score, total_score, base_probability,
+                      round_multiplier, rule_based_probability, hybrid_result, narrative: bool = True) -> Dict:
+        """Assemble the response dict from already computed scores and probabilities"""
+        if hybrid_result is not None:
             admission_probability = hybrid_result['probability']
             ml_info = {
                 'ml_available': hybrid_result['method'] == 'hybrid',
@@ -1435,33 +554,13 @@ class Top50AdmissionsEvaluator:
                 'ml_probability': None,
                 'rule_based_probability': round(rule_based_probability, 3),
                 'method': 'rule_based_only',
-                'note': 'ML model not available, using rule-based system only'
+                'ml_status': self.ml_status,
+                'note': self._rule_based_only_note()
             }
 
-        # Generate analysis
-        strengths, weaknesses = self._analyze_profile(
-            applicant, school_data, academic_score, extracurricular_score, application_score
-        )
-        reasoning = self._generate_reasoning(
-            applicant, school_data, admission_probability, strengths, weaknesses
-        )
-        detailed_analysis = self._generate_detailed_analysis(
-            applicant, school_data, academic_score, extracurricular_score
-        )
-        advice = self._generate_advice(applicant, weaknesses, school_data)
-        fit_analysis = self._generate_fit_analysis(applicant, school_data)
-
-        decision = "Likely Admit" if admission_probability >= 0.7 else \
-                   "Possible" if admission_probability >= 0.4 else \
-                   "Reach" if admission_probability >= 0.15 else "Unlikely"
-
-        return {
-            "decision": decision,
+        result = {
+            "decision": self._decision(admission_probability),
             "admission_probability": round(admission_probability, 3),
-            "reasoning": reasoning,
-            "detailed_analysis": detailed_analysis,
-            "strengths": strengths,
-            "weaknesses": weaknesses,
             "score_breakdown": {
                 "academic": round(academic_score, 2),
                 "extracurricular": round(extracurricular_score, 2),
@@ -1469,8 +568,6 @@ class Top50AdmissionsEvaluator:
                 "demographic": round(demographic_score, 2),
                 "total": round(total_score, 2)
             },
-            "advice": advice,
-            "fit_analysis": fit_analysis,
             "application_round_impact": {
                 "round": applicant.application_round,
                 "multiplier": round_multiplier,
@@ -1479,12 +576,51 @@ class Top50AdmissionsEvaluator:
             },
             "ml_info": ml_info
         }
+        if narrative:
+            result.update(self._narrative(
+                applicant, school, academic_score, extracurricular_score, application_score, admission_probability
+            ))
+        return result
+
+    def _narrative(self, applicant, school, academic_score, extracurricular_score,
+                   application_score, admission_probability) -> Dict:
+        """The text parts of a result (NARRATIVE_FIELDS); the slow part of _build_result"""
+        strengths, weaknesses = self._analyze_profile(
+            applicant, school, academic_score, extracurricular_score, application_score
+        )
+        reasoning = self._generate_reasoning(
+            applicant, school, admission_probability, strengths, weaknesses
+        )
+        detailed_analysis = self._generate_detailed_analysis(
+            applicant, school, academic_score, extracurricular_score
+        )
+        advice = self._generate_advice(applicant, weaknesses, school)
+        fit_analysis = self._generate_fit_analysis(applicant, school)
+
+        return {
+            "reasoning": reasoning,
+            "detailed_analysis": detailed_analysis,
+            "strengths": strengths,
+            "weaknesses": weaknesses,
+            "advice": advice,
+            "fit_analysis": fit_analysis
+        }
+
+    def _rule_based_only_note(self) -> str:
+        if self.ml_status == 'loading':
+            return 'ML model is still loading, using rule-based system only'
+        return 'ML model not available, using rule-based system only'
 
-    def _calculate_academic_score(self, applicant, school_data) -> float:
+    def _decision(self, admission_probability: float) -> str:
+        return "Likely Admit" if admission_probability >= 0.7 else \
+               "Possible" if admission_probability >= 0.4 else \
+               "Reach" if admission_probability >= 0.15 else "Unlikely"
+
+    def _calculate_academic_score(self, applicant, school) -> float:
         score = 0.0
 
         # GPA score (40% of academic)
-        gpa_percentile = min(applicant.gpa_unweighted / school_data["avg_gpa_unweighted"], 1.2)
+        gpa_percentile = min(applicant.gpa_unweighted / school.avg_gpa_unweighted, 1.2)
         score += gpa_percentile * 40
 
         # GPA trend bonus/penalty
@@ -1495,7 +631,7 @@ class Top50AdmissionsEvaluator:
 
         # SAT score (35% of academic)
         if applicant.sat_score:
-            sat_min, sat_max = school_data["sat_range"]
+            sat_min, sat_max = school.sat_range
             sat_mid = (sat_min + sat_max) / 2
             if applicant.sat_score >= sat_max:
                 score += 35
@@ -1513,8 +649,7 @@ class Top50AdmissionsEvaluator:
         score += ap_score
 
         # Curriculum difficulty (10% of academic)
-        difficulty_map = {"low": 3, "medium": 6, "high": 9, "very_high": 10}
-        score += difficulty_map.get(applicant.curriculum_difficulty, 5)
+        score += CURRICULUM_DIFFICULTY_POINTS.get(applicant.curriculum_difficulty, 5)
 
         # TOEFL/IELTS for international students
         if applicant.country != "United States":
@@ -1533,8 +668,7 @@ class Top50AdmissionsEvaluator:
 
         # Research experience (35% of EC)
         if applicant.research_experience and len(applicant.research_experience) > 50:
-            research_keywords = ["published", "paper", "journal", "conference", "lab", "professor", "independent"]
-            keyword_count = sum(1 for kw in research_keywords if kw.lower() in applicant.research_experience.lower())
+            keyword_count = len(PROFILE_KEYWORDS.keywords_in(applicant.research_experience, "research"))
             score += min(keyword_count * 5, 35)
 
         # Extracurriculars (40% of EC)
@@ -1549,11 +683,8 @@ class Top50AdmissionsEvaluator:
             score += num_activities * 5
 
         # Leadership keywords bonus
-        leadership_keywords = ["president", "founder", "captain", "lead", "director", "chair"]
-        for activity in applicant.extracurriculars:
-            if any(kw in activity.role.lower() for kw in leadership_keywords):
-                score += 5
-                break
+        if "leadership" in PROFILE_KEYWORDS.scan_all([activity.role for activity in applicant.extracurriculars]):
+            score += 5
 
         # Competitions and awards (25% of EC)
         num_competitions = len(applicant.competitions)
@@ -1565,11 +696,8 @@ class Top50AdmissionsEvaluator:
             score += 10
 
         # Prestigious competition bonus
-        prestigious = ["international", "national", "olympiad", "intel", "regeneron", "siemens"]
-        for comp in applicant.competitions:
-            if any(p in comp.level.lower() for p in prestigious):
-                score += 10
-                break
+        if "prestigious_competition" in PROFILE_KEYWORDS.scan_all([comp.level for comp in applicant.competitions]):
+            score += 10
 
         return min(score, 100)
 
@@ -1590,7 +718,7 @@ class Top50AdmissionsEvaluator:
         # Geographic diversity
         if applicant.country != "United States":
             score += 15
-        elif applicant.state_province in ["Wyoming", "Montana", "North Dakota", "South Dakota", "Alaska"]:
+        elif applicant.state_province in RURAL_STATES:
             score += 5
 
         # First generation bonus
@@ -1624,15 +752,15 @@ class Top50AdmissionsEvaluator:
 
         return min(max(probability, 0.01), 0.95)
 
-    def _analyze_profile(self, applicant, school_data, academic_score, ec_score, app_score):
+    def _analyze_profile(self, applicant, school, academic_score, ec_score, app_score):
         strengths = []
         weaknesses = []
 
         # Academic analysis
-        if applicant.gpa_unweighted >= school_data["avg_gpa_unweighted"]:
+        if applicant.gpa_unweighted >= school.avg_gpa_unweighted:
             strengths.append(f"Strong GPA ({applicant.gpa_unweighted}) meets or exceeds school average")
         else:
-            weaknesses.append(f"GPA ({applicant.gpa_unweighted}) below school average ({school_data['avg_gpa_unweighted']})")
+            weaknesses.append(f"GPA ({applicant.gpa_unweighted}) below school average ({school.avg_gpa_unweighted})")
 
         if applicant.gpa_trend == "upward":
             strengths.append("Upward GPA trend shows academic growth")
@@ -1640,7 +768,7 @@ class Top50AdmissionsEvaluator:
             weaknesses.append("Downward GPA trend is concerning")
 
         if applicant.sat_score:
-            sat_min, sat_max = school_data["sat_range"]
+            sat_min, sat_max = school.sat_range
             if applicant.sat_score >= sat_max:
                 strengths.append(f"Excellent SAT score ({applicant.sat_score}) in top range")
             elif applicant.sat_score < sat_min:
@@ -1677,12 +805,12 @@ class Top50AdmissionsEvaluator:
 
         return strengths, weaknesses
 
-    def _generate_reasoning(self, applicant, school_data, probability, strengths, weaknesses):
+    def _generate_reasoning(self, applicant, school, probability, strengths, weaknesses):
         reasoning = []
 
         reasoning.append(
-            f"{applicant.target_school} has an acceptance rate of {school_data['acceptance_rate']*100:.1f}%, "
-            f"making it a {school_data['selectivity'].replace('_', ' ')} school."
+            f"{applicant.target_school} has an acceptance rate of {school.acceptance_rate*100:.1f}%, "
+            f"making it a {school.selectivity.replace('_', ' ')} school."
         )
 
         if probability >= 0.7:
@@ -1702,14 +830,14 @@ class Top50AdmissionsEvaluator:
 
         return reasoning
 
-    def _generate_detailed_analysis(self, applicant, school_data, academic_score, ec_score):
+    def _generate_detailed_analysis(self, applicant, school, academic_score, ec_score):
         return {
             "academic": f"Academic score: {academic_score:.1f}/100. Your GPA and test scores are {'competitive' if academic_score >= 70 else 'below average'} for this school.",
             "extracurricular": f"Extracurricular score: {ec_score:.1f}/100. Your activities demonstrate {'strong' if ec_score >= 70 else 'moderate'} involvement.",
-            "fit": f"This school values {'demonstrated interest' if school_data.get('values_demonstrated_interest') else 'academic excellence primarily'}."
+            "fit": f"This school values {'demonstrated interest' if school.values_demonstrated_interest else 'academic excellence primarily'}."
         }
 
-    def _generate_advice(self, applicant, weaknesses, school_data):
+    def _generate_advice(self, applicant, weaknesses, school):
         advice = []
 
         if any("GPA" in w for w in weaknesses):
@@ -1724,14 +852,14 @@ class Top50AdmissionsEvaluator:
         if any("extracurricular" in w for w in weaknesses):
             advice.append("Deepen involvement in 2-3 key activities rather than spreading thin")
 
-        if school_data.get("values_demonstrated_interest"):
+        if school.values_demonstrated_interest:
             advice.append("Visit campus, attend info sessions, and contact admissions to show interest")
 
         return advice if advice else ["Continue your strong performance across all areas"]
 
-    def _generate_fit_analysis(self, applicant, school_data):
+    def _generate_fit_analysis(self, applicant, school):
         return {
-            "selectivity": f"This is a {school_data['selectivity'].replace('_', ' ')} school",
-            "acceptance_rate": f"{school_data['acceptance_rate']*100:.1f}% acceptance rate",
-            "your_standing": "Competitive applicant" if applicant.gpa_unweighted >= school_data["avg_gpa_unweighted"] else "Below average applicant"
+            "selectivity": f"This is a {school.selectivity.replace('_', ' ')} school",
+            "acceptance_rate": f"{school.acceptance_rate*100:.1f}% acceptance rate",
+            "your_standing": "Competitive applicant" if applicant.gpa_unweighted >= school.avg_gpa_unweighted else "Below average applicant"
         }
@@ -6,6 +6,11 @@ Complete implementation with application rounds, major alignment, and detailed a
 from typing import Dict, List, Tuple
 import re
 
+from school_data import load_school_table
+
+# The shared dataset also covers schools ranked below the top 50
+MAX_RANK = 50
+
 class Top50AdmissionsEvaluator:
     def __init__(self):
         self.schools_data = self._load_schools_data()
@@ -21,702 +26,10 @@ class Top50AdmissionsEvaluator:
         }
 
     def _load_schools_data(self) -> Dict:
-        """Load all Top 50 US universities with complete data"""
+        """The top-50-ranked schools of the dataset shared with evaluator.py (see school_data.py)"""
         return {
-            # Top 10
-            "Princeton University": {
-                "rank": 1,
-                "acceptance_rate": 0.039,
-                "avg_gpa_unweighted": 3.95,
-                "avg_gpa_weighted": 4.18,
-                "sat_range": (1470, 1570),
-                "sat_25th": 1470, "sat_75th": 1570,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["SCEA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": True
-            },
-            "MIT": {
-                "rank": 2,
-                "acceptance_rate": 0.04,
-                "avg_gpa_unweighted": 3.96,
-                "avg_gpa_weighted": 4.17,
-                "sat_range": (1520, 1580),
-                "sat_25th": 1520, "sat_75th": 1580,
-                "act_range": (34, 36),
-                "selectivity": "most_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": True
-            },
-            "Harvard University": {
-                "rank": 3,
-                "acceptance_rate": 0.033,
-                "avg_gpa_unweighted": 3.95,
-                "avg_gpa_weighted": 4.18,
-                "sat_range": (1460, 1580),
-                "sat_25th": 1460, "sat_75th": 1580,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["SCEA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": True
-            },
-            "Stanford University": {
-                "rank": 3,
-                "acceptance_rate": 0.035,
-                "avg_gpa_unweighted": 3.96,
-                "avg_gpa_weighted": 4.19,
-                "sat_range": (1470, 1570),
-                "sat_25th": 1470, "sat_75th": 1570,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["REA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": True
-            },
-            "Yale University": {
-                "rank": 5,
-                "acceptance_rate": 0.046,
-                "avg_gpa_unweighted": 3.95,
-                "avg_gpa_weighted": 4.19,
-                "sat_range": (1460, 1570),
-                "sat_25th": 1460, "sat_75th": 1570,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["SCEA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": True
-            },
-            "University of Pennsylvania": {
-                "rank": 6,
-                "acceptance_rate": 0.056,
-                "avg_gpa_unweighted": 3.90,
-                "avg_gpa_weighted": 4.16,
-                "sat_range": (1450, 1560),
-                "sat_25th": 1450, "sat_75th": 1560,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Caltech": {
-                "rank": 7,
-                "acceptance_rate": 0.029,
-                "avg_gpa_unweighted": 3.97,
-                "avg_gpa_weighted": 4.19,
-                "sat_range": (1530, 1580),
-                "sat_25th": 1530, "sat_75th": 1580,
-                "act_range": (35, 36),
-                "selectivity": "most_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": True
-            },
-            "Duke University": {
-                "rank": 7,
-                "acceptance_rate": 0.058,
-                "avg_gpa_unweighted": 3.94,
-                "avg_gpa_weighted": 4.17,
-                "sat_range": (1480, 1570),
-                "sat_25th": 1480, "sat_75th": 1570,
-                "act_range": (34, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Johns Hopkins University": {
-                "rank": 9,
-                "acceptance_rate": 0.073,
-                "avg_gpa_unweighted": 3.92,
-                "avg_gpa_weighted": 4.15,
-                "sat_range": (1480, 1570),
-                "sat_25th": 1480, "sat_75th": 1570,
-                "act_range": (34, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Northwestern University": {
-                "rank": 9,
-                "acceptance_rate": 0.070,
-                "avg_gpa_unweighted": 3.92,
-                "avg_gpa_weighted": 4.15,
-                "sat_range": (1450, 1550),
-                "sat_25th": 1450, "sat_75th": 1550,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            # 11-20
-            "Brown University": {
-                "rank": 11,
-                "acceptance_rate": 0.052,
-                "avg_gpa_unweighted": 3.94,
-                "avg_gpa_weighted": 4.16,
-                "sat_range": (1450, 1560),
-                "sat_25th": 1450, "sat_75th": 1560,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Cornell University": {
-                "rank": 11,
-                "acceptance_rate": 0.087,
-                "avg_gpa_unweighted": 3.90,
-                "avg_gpa_weighted": 4.14,
-                "sat_range": (1400, 1540),
-                "sat_25th": 1400, "sat_75th": 1540,
-                "act_range": (32, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Dartmouth College": {
-                "rank": 11,
-                "acceptance_rate": 0.062,
-                "avg_gpa_unweighted": 3.93,
-                "avg_gpa_weighted": 4.15,
-                "sat_range": (1440, 1560),
-                "sat_25th": 1440, "sat_75th": 1560,
-                "act_range": (32, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Columbia University": {
-                "rank": 14,
-                "acceptance_rate": 0.039,
-                "avg_gpa_unweighted": 3.95,
-                "avg_gpa_weighted": 4.17,
-                "sat_range": (1470, 1570),
-                "sat_25th": 1470, "sat_75th": 1570,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Vanderbilt University": {
-                "rank": 14,
-                "acceptance_rate": 0.066,
-                "avg_gpa_unweighted": 3.91,
-                "avg_gpa_weighted": 4.15,
-                "sat_range": (1460, 1570),
-                "sat_25th": 1460, "sat_75th": 1570,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Washington University in St. Louis": {
-                "rank": 14,
-                "acceptance_rate": 0.116,
-                "avg_gpa_unweighted": 3.92,
-                "avg_gpa_weighted": 4.15,
-                "sat_range": (1470, 1570),
-                "sat_25th": 1470, "sat_75th": 1570,
-                "act_range": (33, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Rice University": {
-                "rank": 17,
-                "acceptance_rate": 0.087,
-                "avg_gpa_unweighted": 3.92,
-                "avg_gpa_weighted": 4.15,
-                "sat_range": (1470, 1570),
-                "sat_25th": 1470, "sat_75th": 1570,
-                "act_range": (34, 35),
-                "selectivity": "most_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Notre Dame": {
-                "rank": 18,
-                "acceptance_rate": 0.128,
-                "avg_gpa_unweighted": 3.90,
-                "avg_gpa_weighted": 4.13,
-                "sat_range": (1400, 1550),
-                "sat_25th": 1400, "sat_75th": 1550,
-                "act_range": (32, 35),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["REA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "UCLA": {
-                "rank": 18,
-                "acceptance_rate": 0.090,
-                "avg_gpa_unweighted": 3.90,
-                "avg_gpa_weighted": 4.31,
-                "sat_range": (1290, 1510),
-                "sat_25th": 1290, "sat_75th": 1510,
-                "act_range": (27, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "UC Berkeley": {
-                "rank": 20,
-                "acceptance_rate": 0.113,
-                "avg_gpa_unweighted": 3.89,
-                "avg_gpa_weighted": 4.29,
-                "sat_range": (1330, 1530),
-                "sat_25th": 1330, "sat_75th": 1530,
-                "act_range": (28, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            # 21-30
-            "Emory University": {
-                "rank": 21,
-                "acceptance_rate": 0.113,
-                "avg_gpa_unweighted": 3.88,
-                "avg_gpa_weighted": 4.12,
-                "sat_range": (1370, 1520),
-                "sat_25th": 1370, "sat_75th": 1520,
-                "act_range": (31, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Georgetown University": {
-                "rank": 21,
-                "acceptance_rate": 0.120,
-                "avg_gpa_unweighted": 3.89,
-                "avg_gpa_weighted": 4.13,
-                "sat_range": (1380, 1530),
-                "sat_25th": 1380, "sat_75th": 1530,
-                "act_range": (31, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["REA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Michigan": {
-                "rank": 23,
-                "acceptance_rate": 0.180,
-                "avg_gpa_unweighted": 3.88,
-                "avg_gpa_weighted": 4.11,
-                "sat_range": (1340, 1530),
-                "sat_25th": 1340, "sat_75th": 1530,
-                "act_range": (31, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Carnegie Mellon University": {
-                "rank": 24,
-                "acceptance_rate": 0.114,
-                "avg_gpa_unweighted": 3.91,
-                "avg_gpa_weighted": 4.14,
-                "sat_range": (1460, 1560),
-                "sat_25th": 1460, "sat_75th": 1560,
-                "act_range": (33, 35),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Southern California": {
-                "rank": 24,
-                "acceptance_rate": 0.095,
-                "avg_gpa_unweighted": 3.86,
-                "avg_gpa_weighted": 4.10,
-                "sat_range": (1380, 1530),
-                "sat_25th": 1380, "sat_75th": 1530,
-                "act_range": (31, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Virginia": {
-                "rank": 24,
-                "acceptance_rate": 0.191,
-                "avg_gpa_unweighted": 3.87,
-                "avg_gpa_weighted": 4.11,
-                "sat_range": (1370, 1520),
-                "sat_25th": 1370, "sat_75th": 1520,
-                "act_range": (31, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Wake Forest University": {
-                "rank": 27,
-                "acceptance_rate": 0.217,
-                "avg_gpa_unweighted": 3.84,
-                "avg_gpa_weighted": 4.08,
-                "sat_range": (1330, 1480),
-                "sat_25th": 1330, "sat_75th": 1480,
-                "act_range": (30, 33),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["ED", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "New York University": {
-                "rank": 28,
-                "acceptance_rate": 0.120,
-                "avg_gpa_unweighted": 3.69,
-                "avg_gpa_weighted": 3.95,
-                "sat_range": (1350, 1530),
-                "sat_25th": 1350, "sat_75th": 1530,
-                "act_range": (31, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Tufts University": {
-                "rank": 28,
-                "acceptance_rate": 0.095,
-                "avg_gpa_unweighted": 3.91,
-                "avg_gpa_weighted": 4.13,
-                "sat_range": (1420, 1540),
-                "sat_25th": 1420, "sat_75th": 1540,
-                "act_range": (32, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of North Carolina at Chapel Hill": {
-                "rank": 28,
-                "acceptance_rate": 0.167,
-                "avg_gpa_unweighted": 3.87,
-                "avg_gpa_weighted": 4.39,
-                "sat_range": (1300, 1480),
-                "sat_25th": 1300, "sat_75th": 1480,
-                "act_range": (29, 33),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            # 31-40
-            "UC Santa Barbara": {
-                "rank": 31,
-                "acceptance_rate": 0.257,
-                "avg_gpa_unweighted": 3.85,
-                "avg_gpa_weighted": 4.22,
-                "sat_range": (1230, 1480),
-                "sat_25th": 1230, "sat_75th": 1480,
-                "act_range": (27, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Florida": {
-                "rank": 32,
-                "acceptance_rate": 0.230,
-                "avg_gpa_unweighted": 3.85,
-                "avg_gpa_weighted": 4.42,
-                "sat_range": (1280, 1450),
-                "sat_25th": 1280, "sat_75th": 1450,
-                "act_range": (28, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "UC Irvine": {
-                "rank": 32,
-                "acceptance_rate": 0.211,
-                "avg_gpa_unweighted": 3.83,
-                "avg_gpa_weighted": 4.18,
-                "sat_range": (1230, 1450),
-                "sat_25th": 1230, "sat_75th": 1450,
-                "act_range": (26, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Boston College": {
-                "rank": 34,
-                "acceptance_rate": 0.167,
-                "avg_gpa_unweighted": 3.86,
-                "avg_gpa_weighted": 4.09,
-                "sat_range": (1370, 1500),
-                "sat_25th": 1370, "sat_75th": 1500,
-                "act_range": (31, 34),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "UC San Diego": {
-                "rank": 34,
-                "acceptance_rate": 0.238,
-                "avg_gpa_unweighted": 3.87,
-                "avg_gpa_weighted": 4.23,
-                "sat_range": (1250, 1490),
-                "sat_25th": 1250, "sat_75th": 1490,
-                "act_range": (27, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Rochester": {
-                "rank": 36,
-                "acceptance_rate": 0.387,
-                "avg_gpa_unweighted": 3.80,
-                "avg_gpa_weighted": 4.05,
-                "sat_range": (1330, 1510),
-                "sat_25th": 1330, "sat_75th": 1510,
-                "act_range": (30, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Boston University": {
-                "rank": 37,
-                "acceptance_rate": 0.140,
-                "avg_gpa_unweighted": 3.71,
-                "avg_gpa_weighted": 3.96,
-                "sat_range": (1310, 1500),
-                "sat_25th": 1310, "sat_75th": 1500,
-                "act_range": (30, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "UC Davis": {
-                "rank": 37,
-                "acceptance_rate": 0.372,
-                "avg_gpa_unweighted": 3.82,
-                "avg_gpa_weighted": 4.16,
-                "sat_range": (1160, 1430),
-                "sat_25th": 1160, "sat_75th": 1430,
-                "act_range": (25, 32),
-                "selectivity": "very_competitive",
-                "available_rounds": ["RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Brandeis University": {
-                "rank": 39,
-                "acceptance_rate": 0.310,
-                "avg_gpa_unweighted": 3.79,
-                "avg_gpa_weighted": 4.03,
-                "sat_range": (1330, 1500),
-                "sat_25th": 1330, "sat_75th": 1500,
-                "act_range": (30, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Case Western Reserve University": {
-                "rank": 39,
-                "acceptance_rate": 0.267,
-                "avg_gpa_unweighted": 3.78,
-                "avg_gpa_weighted": 4.02,
-                "sat_range": (1330, 1500),
-                "sat_25th": 1330, "sat_75th": 1500,
-                "act_range": (31, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "College of William & Mary": {
-                "rank": 39,
-                "acceptance_rate": 0.333,
-                "avg_gpa_unweighted": 3.84,
-                "avg_gpa_weighted": 4.28,
-                "sat_range": (1330, 1490),
-                "sat_25th": 1330, "sat_75th": 1490,
-                "act_range": (30, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            # 41-50
-            "Georgia Institute of Technology": {
-                "rank": 42,
-                "acceptance_rate": 0.161,
-                "avg_gpa_unweighted": 3.87,
-                "avg_gpa_weighted": 4.18,
-                "sat_range": (1370, 1530),
-                "sat_25th": 1370, "sat_75th": 1530,
-                "act_range": (31, 35),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Tulane University": {
-                "rank": 42,
-                "acceptance_rate": 0.089,
-                "avg_gpa_unweighted": 3.76,
-                "avg_gpa_weighted": 4.00,
-                "sat_range": (1340, 1490),
-                "sat_25th": 1340, "sat_75th": 1490,
-                "act_range": (30, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "University of Wisconsin-Madison": {
-                "rank": 42,
-                "acceptance_rate": 0.494,
-                "avg_gpa_unweighted": 3.82,
-                "avg_gpa_weighted": 4.05,
-                "sat_range": (1300, 1480),
-                "sat_25th": 1300, "sat_75th": 1480,
-                "act_range": (28, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Illinois Urbana-Champaign": {
-                "rank": 45,
-                "acceptance_rate": 0.447,
-                "avg_gpa_unweighted": 3.80,
-                "avg_gpa_weighted": 4.04,
-                "sat_range": (1280, 1490),
-                "sat_25th": 1280, "sat_75th": 1490,
-                "act_range": (28, 34),
-                "selectivity": "very_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Lehigh University": {
-                "rank": 45,
-                "acceptance_rate": 0.323,
-                "avg_gpa_unweighted": 3.75,
-                "avg_gpa_weighted": 3.99,
-                "sat_range": (1320, 1480),
-                "sat_25th": 1320, "sat_75th": 1480,
-                "act_range": (30, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Northeastern University": {
-                "rank": 45,
-                "acceptance_rate": 0.066,
-                "avg_gpa_unweighted": 3.82,
-                "avg_gpa_weighted": 4.06,
-                "sat_range": (1390, 1530),
-                "sat_25th": 1390, "sat_75th": 1530,
-                "act_range": (32, 35),
-                "selectivity": "highly_competitive",
-                "available_rounds": ["ED1", "ED2", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Pepperdine University": {
-                "rank": 45,
-                "acceptance_rate": 0.317,
-                "avg_gpa_unweighted": 3.73,
-                "avg_gpa_weighted": 3.97,
-                "sat_range": (1230, 1420),
-                "sat_25th": 1230, "sat_75th": 1420,
-                "act_range": (27, 32),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            },
-            "Ohio State University": {
-                "rank": 49,
-                "acceptance_rate": 0.527,
-                "avg_gpa_unweighted": 3.76,
-                "avg_gpa_weighted": 4.00,
-                "sat_range": (1240, 1450),
-                "sat_25th": 1240, "sat_75th": 1450,
-                "act_range": (27, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Purdue University": {
-                "rank": 49,
-                "acceptance_rate": 0.528,
-                "avg_gpa_unweighted": 3.74,
-                "avg_gpa_weighted": 3.98,
-                "sat_range": (1190, 1440),
-                "sat_25th": 1190, "sat_75th": 1440,
-                "act_range": (26, 33),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Georgia": {
-                "rank": 49,
-                "acceptance_rate": 0.426,
-                "avg_gpa_unweighted": 3.79,
-                "avg_gpa_weighted": 4.02,
-                "sat_range": (1240, 1420),
-                "sat_25th": 1240, "sat_75th": 1420,
-                "act_range": (27, 32),
-                "selectivity": "competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "University of Texas at Austin": {
-                "rank": 49,
-                "acceptance_rate": 0.298,
-                "avg_gpa_unweighted": 3.77,
-                "avg_gpa_weighted": 4.01,
-                "sat_range": (1230, 1480),
-                "sat_25th": 1230, "sat_75th": 1480,
-                "act_range": (27, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["EA", "RD"],
-                "values_demonstrated_interest": False,
-                "need_blind": False
-            },
-            "Villanova University": {
-                "rank": 49,
-                "acceptance_rate": 0.230,
-                "avg_gpa_unweighted": 3.78,
-                "avg_gpa_weighted": 4.01,
-                "sat_range": (1330, 1480),
-                "sat_25th": 1330, "sat_75th": 1480,
-                "act_range": (30, 33),
-                "selectivity": "very_competitive",
-                "available_rounds": ["ED1", "ED2", "EA", "RD"],
-                "values_demonstrated_interest": True,
-                "need_blind": False
-            }
+            name: school for name, school in load_school_table().to_schools_data().items()
+            if school["rank"] <= MAX_RANK
         }
 
     def get_available_schools(self) -> List[str]:
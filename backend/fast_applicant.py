@@ -0,0 +1,99 @@
+"""
+Fast ingestion of applicant JSON into a compact record
+
+Validating ApplicantData builds a pydantic model for the applicant and for
+every AP course, activity and competition in it, yet evaluation reads only
+the SCORING_FIELDS plus AP scores, activity roles, competition levels and
+ethnicity. record_type(ApplicantData) is a type FastAPI and TypeAdapter
+validate with ApplicantData's own core schema, every model in it swapped for
+a typed dict: the same field validators, constraints, defaults and error
+locations, so exactly the same inputs are accepted and rejected. Only
+dicts are built, and the fields evaluation reads are then copied into an
+ApplicantRecord with __slots__. The JSON schema (OpenAPI docs) is
+ApplicantData's.
+
+Unlike ApplicantData, model instances are not accepted in place of dicts;
+request bodies and decoded files only ever contain dicts.
+"""
+
+from typing import Any, Dict, NamedTuple
+
+from pydantic_core import CoreSchema, core_schema
+
+from result_cache import SCORING_FIELDS
+
+
+class APScore(NamedTuple):
+    score: int
+
+
+class ActivityRole(NamedTuple):
+    role: str
+
+
+class CompetitionLevel(NamedTuple):
+    level: str
+
+
+class ApplicantRecord:
+    """The ApplicantData fields evaluation reads; nested items keep only the field read from them"""
+
+    __slots__ = tuple(SCORING_FIELDS) + ("ethnicity", "ap_courses", "extracurriculars", "competitions")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ApplicantRecord":
+        record = cls.__new__(cls)
+        for name in SCORING_FIELDS:
+            setattr(record, name, data[name])
+        record.ethnicity = data["ethnicity"]
+        record.ap_courses = [APScore(course["score"]) for course in data["ap_courses"]]
+        record.extracurriculars = [ActivityRole(activity["role"]) for activity in data["extracurriculars"]]
+        record.competitions = [CompetitionLevel(comp["level"]) for comp in data["competitions"]]
+        return record
+
+
+def typed_dict_schema(schema: Any) -> Any:
+    """A copy of a core schema with every model schema replaced by an equivalent typed-dict schema"""
+    if isinstance(schema, list):
+        return [typed_dict_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    if schema.get("type") == "model":
+        fields = schema["schema"]["fields"]
+        # Non-objects fail with the model's own error (model_type), not dict_type
+        is_object = core_schema.custom_error_schema(
+            core_schema.dict_schema(), "model_type", custom_error_context={"class_name": schema["cls"].__name__}
+        )
+        return core_schema.chain_schema([is_object, core_schema.typed_dict_schema(
+            {
+                name: core_schema.typed_dict_field(
+                    typed_dict_schema(field["schema"]), required=field["schema"]["type"] != "default"
+                )
+                for name, field in fields.items()
+            },
+            config=schema.get("config")
+        )])
+    return {key: typed_dict_schema(value) for key, value in schema.items()}
+
+
+def record_type(model) -> type:
+    """
+    An ApplicantRecord subclass validated exactly like `model` (a pydantic
+    model such as ApplicantData). A class rather than an Annotated type, as
+    FastAPI drops annotation metadata from body parameters.
+    """
+    schema = core_schema.no_info_after_validator_function(
+        ApplicantRecord.from_dict, typed_dict_schema(model.__pydantic_core_schema__)
+    )
+
+    def core(cls, source, handler) -> CoreSchema:
+        return schema
+
+    def json_schema(cls, _, handler):
+        return handler(model.__pydantic_core_schema__)
+
+    return type(f"{model.__name__}Record", (ApplicantRecord,), {
+        "__slots__": (),
+        "__get_pydantic_core_schema__": classmethod(core),
+        "__get_pydantic_json_schema__": classmethod(json_schema),
+    })
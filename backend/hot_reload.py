@@ -0,0 +1,235 @@
+"""
+Hot reload of school data and the ML model without restarting the server
+
+A new Top50AdmissionsEvaluator (school table + HybridAdmissionsPredictor) is
+built in a background thread, smoke-tested, and swapped in with a single
+reference assignment. Requests that already picked up the old evaluator
+finish on it; requests that arrive after the swap see the new one.
+
+In a prefork worker (see prefork.py) the reloader is delegated to the
+master instead: a reload request, or a change seen by the one watching
+worker, sends the master SIGHUP. The master reloads once and replaces the
+workers with fresh forks, so every worker serves the same version and the
+new model is shared copy-on-write again.
+"""
+
+import math
+import os
+import signal
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from evaluator import MODEL_PATH, Top50AdmissionsEvaluator
+from school_data import load_school_table, resolve_data_path
+
+
+class ReloadError(Exception):
+    """The candidate evaluator failed validation and was not swapped in"""
+
+
+class EvaluatorReloader:
+    """
+    Owns the live evaluator. Read it through .evaluator once per request and
+    use that reference for the whole request.
+    """
+
+    def __init__(self, evaluator: Top50AdmissionsEvaluator, smoke_applicant,
+                 model_path: Optional[str] = None):
+        self.evaluator = evaluator
+        self.smoke_applicant = smoke_applicant
+        self.model_path = str(model_path or MODEL_PATH)
+        self._reload_lock = threading.Lock()
+        self._listeners: List[Callable[[Top50AdmissionsEvaluator], None]] = []
+        self._stop_watching = threading.Event()
+        self._watch_thread = None
+        # Set in prefork workers: reloads are the master's (see delegate_to_master)
+        self.master_pid: Optional[int] = None
+        self.watches_files = True
+        self.status = {
+            'state': 'idle',
+            'stage': None,
+            'version': evaluator.version,
+            'reloads': 0,
+            'last_reload': None,
+            'last_error': None
+        }
+
+    def add_listener(self, listener: Callable[[Top50AdmissionsEvaluator], None]):
+        """Call listener(new_evaluator) after every successful swap"""
+        self._listeners.append(listener)
+
+    def reload(self, smoke_test_ml: bool = True) -> Dict:
+        """
+        Load the current school data cycle and model file, validate them and
+        swap them in. Blocks until done; raises ReloadError if validation fails
+        or another reload is running.
+
+        smoke_test_ml=False validates the candidate without running the model
+        (the prefork master must not start XGBoost's OpenMP threads).
+        """
+        if not self._reload_lock.acquire(blocking=False):
+            raise ReloadError("A reload is already in progress")
+
+        try:
+            self.status['state'] = 'loading'
+            started = time.time()
+            try:
+                self.status['stage'] = 'loading school data'
+                school_table = load_school_table()
+                self.status['stage'] = 'loading ML model'
+                candidate = Top50AdmissionsEvaluator(school_table, self.model_path)
+                self.status['stage'] = 'smoke test'
+                self._smoke_test(candidate, smoke_test_ml)
+            except Exception as e:
+                self.status['state'] = 'failed'
+                self.status['stage'] = None
+                self.status['last_error'] = f"{type(e).__name__}: {e}"
+                if self.evaluator.ml_status == 'loading':
+                    # Initial warm-up failed: stay rule-based, but stop reporting "loading"
+                    self.evaluator.ml_status = 'unavailable'
+                print(f"Reload failed, keeping version {self.evaluator.version}: {e}")
+                raise ReloadError(str(e)) from e
+
+            # Atomic swap: a single reference assignment
+            self.evaluator = candidate
+
+            self.status.update({
+                'state': 'idle',
+                'stage': None,
+                'version': candidate.version,
+                'reloads': self.status['reloads'] + 1,
+                'last_reload': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(started)),
+                'last_error': None,
+                'load_seconds': round(time.time() - started, 3)
+            })
+            print(f"Reloaded evaluator: {candidate.version}")
+
+            for listener in self._listeners:
+                try:
+                    listener(candidate)
+                except Exception:
+                    traceback.print_exc()
+
+            return self.status
+        finally:
+            self._reload_lock.release()
+
+    def delegate_to_master(self, master_pid: int, watches_files: bool):
+        """
+        Make this prefork worker ask the master to reload instead of
+        reloading itself. Only the worker with watches_files=True polls the
+        files, so one change sends one request.
+        """
+        self.master_pid = master_pid
+        self.watches_files = watches_files
+
+    def _request_from_master(self):
+        os.kill(self.master_pid, signal.SIGHUP)
+        self.status['state'] = 'requested'
+        print(f"Asked the master (pid {self.master_pid}) to reload and restart the workers")
+
+    def reload_in_background(self) -> bool:
+        """
+        Start reload() on a background thread (in a prefork worker: ask the
+        master); False if one is already running
+        """
+        if self.master_pid is not None:
+            self._request_from_master()
+            return True
+        if self._reload_lock.locked():
+            return False
+
+        def run():
+            try:
+                self.reload()
+            except ReloadError:
+                pass
+
+        threading.Thread(target=run, name="evaluator-reload", daemon=True).start()
+        return True
+
+    def _smoke_test(self, candidate: Top50AdmissionsEvaluator, run_ml: bool = True):
+        """Evaluate a known profile on the candidate before it goes live"""
+        table = candidate.school_table
+        if table.size == 0:
+            raise ReloadError("School table is empty")
+
+        if self.evaluator.hybrid_predictor and self.evaluator.hybrid_predictor.ml_available:
+            if not (candidate.hybrid_predictor and candidate.hybrid_predictor.ml_available):
+                raise ReloadError(f"ML model at {self.model_path} could not be loaded")
+
+        applicant = self.smoke_applicant
+        if applicant.target_school not in table.index:
+            applicant = applicant.model_copy(update={'target_school': table.names[0]})
+
+        if run_ml:
+            result = candidate.evaluate(applicant)
+        else:
+            result = candidate.evaluate(applicant, ml_probability=None)
+        probability = result['admission_probability']
+        if result['decision'] == 'Unknown' or not (math.isfinite(probability) and 0.0 <= probability <= 1.0):
+            raise ReloadError(f"Smoke evaluation returned {result['decision']} / {probability}")
+
+        if run_ml and candidate.ml_status == 'ready':
+            if result['ml_info']['method'] != 'hybrid':
+                raise ReloadError("Smoke evaluation did not use the ML model")
+
+    # ------------------------------------------------------------------
+    # File watching
+    # ------------------------------------------------------------------
+
+    def _fingerprint(self) -> Tuple:
+        """Changes whenever the active data cycle or the model files change"""
+        data_dir = resolve_data_path()
+        files = sorted(data_dir.iterdir())
+        # The pickled model and its compiled .npz (numpy backend)
+        model_files = [Path(self.model_path), Path(self.model_path).with_suffix('.npz')]
+        return (
+            str(data_dir),
+            tuple((f.name, f.stat().st_mtime_ns, f.stat().st_size) for f in files),
+            tuple((f.stat().st_mtime_ns, f.stat().st_size) if f.exists() else None for f in model_files)
+        )
+
+    def watch(self, interval: float = 5.0):
+        """Poll the data directory and model file, reloading when they change"""
+        if self._watch_thread is not None or not self.watches_files:
+            return
+
+        def run():
+            last = self._fingerprint()
+            while not self._stop_watching.wait(interval):
+                try:
+                    current = self._fingerprint()
+                except OSError:
+                    # Files mid-replacement; try again on the next tick
+                    continue
+                if current != last and self.master_pid is not None:
+                    self._request_from_master()
+                    last = current
+                elif current != last:
+                    try:
+                        self.reload()
+                        last = current
+                    except ReloadError:
+                        # Don't retry the same broken files every tick
+                        last = current
+
+        self._stop_watching.clear()
+        self._watch_thread = threading.Thread(target=run, name="evaluator-watch", daemon=True)
+        self._watch_thread.start()
+        print(f"Watching school data and ML model for changes every {interval}s")
+
+    def stop_watching(self):
+        self._stop_watching.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join()
+            self._watch_thread = None
+
+
+def watch_interval_from_env() -> Optional[float]:
+    """RELOAD_WATCH_INTERVAL (seconds) enables file-watch mode"""
+    value = os.environ.get('RELOAD_WATCH_INTERVAL')
+    return float(value) if value else None
@@ -0,0 +1,224 @@
+"""
+College-list optimizer: which schools to apply to, and in which round
+
+Maximizes the expected utility of the best admission the applicant ends up
+with (decisions treated as independent):
+
+    V(list) = sum_i u_i p_i prod_{j ranked above i} (1 - p_j)
+
+with schools ordered by utility. An Early Decision application is binding,
+so with one at school e the value is p_e u_e + (1 - p_e) V(rest).
+
+Constraints: at most max_applications schools, each at most once; at most
+one binding Early Decision (ED, ED1 or ED2); a Restrictive or Single-Choice
+Early Action (REA/SCEA) application excludes every other early application.
+A school can only be applied to in rounds listed in its available_rounds.
+
+All per-school, per-round probabilities come from one
+Top50AdmissionsEvaluator.list_probabilities() call. Early rounds that do not
+beat the school's regular-decision probability are pruned. The search is
+greedy from several starting strategies (no early round, and each of the
+most valuable ED and REA/SCEA options), followed by a swap local search on
+the best few. Every "add one candidate" step scores all candidates at once
+with prefix sums over the current list.
+"""
+
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+REGULAR_ROUND = "Regular Decision (RD)"
+BINDING_ROUNDS = {"Early Decision (ED)", "Early Decision I (ED1)", "Early Decision II (ED2)"}
+RESTRICTIVE_ROUNDS = {"Restrictive Early Action (REA)", "Single-Choice Early Action (SCEA)"}
+NON_BINDING_EARLY_ROUNDS = {"Early Action (EA)"}
+
+# Candidate kinds
+REGULAR, EARLY_ACTION, RESTRICTIVE, BINDING = 0, 1, 2, 3
+
+# Starting strategies tried per early-round kind
+STRATEGY_CANDIDATES = 6
+# Greedy lists that get the (more expensive) swap local search
+LOCAL_SEARCH_STARTS = 3
+MAX_LOCAL_SEARCH_PASSES = 50
+
+
+def default_utility(rank: int, lowest_rank: int) -> float:
+    """1.0 for the top-ranked school, falling linearly to 0.5 for the lowest"""
+    return 1.0 - (rank - 1) / (2 * lowest_rank)
+
+
+def _round_kind(round_name: str) -> int:
+    if round_name in BINDING_ROUNDS:
+        return BINDING
+    if round_name in RESTRICTIVE_ROUNDS:
+        return RESTRICTIVE
+    if round_name in NON_BINDING_EARLY_ROUNDS:
+        return EARLY_ACTION
+    return REGULAR
+
+
+def _round_token(round_name: str) -> str:
+    return round_name.split("(")[1].rstrip(")") if "(" in round_name else round_name.split()[0]
+
+
+class ListOptimizer:
+    """Probability table for one applicant, plus the search over it"""
+
+    def __init__(self, evaluator, applicant, utilities: Optional[Dict[str, float]] = None):
+        table = evaluator.school_table
+        lowest_rank = int(table.rank.max())
+        utilities = utilities or {}
+
+        entries = []
+        for school in table.records:
+            utility = utilities.get(school.name, default_utility(school.rank, lowest_rank))
+            if utility <= 0:
+                continue
+            for round_name in evaluator.application_round_multipliers:
+                if round_name == REGULAR_ROUND or _round_token(round_name) in school.available_rounds:
+                    entries.append((school.name, round_name, utility))
+
+        probabilities, self.ml_info = evaluator.list_probabilities(
+            applicant, [(name, round_name) for name, round_name, _ in entries]
+        )
+
+        # Prune early rounds that are no better than applying regular decision
+        regular = {name: p for (name, round_name, _), p in zip(entries, probabilities.tolist())
+                   if round_name == REGULAR_ROUND}
+        keep = [
+            i for i, ((name, round_name, _), p) in enumerate(zip(entries, probabilities.tolist()))
+            if round_name == REGULAR_ROUND or p > regular[name]
+        ]
+
+        school_ids = {name: i for i, name in enumerate(dict.fromkeys(name for name, _, _ in entries))}
+        self.schools = [entries[i][0] for i in keep]
+        self.rounds = [entries[i][1] for i in keep]
+        self.school_id = np.array([school_ids[entries[i][0]] for i in keep], dtype=np.int64)
+        self.kind = np.array([_round_kind(entries[i][1]) for i in keep], dtype=np.int8)
+        self.utility = np.array([entries[i][2] for i in keep])
+        self.probability = probabilities[keep]
+        self.evaluations = 0
+
+    # -- objective -----------------------------------------------------------
+
+    def _prefix(self, picks: List[int]):
+        """Non-binding picks sorted by utility, with prefix term sums and survival products"""
+        rest = [i for i in picks if self.kind[i] != BINDING]
+        binding = [i for i in picks if self.kind[i] == BINDING]
+        rest.sort(key=lambda i: -self.utility[i])
+
+        u, p = self.utility[rest], self.probability[rest]
+        survive = np.concatenate(([1.0], np.cumprod(1 - p)))
+        terms = np.concatenate(([0.0], np.cumsum(u * p * survive[:-1])))
+        return u, terms, survive, binding[0] if binding else None
+
+    def value(self, picks: List[int]) -> float:
+        u, terms, _, binding = self._prefix(picks)
+        value = terms[-1]
+        if binding is not None:
+            p_e = self.probability[binding]
+            value = p_e * self.utility[binding] + (1 - p_e) * value
+        return float(value)
+
+    def _values_with_each(self, picks: List[int]) -> np.ndarray:
+        """value(picks + [c]) for every candidate c, -inf where c is not allowed"""
+        self.evaluations += len(self.kind)
+        u, terms, survive, binding = self._prefix(picks)
+
+        # Non-binding candidate c slots in after every pick with utility >= u_c
+        k = np.searchsorted(-u, -self.utility, side='right')
+        p = self.probability
+        values = terms[k] + survive[k] * self.utility * p + (1 - p) * (terms[-1] - terms[k])
+        if binding is not None:
+            p_e = self.probability[binding]
+            values = p_e * self.utility[binding] + (1 - p_e) * values
+        else:
+            is_binding = self.kind == BINDING
+            values[is_binding] = (p * self.utility + (1 - p) * terms[-1])[is_binding]
+
+        return np.where(self._allowed(picks), values, -np.inf)
+
+    def _allowed(self, picks: List[int]) -> np.ndarray:
+        allowed = ~np.isin(self.school_id, self.school_id[picks])
+        kinds = set(self.kind[picks].tolist())
+        if BINDING in kinds:
+            allowed &= self.kind != BINDING
+        if RESTRICTIVE in kinds:
+            allowed &= self.kind == REGULAR
+        elif kinds & {EARLY_ACTION, BINDING}:
+            allowed &= self.kind != RESTRICTIVE
+        return allowed
+
+    # -- search --------------------------------------------------------------
+
+    def _greedy(self, picks: List[int], max_applications: int) -> List[int]:
+        picks = list(picks)
+        current = self.value(picks)
+        while len(picks) < max_applications:
+            values = self._values_with_each(picks)
+            best = int(values.argmax())
+            if values[best] <= current:
+                break
+            picks.append(best)
+            current = float(values[best])
+        return picks
+
+    def _local_search(self, picks: List[int]) -> List[int]:
+        """Swap one pick for the best allowed candidate while that improves the value"""
+        current = self.value(picks)
+        for _ in range(MAX_LOCAL_SEARCH_PASSES):
+            best_value, best_swap = current, None
+            for position in range(len(picks)):
+                others = picks[:position] + picks[position + 1:]
+                values = self._values_with_each(others)
+                candidate = int(values.argmax())
+                if values[candidate] > best_value + 1e-12:
+                    best_value, best_swap = float(values[candidate]), (position, candidate)
+            if best_swap is None:
+                break
+            position, candidate = best_swap
+            picks = picks[:position] + [candidate] + picks[position + 1:]
+            current = best_value
+        return picks
+
+    def optimize(self, max_applications: int) -> Dict:
+        started = time.perf_counter()
+
+        # Starting strategies: let greedy choose, or commit up front to one of
+        # the most valuable binding or restrictive early applications
+        standalone = self.probability * self.utility
+        starts = [[]]
+        for kind in (BINDING, RESTRICTIVE):
+            options = np.flatnonzero(self.kind == kind)
+            options = options[np.argsort(-standalone[options])][:STRATEGY_CANDIDATES]
+            starts.extend([int(i)] for i in options)
+
+        # Greedy from every start; polish only the most promising lists
+        greedy = [self._greedy(start, max_applications) for start in starts if len(start) <= max_applications]
+        greedy.sort(key=self.value, reverse=True)
+        best_picks, best_value = [], 0.0
+        for picks in greedy[:LOCAL_SEARCH_STARTS]:
+            picks = self._local_search(picks)
+            value = self.value(picks)
+            if value > best_value:
+                best_picks, best_value = picks, value
+
+        best_picks.sort(key=lambda i: (-int(self.kind[i] != REGULAR), -self.utility[i]))
+        p = self.probability[best_picks]
+        return {
+            "expected_utility": best_value,
+            "p_at_least_one_admit": float(1 - np.prod(1 - p)),
+            "strategies_tried": len(starts),
+            "evaluations": self.evaluations,
+            "search_seconds": round(time.perf_counter() - started, 4),
+            "applications": [
+                {
+                    "school": self.schools[i],
+                    "application_round": self.rounds[i],
+                    "admission_probability": round(float(self.probability[i]), 3),
+                    "utility": round(float(self.utility[i]), 4)
+                }
+                for i in best_picks
+            ]
+        }
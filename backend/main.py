@@ -7,14 +7,44 @@ COMPLETE Enhanced Backend with:
 - Application rounds (ED/EA/REA/RD)
 """
 
-from fastapi import FastAPI
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, asynccontextmanager
+from fastapi import Body, FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
+import asyncio
+import os
 import uvicorn
 
-app = FastAPI(title="College Admissions Simulator - Enhanced")
+from applicant_models import (
+    APCourse, APSubject, AdmissionResult, ApplicantData, ApplicationRound, Competition,
+    ExtracurricularActivity, FastApplicantData, Gender, RESULT_FIELDS, SUMMARY_FIELDS, fast_applicant_adapter
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global portfolio_processes
+    # Serve rule-based results right away; load the ML model in the background
+    if reloader.evaluator.ml_status == 'loading':
+        reloader.reload_in_background()
+    interval = watch_interval_from_env()
+    if interval:
+        reloader.watch(interval)
+    # Per serving process: a pool created at import would be shared by every
+    # prefork worker (and re-created in every process that imports main)
+    portfolio_processes = portfolio.process_pool_from_env()
+    yield
+    reloader.stop_watching()
+    # Before the evaluation pool, whose threads may be waiting on this one
+    if portfolio_processes:
+        portfolio.shutdown_pool(portfolio_processes)
+        portfolio_processes = None
+    evaluation_pool.shutdown()
+
+app = FastAPI(title="College Admissions Simulator - Enhanced", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -28,249 +58,691 @@ app.add_middleware(
 # ENUMS - Comprehensive Options
 # ============================================================================
 
-class Gender(str, Enum):
-    MALE = "Male"
-    FEMALE = "Female"
-    NON_BINARY = "Non-binary"
-    TRANSGENDER_MALE = "Transgender Male"
-    TRANSGENDER_FEMALE = "Transgender Female"
-    GENDERQUEER = "Genderqueer/Gender Fluid"
-    AGENDER = "Agender"
-    TWO_SPIRIT = "Two-Spirit"
-    QUESTIONING = "Questioning"
-    PREFER_NOT_TO_SAY = "Prefer not to say"
-    PREFER_TO_SELF_DESCRIBE = "Prefer to self-describe"
-
-class ApplicationRound(str, Enum):
-    ED = "Early Decision (ED)"
-    ED1 = "Early Decision I (ED1)"
-    ED2 = "Early Decision II (ED2)"
-    EA = "Early Action (EA)"
-    REA = "Restrictive Early Action (REA)"
-    SCEA = "Single-Choice Early Action (SCEA)"
-    RD = "Regular Decision (RD)"
-    ROLLING = "Rolling Admission"
-
-# All 38 AP Subjects
-class APSubject(str, Enum):
-    # Math & CS
-    CALC_AB = "AP Calculus AB"
-    CALC_BC = "AP Calculus BC"
-    STATISTICS = "AP Statistics"
-    CS_A = "AP Computer Science A"
-    CS_PRINCIPLES = "AP Computer Science Principles"
-
-    # Sciences
-    BIOLOGY = "AP Biology"
-    CHEMISTRY = "AP Chemistry"
-    PHYSICS_1 = "AP Physics 1: Algebra-Based"
-    PHYSICS_2 = "AP Physics 2: Algebra-Based"
-    PHYSICS_C_MECH = "AP Physics C: Mechanics"
-    PHYSICS_C_EM = "AP Physics C: Electricity and Magnetism"
-    ENVIRONMENTAL_SCIENCE = "AP Environmental Science"
-
-    # English
-    ENGLISH_LANG = "AP English Language and Composition"
-    ENGLISH_LIT = "AP English Literature and Composition"
-
-    # History & Social Sciences
-    US_HISTORY = "AP United States History"
-    WORLD_HISTORY = "AP World History: Modern"
-    EUROPEAN_HISTORY = "AP European History"
-    US_GOVERNMENT = "AP United States Government and Politics"
-    COMPARATIVE_GOVERNMENT = "AP Comparative Government and Politics"
-    MACROECONOMICS = "AP Macroeconomics"
-    MICROECONOMICS = "AP Microeconomics"
-    PSYCHOLOGY = "AP Psychology"
-    HUMAN_GEOGRAPHY = "AP Human Geography"
-
-    # World Languages
-    SPANISH_LANG = "AP Spanish Language and Culture"
-    SPANISH_LIT = "AP Spanish Literature and Culture"
-    FRENCH_LANG = "AP French Language and Culture"
-    GERMAN_LANG = "AP German Language and Culture"
-    ITALIAN_LANG = "AP Italian Language and Culture"
-    CHINESE_LANG = "AP Chinese Language and Culture"
-    JAPANESE_LANG = "AP Japanese Language and Culture"
-    LATIN = "AP Latin"
-
-    # Arts
-    ART_HISTORY = "AP Art History"
-    MUSIC_THEORY = "AP Music Theory"
-    STUDIO_ART_2D = "AP Studio Art: 2-D Design"
-    STUDIO_ART_3D = "AP Studio Art: 3-D Design"
-    STUDIO_ART_DRAWING = "AP Studio Art: Drawing"
-
-    # Capstone
-    SEMINAR = "AP Seminar"
-    RESEARCH = "AP Research"
+class SweepField(str, Enum):
+    SAT_SCORE = "sat_score"
+    GPA_UNWEIGHTED = "gpa_unweighted"
+    AP_COUNT = "ap_count"
+    ESSAY_QUALITY = "essay_quality"
+    LOR_QUALITY = "lor_quality"
+
+class ThresholdField(str, Enum):
+    SAT_SCORE = "sat_score"
+    GPA_UNWEIGHTED = "gpa_unweighted"
+
+COUNTRIES = [
+    "United States", "China", "India", "Canada", "United Kingdom",
+    "South Korea", "Japan", "Singapore", "Germany", "France",
+    "Australia", "Mexico", "Brazil", "Russia", "Italy",
+    "Spain", "Netherlands", "Switzerland", "Sweden", "Taiwan",
+    "Hong Kong", "Thailand", "Vietnam", "Indonesia", "Philippines",
+    "Other"
+]
+
+US_STATES = [
+    "Alabama", "Alaska", "Arizona", "Arkansas", "California",
+    "Colorado", "Connecticut", "Delaware", "Florida", "Georgia",
+    "Hawaii", "Idaho", "Illinois", "Indiana", "Iowa",
+    "Kansas", "Kentucky", "Louisiana", "Maine", "Maryland",
+    "Massachusetts", "Michigan", "Minnesota", "Mississippi", "Missouri",
+    "Montana", "Nebraska", "Nevada", "New Hampshire", "New Jersey",
+    "New Mexico", "New York", "North Carolina", "North Dakota", "Ohio",
+    "Oklahoma", "Oregon", "Pennsylvania", "Rhode Island", "South Carolina",
+    "South Dakota", "Tennessee", "Texas", "Utah", "Vermont",
+    "Virginia", "Washington", "West Virginia", "Wisconsin", "Wyoming",
+    "Washington D.C.", "Puerto Rico"
+]
 
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
-class APCourse(BaseModel):
-    subject: APSubject
-    score: int = Field(ge=1, le=5)
-    year_taken: str = Field(description="9th, 10th, 11th, or 12th")
-
-class ExtracurricularActivity(BaseModel):
-    activity_name: str
-    role: str
-    years_participated: float = Field(ge=0, le=4)
-    hours_per_week: int = Field(ge=0)
-    description: str
-
-class Competition(BaseModel):
-    name: str
-    level: str = Field(description="school, regional, state, national, or international")
-    award: str
-    year: str
-
-class ApplicantData(BaseModel):
-    # Demographics - Specific Location
-    country: str = Field(description="Specific country (e.g., 'United States', 'China', 'India', 'Canada', 'United Kingdom')")
-    state_province: str = Field(description="Specific state/province (e.g., 'California', 'New York', 'Beijing', 'Ontario')")
-    city: str
-
-    gender: Gender
-    ethnicity: List[str] = Field(description="Can select multiple: Asian, White, Hispanic/Latino, Black/African American, Native American, Pacific Islander, Middle Eastern, Other")
-    first_generation: bool
-    legacy_status: bool
-    recruited_athlete: bool
-
-    # Target School & Application
-    target_school: str = Field(description="Select from Top 50 US universities")
-    target_major: str
-    target_degree: str = Field(description="Bachelor of Arts (BA) or Bachelor of Science (BS)")
-    application_round: ApplicationRound
-
-    # Socioeconomic
-    family_income_bracket: str = Field(description="<$30k, $30k-$75k, $75k-$150k, $150k-$250k, >$250k")
-    fee_waiver: bool
-
-    # High School
-    high_school_name: str
-    high_school_type: str = Field(description="public, private, charter, international, homeschool")
-    high_school_ranking: Optional[str] = Field(None, description="top 1%, top 5%, top 10%, etc.")
-    class_size: Optional[int] = None
-    class_rank: Optional[int] = None
-
-    # Academic Metrics
-    gpa_unweighted: float = Field(ge=0.0, le=4.0)
-    gpa_weighted: Optional[float] = Field(None, ge=0.0, le=5.0)
-    gpa_trend: str = Field(description="upward, stable, downward")
-    gpa_by_year: Dict[str, float] = Field(description="{'9th': 3.7, '10th': 3.85, '11th': 3.95, '12th': 4.0}")
-
-    ap_courses: List[APCourse] = Field(description="List of AP courses with specific subjects")
-    honors_courses: int = Field(ge=0)
-    ib_diploma: bool
-    ib_score: Optional[int] = Field(None, ge=0, le=45)
-
-    sat_score: Optional[int] = Field(None, ge=400, le=1600)
-    sat_math: Optional[int] = Field(None, ge=200, le=800)
-    sat_ebrw: Optional[int] = Field(None, ge=200, le=800)
-    act_score: Optional[int] = Field(None, ge=1, le=36)
-    sat_subject_tests: List[Dict[str, int]] = Field(default=[])
-
-    toefl_score: Optional[int] = Field(None, ge=0, le=120)
-    ielts_score: Optional[float] = Field(None, ge=0.0, le=9.0)
-    duolingo_score: Optional[int] = Field(None, ge=10, le=160)
-
-    curriculum_difficulty: str = Field(description="low, medium, high, very_high")
-
-    # Research & Activities
-    research_experience: str
-    research_publications: List[str] = Field(default=[])
-    research_presentations: List[str] = Field(default=[])
-    independent_projects: List[str] = Field(default=[])
-
-    extracurriculars: List[ExtracurricularActivity]
-    competitions: List[Competition]
-    academic_honors: List[str] = Field(default=[])
-
-    work_experience: List[str] = Field(default=[])
-    community_service_hours: int = Field(ge=0)
-    community_service_description: str
-    summer_activities: List[str]
-
-    # Application Materials
-    lor_quality: int = Field(ge=1, le=5)
-    lor_sources: List[str]
-    essay_quality: int = Field(ge=1, le=5)
-    essay_topics: List[str]
-    supplemental_materials: List[str] = Field(default=[])
-
-    # Demonstrated Interest
-    campus_visit: bool
-    interview_completed: bool
-    contacted_admissions: bool
-    attended_info_sessions: int = Field(ge=0)
-
-class AdmissionResult(BaseModel):
+class PreviewResult(AdmissionResult):
+    session_id: str
+    recomputed: List[str] = Field(description="Components recomputed for this edit (academic, extracurricular, application, demographic, ml)")
+
+class PreviewSessionCreated(BaseModel):
+    session_id: str
+
+class SchoolChance(BaseModel):
+    school: str
     decision: str
     admission_probability: float
-    reasoning: List[str]
-    detailed_analysis: Dict[str, str]
-    strengths: List[str]
-    weaknesses: List[str]
-    score_breakdown: dict
-    advice: List[str]
-    fit_analysis: Dict[str, str]
-    application_round_impact: Dict[str, Any]
+    rule_based_probability: float
+    academic_score: float
+    total_score: float
+    round_multiplier: float
+
+class AllSchoolsResult(BaseModel):
+    application_round: str
+    shared_scores: Dict[str, float]
+    ml_info: Dict[str, Any]
+    schools: List[SchoolChance]
+
+class SweepAxis(BaseModel):
+    field: SweepField
+    start: float
+    stop: float
+    steps: int = Field(11, ge=1, le=100, description="Evenly spaced values from start to stop, inclusive")
+
+class SweepRequest(BaseModel):
+    applicant: ApplicantData
+    axes: List[SweepAxis] = Field(min_length=1, max_length=2)
+
+class SweepResult(BaseModel):
+    school: str
+    application_round: str
+    round_multiplier: float
+    axes: List[Dict[str, Any]]
+    # probabilities[i] (one axis) or probabilities[i][j] (two axes)
+    probabilities: List[Any]
+    rule_based_probabilities: List[Any]
+    ml_probabilities: Optional[List[Any]]
     ml_info: Dict[str, Any]
 
+class ThresholdRequest(BaseModel):
+    applicant: ApplicantData
+    field: ThresholdField
+    target_probability: float = Field(gt=0.0, le=1.0)
+
+class SchoolThreshold(BaseModel):
+    school: str
+    minimum_value: Optional[float]
+    probability_at_minimum: Optional[float]
+    stays_above_target: bool
+    max_probability: float
+    round_multiplier: float
+
+class ThresholdResult(BaseModel):
+    field: str
+    target_probability: float
+    application_round: str
+    resolution: float
+    ml_info: Dict[str, Any]
+    schools: List[SchoolThreshold]
+
+class PortfolioEntry(BaseModel):
+    school: str
+    application_round: ApplicationRound = ApplicationRound.RD
+
+class PortfolioRequest(BaseModel):
+    applicant: ApplicantData
+    schools: List[PortfolioEntry] = Field(min_length=1, max_length=50)
+    draws: int = Field(100_000, ge=1, le=2_000_000)
+    correlation: float = Field(0.3, ge=0.0, le=1.0, description="How strongly outcomes move together (shared applicant-strength factor)")
+    seed: Optional[int] = Field(None, ge=0)
+
+class PortfolioSchool(BaseModel):
+    school: str
+    application_round: str
+    admission_probability: float
+    simulated_admit_rate: float
+
+class PortfolioResult(BaseModel):
+    draws: int
+    correlation: float
+    seed: int
+    p_at_least_one_admit: float
+    p_at_least_one_admit_stderr: float
+    expected_admits: float
+    p_top_school_admit: Optional[float]
+    admit_count_distribution: List[float]
+    ml_info: Dict[str, Any]
+    schools: List[PortfolioSchool]
+
+class ListOptimizationRequest(BaseModel):
+    applicant: ApplicantData
+    max_applications: int = Field(12, ge=1, le=30)
+    utilities: Optional[Dict[str, float]] = Field(
+        None, description="How much each school is worth to the applicant (0 excludes it); unlisted schools default to a rank-based value"
+    )
+
+class RecommendedApplication(BaseModel):
+    school: str
+    application_round: str
+    admission_probability: float
+    utility: float
+
+class ListOptimizationResult(BaseModel):
+    expected_utility: float
+    p_at_least_one_admit: float
+    strategies_tried: int
+    evaluations: int
+    search_seconds: float
+    ml_info: Dict[str, Any]
+    applications: List[RecommendedApplication]
+
+class SimilarSchool(BaseModel):
+    school: str
+    distance: float
+    admission_probability: Optional[float] = None
+
+class SimilarSchoolsRequest(BaseModel):
+    applicant: ApplicantData
+    k: int = Field(10, ge=1, le=50)
+    better_odds_only: bool = Field(False, description="Only schools where the applicant's odds beat the reference school's")
+
+class SimilarSchoolsResult(BaseModel):
+    school: str
+    admission_probability: Optional[float] = None
+    similar: List[SimilarSchool]
+
 # ============================================================================
 # EVALUATOR (Import from evaluator)
 # ============================================================================
 
-from evaluator import Top50AdmissionsEvaluator
+from evaluator import NARRATIVE_FIELDS, Top50AdmissionsEvaluator
+from hot_reload import EvaluatorReloader, watch_interval_from_env
+from catalog import PrecomputedJSON
+from evaluation_pool import PoolBusy, pool_from_env
+from ml_batcher import batcher_from_env
+from preview_session import PreviewSessions
+from result_cache import CachedEvaluation, cache_from_env, profile_key
+from sample_profiles import sample_applicant_payload
+import applicant_io
+from sweep import axis_values
+import portfolio
+from list_optimizer import ListOptimizer
+from similar_schools import SimilarSchools
+
+# Routes read reloader.evaluator once per request, so a hot reload never
+# changes the evaluator underneath a request that is already running.
+# The first evaluator is rule-based only; the model warms up at startup.
+reloader = EvaluatorReloader(
+    Top50AdmissionsEvaluator(load_model=False),
+    smoke_applicant=ApplicantData(**sample_applicant_payload())
+)
 
-evaluator = Top50AdmissionsEvaluator()
+# Evaluation runs on a bounded thread pool so CPU-bound scoring never blocks
+# the event loop; requests beyond the pool's capacity get 503
+evaluation_pool = pool_from_env()
+
+# Concurrent single-applicant requests share one ML prediction per batch
+ml_batcher = batcher_from_env(evaluation_pool.executor)
+
+def _server_busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Server is busy evaluating other applicants, please retry",
+        headers={"Retry-After": "1"}
+    )
+
+# Results keyed by the scoring-relevant profile and evaluator version;
+# cleared whenever a reload swaps in new data or a new model
+result_cache = cache_from_env()
+reloader.add_listener(result_cache.clear)
+
+DETAIL_QUERY = Query("full", pattern="^(full|summary)$", description="summary: probability and scores only, no narrative")
+FIELDS_QUERY = Query(None, description="Comma-separated result fields to return, e.g. admission_probability,score_breakdown")
+
+def _requested_fields(detail: str, fields: Optional[str]) -> Optional[List[str]]:
+    """Result keys to return, or None for the whole result"""
+    if fields:
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in RESULT_FIELDS]
+        if unknown:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unknown result fields: {', '.join(unknown)} (choose from {', '.join(RESULT_FIELDS)})"
+            )
+        return requested
+    if detail == "summary":
+        return SUMMARY_FIELDS
+    return None
+
+def _needs_narrative(requested: Optional[List[str]]) -> bool:
+    return requested is None or any(name in NARRATIVE_FIELDS for name in requested)
+
+def _partial(result: Dict, requested: List[str], evaluation_id: Optional[str] = None) -> Dict:
+    return {**{name: result[name] for name in requested}, "evaluation_id": evaluation_id}
+
+def _respond(result: Dict, requested: Optional[List[str]], evaluation_id: Optional[str]):
+    if requested is None:
+        return {**result, "evaluation_id": evaluation_id}
+    return JSONResponse(_partial(result, requested, evaluation_id))
 
 @app.post("/evaluate", response_model=AdmissionResult)
-async def evaluate_applicant(applicant: ApplicantData):
-    result = evaluator.evaluate(applicant)
-    return result
+async def evaluate_applicant(applicant: FastApplicantData = Body(), detail: str = DETAIL_QUERY,
+                             fields: Optional[str] = FIELDS_QUERY):
+    requested = _requested_fields(detail, fields)
+    narrative = _needs_narrative(requested)
+
+    evaluator = reloader.evaluator
+    cache_key = profile_key(applicant, evaluator.version) if result_cache.enabled else None
+    cached = result_cache.get(cache_key) if cache_key else None
+    if cached is not None and (not narrative or "reasoning" in cached.result):
+        return _respond(cached.result, requested, cache_key)
+
+    try:
+        with evaluation_pool.admit():
+            if cached is not None:
+                # Cached without the narrative: complete it, reusing the ML prediction
+                ml_probability = cached.ml_probability
+            elif applicant.target_school in evaluator.school_table.index:
+                ml_probability = await ml_batcher.predict(evaluator.hybrid_predictor, applicant)
+            else:
+                ml_probability = None
+            result = await evaluation_pool.run(
+                evaluator.evaluate, applicant, ml_probability=ml_probability, narrative=narrative
+            )
+    except PoolBusy:
+        raise _server_busy()
+
+    # Don't pin a rule-based fallback caused by a transient ML failure
+    ml_failed = evaluator.ml_status == 'ready' and result['ml_info'].get('method') == 'rule_based_only'
+    if cache_key and not ml_failed:
+        result_cache.put(cache_key, CachedEvaluation(result, applicant, ml_probability))
+        return _respond(result, requested, cache_key)
+    return _respond(result, requested, None)
+
+@app.get("/evaluations/{evaluation_id}", response_model=AdmissionResult)
+async def get_evaluation(evaluation_id: str, detail: str = DETAIL_QUERY, fields: Optional[str] = FIELDS_QUERY):
+    """A result returned earlier by /evaluate, generating its narrative now if it was skipped"""
+    requested = _requested_fields(detail, fields)
+    cached = result_cache.get(evaluation_id)
+    if cached is None:
+        raise HTTPException(status_code=404, detail="Evaluation not found or expired")
+
+    result = cached.result
+    if _needs_narrative(requested) and "reasoning" not in result:
+        evaluator = reloader.evaluator
+        if profile_key(cached.applicant, evaluator.version) != evaluation_id:
+            # Evaluated with data or a model that has since been swapped out
+            raise HTTPException(status_code=404, detail="Evaluation not found or expired")
+        try:
+            with evaluation_pool.admit():
+                result = await evaluation_pool.run(
+                    evaluator.evaluate, cached.applicant, ml_probability=cached.ml_probability
+                )
+        except PoolBusy:
+            raise _server_busy()
+        result_cache.put(evaluation_id, cached._replace(result=result))
+
+    return _respond(result, requested, evaluation_id)
+
+@app.post("/evaluate/batch", response_model=List[AdmissionResult])
+async def evaluate_applicants_batch(applicants: List[ApplicantData], detail: str = DETAIL_QUERY,
+                                    fields: Optional[str] = FIELDS_QUERY):
+    """Evaluate many applicants in one request (vectorized scoring, one ML call)"""
+    requested = _requested_fields(detail, fields)
+    try:
+        with evaluation_pool.admit():
+            results = await evaluation_pool.run(
+                reloader.evaluator.evaluate_batch, applicants, narrative=_needs_narrative(requested)
+            )
+    except PoolBusy:
+        raise _server_busy()
+    if requested is None:
+        return results
+    return JSONResponse([_partial(result, requested) for result in results])
+
+# Records validated and scored per evaluate_batch() call on /evaluate/stream
+STREAM_CHUNK_SIZE = 256
+
+def _score_stream_chunk(evaluator: Top50AdmissionsEvaluator, records: List[applicant_io.Record],
+                        requested: Optional[List[str]]) -> Tuple[bytes, int, int]:
+    """Validate and score one chunk of uploaded records: (NDJSON lines in upload order, scored, errors)"""
+    rows, scored, errors = applicant_io.score_records(
+        evaluator, fast_applicant_adapter.validate_python, records, requested or RESULT_FIELDS,
+        _needs_narrative(requested)
+    )
+    return b"".join(applicant_io.ndjson_line(row) for row in rows), scored, errors
+
+class UploadStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse for generators that are still reading the request body:
+    the stock disconnect listener would consume body messages, so it only
+    starts once body_read is set (until then request.stream() itself raises
+    ClientDisconnect if the client goes away)
+    """
+
+    def __init__(self, content, **kwargs):
+        super().__init__(content, **kwargs)
+        self.body_read = asyncio.Event()
+
+    async def listen_for_disconnect(self, receive):
+        await self.body_read.wait()
+        await super().listen_for_disconnect(receive)
+
+@app.post("/evaluate/stream")
+async def evaluate_stream(request: Request, format: Optional[str] = Query(None, pattern="^(ndjson|csv)$"),
+                          detail: str = DETAIL_QUERY, fields: Optional[str] = FIELDS_QUERY):
+    """
+    Score an NDJSON or CSV upload of any size (see applicant_io for the
+    formats), streaming back one NDJSON line per record:
+    {"line": n, "result": {...}} or {"line": n, "error": ...}, then a final
+    {"summary": {...}}. The body is read only as fast as chunks are scored,
+    and at most one chunk per pool worker (plus one) is in flight, so memory
+    stays flat however large the upload is. Output follows upload order.
+    """
+    requested = _requested_fields(detail, fields)
+    fmt = format or applicant_io.format_for(request.headers.get("content-type"))
+    evaluator = reloader.evaluator
+
+    # The stream holds one pool slot from here until its last line is sent
+    slot = ExitStack()
+    try:
+        slot.enter_context(evaluation_pool.admit())
+    except PoolBusy:
+        raise _server_busy()
+
+    async def lines():
+        in_flight = []
+        counts = {"records": 0, "scored": 0, "errors": 0}
+        max_in_flight = max(evaluation_pool.workers, 1) + 1
+
+        async def drain_oldest():
+            output, scored, errors = await in_flight.pop(0)
+            counts["scored"] += scored
+            counts["errors"] += errors
+            return output
+
+        try:
+            chunk = []
+            async for record in applicant_io.aread_records(request.stream(), fmt, ApplicantData):
+                counts["records"] += 1
+                chunk.append(record)
+                if len(chunk) < STREAM_CHUNK_SIZE:
+                    continue
+                in_flight.append(asyncio.ensure_future(
+                    evaluation_pool.run(_score_stream_chunk, evaluator, chunk, requested)))
+                chunk = []
+                if len(in_flight) >= max_in_flight:
+                    yield await drain_oldest()
+            response.body_read.set()
+            if chunk:
+                in_flight.append(asyncio.ensure_future(
+                    evaluation_pool.run(_score_stream_chunk, evaluator, chunk, requested)))
+            while in_flight:
+                yield await drain_oldest()
+            yield applicant_io.ndjson_line({"summary": {"format": fmt, **counts}})
+        finally:
+            for task in in_flight:
+                task.cancel()
+            slot.close()
+
+    response = UploadStreamingResponse(lines(), media_type="application/x-ndjson")
+    return response
+
+@app.post("/evaluate/all-schools", response_model=AllSchoolsResult)
+async def evaluate_all_schools(applicant: ApplicantData):
+    """Evaluate one applicant against every school (target_school is ignored)"""
+    evaluator = reloader.evaluator
+    try:
+        with evaluation_pool.admit():
+            ml_probability = await ml_batcher.predict(evaluator.hybrid_predictor, applicant)
+            return await evaluation_pool.run(
+                evaluator.evaluate_all_schools, applicant, ml_probability=ml_probability
+            )
+    except PoolBusy:
+        raise _server_busy()
+
+@app.post("/evaluate/sweep", response_model=SweepResult)
+async def evaluate_sweep(request: SweepRequest):
+    """
+    Admission probability over a grid of one or two numeric fields (SAT,
+    GPA, AP count, essay/LOR quality), all other fields as submitted
+    """
+    fields = [axis.field.value for axis in request.axes]
+    if len(set(fields)) != len(fields):
+        raise HTTPException(status_code=422, detail="Each field can only be swept once")
+    try:
+        axes = [(axis.field.value, axis_values(axis.field.value, axis.start, axis.stop, axis.steps))
+                for axis in request.axes]
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    evaluator = reloader.evaluator
+    if request.applicant.target_school not in evaluator.school_table.index:
+        raise HTTPException(status_code=404, detail=f"School '{request.applicant.target_school}' not found in database")
+
+    try:
+        with evaluation_pool.admit():
+            return await evaluation_pool.run(evaluator.evaluate_sweep, request.applicant, axes)
+    except PoolBusy:
+        raise _server_busy()
+
+@app.post("/evaluate/threshold", response_model=ThresholdResult)
+async def evaluate_threshold(request: ThresholdRequest):
+    """
+    Lowest SAT or GPA at which the admission probability reaches the target,
+    for every school (the applicant's target_school is ignored)
+    """
+    evaluator = reloader.evaluator
+    try:
+        with evaluation_pool.admit():
+            return await evaluation_pool.run(
+                evaluator.evaluate_thresholds, request.applicant, request.field.value, request.target_probability
+            )
+    except PoolBusy:
+        raise _server_busy()
+
+# Large simulations can be spread over PORTFOLIO_PROCESSES worker processes;
+# the pool is created by lifespan() in each serving process
+portfolio_processes: Optional[ProcessPoolExecutor] = None
+
+def _simulate_portfolio(evaluator: Top50AdmissionsEvaluator, request: PortfolioRequest) -> Dict:
+    entries = [(entry.school, entry.application_round.value) for entry in request.schools]
+    probabilities, ml_info = evaluator.list_probabilities(request.applicant, entries)
+    ranks = evaluator.school_table.rank[[evaluator.school_table.index[name] for name, _ in entries]]
+
+    summary = portfolio.simulate(
+        probabilities.tolist(), ranks <= portfolio.TOP_SCHOOL_RANK, request.draws,
+        request.correlation, request.seed, executor=portfolio_processes
+    )
+    schools = [
+        {
+            "school": name,
+            "application_round": round_name,
+            "admission_probability": round(probability, 3),
+            "simulated_admit_rate": round(rate, 4)
+        }
+        for (name, round_name), probability, rate in zip(entries, probabilities.tolist(), summary.pop('school_admit_rates'))
+    ]
+    return {**summary, "ml_info": ml_info, "schools": schools}
+
+@app.post("/simulate/portfolio", response_model=PortfolioResult)
+async def simulate_portfolio(request: PortfolioRequest):
+    """
+    Monte Carlo outcomes for a college list: P(at least one admit), expected
+    admits and P(admit to a top-10 school), with correlated decisions
+    """
+    evaluator = reloader.evaluator
+    unknown = [entry.school for entry in request.schools if entry.school not in evaluator.school_table.index]
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Schools not found in database: {', '.join(unknown)}")
+
+    try:
+        with evaluation_pool.admit():
+            return await evaluation_pool.run(_simulate_portfolio, evaluator, request)
+    except PoolBusy:
+        raise _server_busy()
+
+def _optimize_list(evaluator: Top50AdmissionsEvaluator, request: ListOptimizationRequest) -> Dict:
+    optimizer = ListOptimizer(evaluator, request.applicant, request.utilities)
+    return {**optimizer.optimize(request.max_applications), "ml_info": optimizer.ml_info}
+
+@app.post("/recommend/list", response_model=ListOptimizationResult)
+async def recommend_list(request: ListOptimizationRequest):
+    """
+    Schools and rounds that maximize the expected value of the best admission,
+    respecting one binding ED and REA/SCEA exclusivity
+    """
+    evaluator = reloader.evaluator
+    unknown = [name for name in request.utilities or {} if name not in evaluator.school_table.index]
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Schools not found in database: {', '.join(unknown)}")
+    if any(utility < 0 for utility in (request.utilities or {}).values()):
+        raise HTTPException(status_code=422, detail="Utilities must not be negative")
+
+    try:
+        with evaluation_pool.admit():
+            return await evaluation_pool.run(_optimize_list, evaluator, request)
+    except PoolBusy:
+        raise _server_busy()
+
+# Live preview: each session reuses the component scores an edit didn't touch
+preview_sessions = PreviewSessions(
+    max_sessions=int(os.environ.get('PREVIEW_MAX_SESSIONS', 1000)),
+    idle_ttl=float(os.environ.get('PREVIEW_SESSION_TTL', 1800))
+)
+
+@app.post("/preview/sessions", response_model=PreviewSessionCreated, status_code=201)
+async def create_preview_session():
+    """Start a live-preview session for one form"""
+    return {"session_id": preview_sessions.create().session_id}
+
+@app.post("/preview/sessions/{session_id}", response_model=PreviewResult)
+async def preview_evaluate(session_id: str, applicant: ApplicantData):
+    """Evaluate the current form state, recomputing only components whose inputs changed"""
+    session = preview_sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Preview session not found or expired")
+
+    try:
+        with evaluation_pool.admit():
+            result, recomputed = await evaluation_pool.run(session.evaluate, reloader.evaluator, applicant)
+    except PoolBusy:
+        raise _server_busy()
+    return {**result, "session_id": session_id, "recomputed": recomputed}
+
+@app.delete("/preview/sessions/{session_id}", status_code=204)
+async def delete_preview_session(session_id: str):
+    if not preview_sessions.delete(session_id):
+        raise HTTPException(status_code=404, detail="Preview session not found or expired")
+
+# Catalog lists are encoded once and served with ETags (304 on a match).
+# /schools is rebuilt whenever a reload swaps in new school data.
+def build_catalog(evaluator: Top50AdmissionsEvaluator) -> Dict[str, PrecomputedJSON]:
+    return {
+        "/schools": PrecomputedJSON(evaluator.get_available_schools()),
+        "/ap-subjects": PrecomputedJSON([subject.value for subject in APSubject]),
+        "/countries": PrecomputedJSON(COUNTRIES),
+        "/us-states": PrecomputedJSON(US_STATES),
+    }
+
+catalog = build_catalog(reloader.evaluator)
+
+def _rebuild_catalog(evaluator: Top50AdmissionsEvaluator):
+    global catalog
+    catalog = build_catalog(evaluator)
+
+reloader.add_listener(_rebuild_catalog)
 
 @app.get("/schools")
-async def get_schools():
+async def get_schools(if_none_match: Optional[str] = Header(None)):
     """Get list of all Top 50 universities"""
-    return evaluator.get_available_schools()
+    return catalog["/schools"].response(if_none_match)
 
 @app.get("/ap-subjects")
-async def get_ap_subjects():
+async def get_ap_subjects(if_none_match: Optional[str] = Header(None)):
     """Get list of all 38 AP subjects"""
-    return [subject.value for subject in APSubject]
+    return catalog["/ap-subjects"].response(if_none_match)
 
 @app.get("/countries")
-async def get_countries():
+async def get_countries(if_none_match: Optional[str] = Header(None)):
     """Get list of common countries"""
-    return [
-        "United States", "China", "India", "Canada", "United Kingdom",
-        "South Korea", "Japan", "Singapore", "Germany", "France",
-        "Australia", "Mexico", "Brazil", "Russia", "Italy",
-        "Spain", "Netherlands", "Switzerland", "Sweden", "Taiwan",
-        "Hong Kong", "Thailand", "Vietnam", "Indonesia", "Philippines",
-        "Other"
-    ]
+    return catalog["/countries"].response(if_none_match)
 
 @app.get("/us-states")
-async def get_us_states():
+async def get_us_states(if_none_match: Optional[str] = Header(None)):
     """Get list of US states"""
-    return [
-        "Alabama", "Alaska", "Arizona", "Arkansas", "California",
-        "Colorado", "Connecticut", "Delaware", "Florida", "Georgia",
-        "Hawaii", "Idaho", "Illinois", "Indiana", "Iowa",
-        "Kansas", "Kentucky", "Louisiana", "Maine", "Maryland",
-        "Massachusetts", "Michigan", "Minnesota", "Mississippi", "Missouri",
-        "Montana", "Nebraska", "Nevada", "New Hampshire", "New Jersey",
-        "New Mexico", "New York", "North Carolina", "North Dakota", "Ohio",
-        "Oklahoma", "Oregon", "Pennsylvania", "Rhode Island", "South Carolina",
-        "South Dakota", "Tennessee", "Texas", "Utah", "Vermont",
-        "Virginia", "Washington", "West Virginia", "Wisconsin", "Wyoming",
-        "Washington D.C.", "Puerto Rico"
-    ]
+    return catalog["/us-states"].response(if_none_match)
+
+# Nearest-neighbour index over the school table, rebuilt with the catalog
+similar_schools = SimilarSchools(reloader.evaluator.school_table)
+
+def _rebuild_similar_schools(evaluator: Top50AdmissionsEvaluator):
+    global similar_schools
+    similar_schools = SimilarSchools(evaluator.school_table)
+
+reloader.add_listener(_rebuild_similar_schools)
+
+# Candidates re-ranked by probability: the nearest max(k * this, 20) schools
+SIMILAR_RERANK_POOL = 3
+
+@app.get("/schools/{school_name}/similar", response_model=SimilarSchoolsResult)
+async def get_similar_schools(school_name: str, k: int = Query(10, ge=1, le=50)):
+    """The k schools most like school_name (acceptance rate, SAT/GPA, rank, rounds, need-blind)"""
+    index = similar_schools
+    if school_name not in index.table.index:
+        raise HTTPException(status_code=404, detail=f"School '{school_name}' not found in database")
+    return {"school": school_name, "similar": index.similar(school_name, k)}
+
+def _similar_by_odds(evaluator: Top50AdmissionsEvaluator, index: SimilarSchools,
+                     school_name: str, request: SimilarSchoolsRequest) -> Dict:
+    candidates = index.similar(school_name, max(request.k * SIMILAR_RERANK_POOL, 20))
+    round_name = request.applicant.application_round
+    probabilities, _ = evaluator.list_probabilities(
+        request.applicant, [(school_name, round_name)] + [(c["school"], round_name) for c in candidates]
+    )
+    reference = round(float(probabilities[0]), 3)
+    for candidate, probability in zip(candidates, probabilities[1:].tolist()):
+        candidate["admission_probability"] = round(probability, 3)
+    if request.better_odds_only:
+        candidates = [c for c in candidates if c["admission_probability"] > reference]
+    candidates.sort(key=lambda c: (-c["admission_probability"], c["distance"]))
+    return {"school": school_name, "admission_probability": reference, "similar": candidates[:request.k]}
+
+@app.post("/schools/{school_name}/similar", response_model=SimilarSchoolsResult)
+async def get_similar_schools_by_odds(school_name: str, request: SimilarSchoolsRequest):
+    """Schools like school_name, re-ranked by the applicant's admission probability"""
+    evaluator, index = reloader.evaluator, similar_schools
+    if school_name not in index.table.index or school_name not in evaluator.school_table.index:
+        raise HTTPException(status_code=404, detail=f"School '{school_name}' not found in database")
+
+    try:
+        with evaluation_pool.admit():
+            return await evaluation_pool.run(_similar_by_odds, evaluator, index, school_name, request)
+    except PoolBusy:
+        raise _server_busy()
+
+# ============================================================================
+# ADMIN
+# ============================================================================
+
+def _check_admin_token(token: Optional[str]):
+    """If ADMIN_TOKEN is set, admin routes require a matching X-Admin-Token header"""
+    expected = os.environ.get("ADMIN_TOKEN")
+    if expected and token != expected:
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+@app.post("/admin/reload", status_code=202)
+async def reload_data(x_admin_token: Optional[str] = Header(None)):
+    """Reload school data and ML model in the background, then swap them in"""
+    _check_admin_token(x_admin_token)
+    if not reloader.reload_in_background():
+        raise HTTPException(status_code=409, detail="A reload is already in progress")
+    return reloader.status
+
+@app.get("/admin/reload")
+async def reload_status(x_admin_token: Optional[str] = Header(None)):
+    """Status and version of the live school data and ML model"""
+    _check_admin_token(x_admin_token)
+    return reloader.status
+
+@app.get("/admin/metrics")
+async def metrics(x_admin_token: Optional[str] = Header(None)):
+    """Serving metrics (evaluation pool load, result cache, ML batch size distribution)"""
+    _check_admin_token(x_admin_token)
+    return {
+        "evaluation_pool": evaluation_pool.stats,
+        "result_cache": result_cache.stats,
+        "ml_batching": ml_batcher.stats
+    }
+
+@app.get("/ready")
+async def ready():
+    """Readiness probe: 200 once the ML model has finished warming up, 503 before"""
+    evaluator = reloader.evaluator
+    is_ready = evaluator.ml_status != 'loading'
+    body = {
+        "ready": is_ready,
+        "ml_status": evaluator.ml_status,
+        "stage": reloader.status['stage'],
+        "version": evaluator.version,
+        "last_error": reloader.status['last_error']
+    }
+    return JSONResponse(body, status_code=200 if is_ready else 503)
 
 @app.get("/")
 async def root():
@@ -0,0 +1,152 @@
+"""
+Micro-batching of ML predictions across concurrent requests
+
+Each /evaluate call used to run its own one-row model prediction. MLBatcher
+collects the ML requests that arrive within a short window (max_wait seconds,
+or until max_batch_size rows are waiting), scores them with one
+get_ml_predictions() call and resolves every caller's future with its row.
+
+Batched probabilities are identical to get_ml_prediction() for the same
+applicant, so batching changes latency, not results. With an executor the
+batch runs on a worker thread instead of the event loop.
+"""
+
+import asyncio
+import os
+from collections import Counter
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Tuple
+
+
+class MLBatcher:
+    """
+    Runs on the event loop: predict() must be awaited from the loop thread.
+    max_batch_size <= 1 disables batching (every call predicts immediately).
+    """
+
+    def __init__(self, max_batch_size: int = 32, max_wait: float = 0.002,
+                 executor: Optional[Executor] = None):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.executor = executor
+        self._pending: List[Tuple[object, object, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self.batch_sizes = Counter()
+        self.flushes = {'full': 0, 'timeout': 0}
+        self.failed_batches = 0
+
+    async def predict(self, predictor, applicant) -> Optional[float]:
+        """ML probability for applicant (None if the model is unavailable or fails)"""
+        if predictor is None or not predictor.ml_available:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self.max_batch_size <= 1:
+            self.batch_sizes[1] += 1
+            if self.executor is None:
+                return predictor.get_ml_prediction(applicant)
+            return await loop.run_in_executor(self.executor, predictor.get_ml_prediction, applicant)
+
+        future = loop.create_future()
+        self._pending.append((predictor, applicant, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush('full')
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush, 'timeout')
+
+        return await future
+
+    def _flush(self, reason: str):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        self.flushes[reason] += 1
+        self.batch_sizes[len(pending)] += 1
+
+        if self.executor is None:
+            try:
+                self._resolve(pending, *self._score(pending))
+            except Exception as e:
+                self._fail(pending, e)
+            return
+        try:
+            scored = asyncio.get_running_loop().run_in_executor(self.executor, self._score, pending)
+        except RuntimeError as e:
+            # The executor has been shut down
+            self._fail(pending, e)
+            return
+        scored.add_done_callback(lambda done: self._scored(pending, done))
+
+    def _scored(self, pending: List, done: asyncio.Future):
+        if done.cancelled():
+            self._fail(pending, None)
+        elif done.exception() is not None:
+            self._fail(pending, done.exception())
+        else:
+            self._resolve(pending, *done.result())
+
+    def _fail(self, pending: List, error: Optional[BaseException]):
+        """The batch job raised or was cancelled: callers fall back to rule-based results"""
+        if error is not None:
+            print(f"ML batch of {len(pending)} failed, using rule-based results: {type(error).__name__}: {error}")
+        self._resolve(pending, [None] * len(pending), 1)
+
+    @staticmethod
+    def _score(pending: List) -> Tuple[List[Optional[float]], int]:
+        """Probabilities in pending order, plus the number of failed model calls"""
+        # A hot reload can swap the predictor mid-window; score each
+        # request with the predictor it was submitted with
+        groups: Dict[int, List[int]] = {}
+        for i, (predictor, _, _) in enumerate(pending):
+            groups.setdefault(id(predictor), []).append(i)
+
+        results = [None] * len(pending)
+        failed = 0
+        for indices in groups.values():
+            predictor = pending[indices[0]][0]
+            probabilities = predictor.get_ml_predictions([pending[i][1] for i in indices])
+            if probabilities is None:
+                failed += 1
+                continue
+            for i, probability in zip(indices, probabilities):
+                results[i] = probability
+        return results, failed
+
+    def _resolve(self, pending: List, results: List[Optional[float]], failed: int):
+        self.failed_batches += failed
+        for (_, _, future), probability in zip(pending, results):
+            if not future.done():
+                # done() here means the caller went away (request cancelled)
+                future.set_result(probability)
+
+    @property
+    def stats(self) -> Dict:
+        """Batch size distribution and flush counts"""
+        batches = sum(self.batch_sizes.values())
+        rows = sum(size * count for size, count in self.batch_sizes.items())
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000,
+            'batches': batches,
+            'rows': rows,
+            'mean_batch_size': round(rows / batches, 2) if batches else 0.0,
+            'batch_size_histogram': {str(size): self.batch_sizes[size] for size in sorted(self.batch_sizes)},
+            'flushes': dict(self.flushes),
+            'failed_batches': self.failed_batches
+        }
+
+
+def batcher_from_env(executor: Optional[Executor] = None) -> MLBatcher:
+    """ML_BATCH_MAX_SIZE (rows, default 32; 1 disables) and ML_BATCH_MAX_WAIT_MS (default 2)"""
+    return MLBatcher(
+        max_batch_size=int(os.environ.get('ML_BATCH_MAX_SIZE', 32)),
+        max_wait=float(os.environ.get('ML_BATCH_MAX_WAIT_MS', 2)) / 1000,
+        executor=executor
+    )
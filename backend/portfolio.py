@@ -0,0 +1,130 @@
+"""
+Monte Carlo simulation of a whole college list
+
+Admissions decisions for one applicant are not independent: a profile that
+impresses one committee tends to impress the others. Each simulated
+admissions cycle therefore draws one shared applicant-strength latent z and
+one idiosyncratic term e_i per school, and school i admits when
+
+    sqrt(rho) * z + sqrt(1 - rho) * e_i < inv_cdf(p_i)
+
+(a one-factor Gaussian copula). Every school's admit rate still matches the
+evaluator's probability p_i; `correlation` (rho) only controls how strongly
+the outcomes move together, from independent (0) to all-or-nothing (1).
+
+Draws are generated in fixed-size chunks, each with its own child seed of
+the request seed, so a given seed gives the same answer whether the chunks
+run inline or on a process pool.
+"""
+
+import math
+import multiprocessing
+import os
+import secrets
+from concurrent.futures import Executor, ProcessPoolExecutor
+from statistics import NormalDist
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_DRAWS = 100_000
+DEFAULT_CORRELATION = 0.3
+CHUNK_DRAWS = 50_000
+
+# "Top" schools for P(admitted to at least one top school)
+TOP_SCHOOL_RANK = 10
+
+
+def admission_thresholds(probabilities: Sequence[float]) -> np.ndarray:
+    """Latent cut-off per school: a standard normal falls below it with probability p"""
+    standard_normal = NormalDist()
+    return np.array([
+        -math.inf if p <= 0 else math.inf if p >= 1 else standard_normal.inv_cdf(p)
+        for p in probabilities
+    ])
+
+
+def simulate_chunk(thresholds: np.ndarray, top_mask: np.ndarray, correlation: float,
+                   draws: int, seed: np.random.SeedSequence) -> Dict[str, np.ndarray]:
+    """Outcome counts for `draws` simulated cycles (module-level so a process pool can run it)"""
+    rng = np.random.default_rng(seed)
+    shared = rng.standard_normal((draws, 1))
+    latent = rng.standard_normal((draws, len(thresholds)))
+    latent *= math.sqrt(1 - correlation)
+    latent += math.sqrt(correlation) * shared
+
+    admits = latent < thresholds
+    return {
+        'admit_counts': np.bincount(admits.sum(axis=1), minlength=len(thresholds) + 1),
+        'school_admits': admits.sum(axis=0),
+        'top_admits': np.count_nonzero(admits[:, top_mask].any(axis=1)),
+    }
+
+
+def simulate(probabilities: Sequence[float], top_mask: Sequence[bool], draws: int = DEFAULT_DRAWS,
+             correlation: float = DEFAULT_CORRELATION, seed: Optional[int] = None,
+             executor: Optional[Executor] = None) -> Dict:
+    """
+    Summary statistics of `draws` simulated admissions cycles for a list
+    with the given per-school probabilities. top_mask marks the top schools.
+    Without a seed a fresh one is drawn and returned, so any run can be
+    reproduced.
+    """
+    if seed is None:
+        # 32 bits keeps the returned seed exact in JSON clients
+        seed = secrets.randbits(32)
+    seed_sequence = np.random.SeedSequence(seed)
+    thresholds = admission_thresholds(probabilities)
+    top_mask = np.asarray(top_mask, dtype=bool)
+
+    chunk_sizes = [CHUNK_DRAWS] * (draws // CHUNK_DRAWS)
+    if draws % CHUNK_DRAWS:
+        chunk_sizes.append(draws % CHUNK_DRAWS)
+    chunk_seeds = seed_sequence.spawn(len(chunk_sizes))
+    args = ([thresholds] * len(chunk_sizes), [top_mask] * len(chunk_sizes),
+            [correlation] * len(chunk_sizes), chunk_sizes, chunk_seeds)
+
+    if executor is not None and len(chunk_sizes) > 1:
+        chunks = list(executor.map(simulate_chunk, *args))
+    else:
+        chunks = list(map(simulate_chunk, *args))
+
+    admit_counts = sum(chunk['admit_counts'] for chunk in chunks)
+    school_admits = sum(chunk['school_admits'] for chunk in chunks)
+    top_admits = sum(chunk['top_admits'] for chunk in chunks)
+
+    distribution = admit_counts / draws
+    p_at_least_one = 1 - distribution[0]
+    return {
+        'draws': draws,
+        'correlation': correlation,
+        'seed': seed,
+        'p_at_least_one_admit': float(p_at_least_one),
+        'p_at_least_one_admit_stderr': math.sqrt(p_at_least_one * (1 - p_at_least_one) / draws),
+        'expected_admits': float(np.dot(np.arange(len(distribution)), distribution)),
+        'p_top_school_admit': float(top_admits / draws) if top_mask.any() else None,
+        'admit_count_distribution': distribution.tolist(),
+        'school_admit_rates': (school_admits / draws).tolist(),
+    }
+
+
+def process_pool_from_env() -> Optional[ProcessPoolExecutor]:
+    """
+    PORTFOLIO_PROCESSES (default 0: simulate on the calling thread). Workers
+    are spawned, not forked, so they never inherit the server's threads or
+    the ML runtime; they only import this module and NumPy.
+    """
+    processes = int(os.environ.get('PORTFOLIO_PROCESSES', 0))
+    if processes <= 0:
+        return None
+    return ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn'))
+
+
+def shutdown_pool(executor: ProcessPoolExecutor):
+    """
+    Stop a pool from process_pool_from_env(): queued chunks are cancelled
+    and only the running ones (one CHUNK_DRAWS chunk per worker) finish.
+    Waiting matters: a prefork worker leaves with os._exit(), which would
+    otherwise orphan the pool's workers before they were told to stop.
+    """
+    executor.shutdown(wait=True, cancel_futures=True)
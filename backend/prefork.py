@@ -0,0 +1,245 @@
+"""
+Prefork server launcher
+
+`uvicorn --workers N` starts N fresh interpreters, and each one imports
+main.py, maps the school data and loads the ML model again. serve() instead
+imports the app (building the evaluator and predictor) once in the master,
+moves everything allocated so far out of the garbage collector's reach with
+gc.freeze(), binds the listening socket and then forks the workers. The
+model, school table and interned strings stay in pages shared copy-on-write,
+so each extra worker costs only the memory it touches after the fork.
+
+The master never runs an ML prediction before forking: XGBoost's OpenMP
+thread pool does not survive fork(). With one worker, or on platforms
+without fork (Windows), there is nothing to share: serve() binds and serves
+in-process right away, and the model loads in the background as under bare
+uvicorn.
+
+Reloads are coordinated by the master: /admin/reload (or a file change
+seen by worker 0 under RELOAD_WATCH_INTERVAL) sends it SIGHUP, and it
+reloads the data and model itself, then replaces the workers one at a time
+with fresh forks. Every worker ends up on the same version, sharing the new
+model copy-on-write.
+
+Each worker logs its unique set size (USS: pages no other process shares)
+from /proc/self/smaps_rollup once it has served a warm-up evaluation.
+"""
+
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, Optional
+
+import uvicorn
+
+from hot_reload import ReloadError
+
+
+class _ReloadRequested(Exception):
+    """Raised by the master's SIGHUP handler to break out of os.wait()"""
+
+
+def memory_usage() -> Optional[Dict[str, float]]:
+    """USS/PSS/RSS of this process in MB, or None where smaps_rollup is unavailable"""
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            fields = {}
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == 'kB':
+                    fields[parts[0].rstrip(':')] = int(parts[1]) / 1024
+    except OSError:
+        return None
+
+    return {
+        'uss': fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0),
+        'pss': fields.get('Pss', 0),
+        'rss': fields.get('Rss', 0)
+    }
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ':' in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _warm_up_and_report(worker: int):
+    """Exercise the evaluate path once in this worker, then log its memory"""
+    from main import ApplicantData, reloader
+    from sample_profiles import sample_applicant_payload
+
+    reloader.evaluator.evaluate(ApplicantData(**sample_applicant_payload()))
+
+    usage = memory_usage()
+    if usage:
+        print(f"Worker {worker} (pid {os.getpid()}) ready: USS {usage['uss']:.1f} MB, "
+              f"PSS {usage['pss']:.1f} MB, RSS {usage['rss']:.1f} MB")
+    else:
+        print(f"Worker {worker} (pid {os.getpid()}) ready (memory report needs /proc/self/smaps_rollup)")
+    sys.stdout.flush()
+
+
+def _run_worker(app, sock: socket.socket, worker: int, log_level: str):
+    _warm_up_and_report(worker)
+    config = uvicorn.Config(app, log_level=log_level)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def serve(host: str = "0.0.0.0", port: int = 8000, workers: Optional[int] = None,
+          log_level: str = "info"):
+    """
+    Load the app once and serve it from `workers` forked processes
+    (default: WEB_CONCURRENCY, else 1). Raises OSError if the port is taken.
+    """
+    workers = workers or int(os.environ.get('WEB_CONCURRENCY', 1))
+    forking = workers > 1 and hasattr(os, 'fork')
+
+    started = time.time()
+    from main import ApplicantData, app, reloader
+    from sample_profiles import sample_applicant_payload
+
+    if not forking:
+        # One process: accept connections right away; the app's lifespan
+        # loads the model in the background (/ready answers 503 until then)
+        sock = bind_socket(host, port)
+        print(f"Imported the app in {time.time() - started:.2f}s, listening on {host}:{port}")
+        _run_worker(app, sock, 0, log_level)
+        return
+
+    # Load the model in the master so the workers share it, and warm the
+    # rule-based path so lazily built tables are created once (no ML call
+    # here, see module docstring)
+    if reloader.evaluator.ml_status == 'loading':
+        try:
+            reloader.reload(smoke_test_ml=False)
+        except ReloadError:
+            print("Serving rule-based results only")
+    reloader.evaluator.evaluate(ApplicantData(**sample_applicant_payload()), ml_probability=None)
+
+    sock = bind_socket(host, port)
+    print(f"Master (pid {os.getpid()}) loaded the app in {time.time() - started:.2f}s, "
+          f"listening on {host}:{port}")
+
+    # Everything allocated so far is permanent; keep the GC from touching
+    # (and so un-sharing) those objects in the workers
+    gc.collect()
+    gc.freeze()
+
+    master_pid = os.getpid()
+    children: Dict[int, int] = {}
+    shutting_down = False
+    reload_requested = False
+    waiting = False
+
+    def spawn(worker: int):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGHUP, signal.SIG_DFL)
+            # Reloads go through the master; worker 0 watches the files
+            reloader.delegate_to_master(master_pid, watches_files=worker == 0)
+            try:
+                _run_worker(app, sock, worker, log_level)
+            finally:
+                os._exit(0)
+        children[pid] = worker
+
+    def stop(signum, frame):
+        nonlocal shutting_down
+        shutting_down = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def request_reload(signum, frame):
+        nonlocal reload_requested
+        reload_requested = True
+        if waiting:
+            raise _ReloadRequested
+
+    def reload_and_refork():
+        """Reload in the master, then replace the workers one at a time"""
+        print("Reload requested: reloading in the master")
+        try:
+            reloader.reload(smoke_test_ml=False)
+        except ReloadError:
+            print("Reload failed, workers keep the current version")
+            return
+        reloader.evaluator.evaluate(ApplicantData(**sample_applicant_payload()), ml_probability=None)
+        # The old evaluator was frozen with everything else; let it be collected
+        gc.unfreeze()
+        gc.collect()
+        gc.freeze()
+
+        for old_pid, worker in list(children.items()):
+            if shutting_down:
+                return
+            spawn(worker)
+            # The new worker is accepting; the old one finishes its requests
+            del children[old_pid]
+            try:
+                os.kill(old_pid, signal.SIGTERM)
+                os.waitpid(old_pid, 0)
+            except ChildProcessError:
+                pass
+            except ProcessLookupError:
+                pass
+        print(f"Workers restarted on {reloader.evaluator.version}: {sorted(children)}")
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGHUP, request_reload)
+
+    for worker in range(workers):
+        spawn(worker)
+    print(f"Forked {workers} workers: {sorted(children)}")
+
+    while children:
+        if reload_requested and not shutting_down:
+            reload_requested = False
+            reload_and_refork()
+            continue
+        try:
+            waiting = True
+            # A request that arrived before `waiting` was set
+            if reload_requested:
+                continue
+            pid, status = os.wait()
+        except _ReloadRequested:
+            continue
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        finally:
+            waiting = False
+
+        worker = children.pop(pid, None)
+        if worker is not None and not shutting_down:
+            print(f"Worker {worker} (pid {pid}) exited with status {status}, restarting")
+            time.sleep(1)
+            spawn(worker)
+
+    sock.close()
+    print("All workers stopped")
+
+
+def main():
+    """python prefork.py [workers] [port]"""
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 8000
+    serve(port=port, workers=workers)
+
+
+if __name__ == "__main__":
+    main()
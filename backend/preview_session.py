@@ -0,0 +1,141 @@
+"""
+Incremental re-evaluation for the form's live preview
+
+A preview session remembers the last value of each expensive part of an
+evaluation together with the exact (canonicalized) applicant fields it read.
+When the form changes only application_round or target_school, the
+extracurricular, application and demographic scores and the ML prediction
+are reused; only the academic score (which depends on the school), the
+probability and the narrative are recomputed.
+
+Results are identical to Top50AdmissionsEvaluator.evaluate().
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from result_cache import canonical_profile
+
+# canonical_profile() keys each component reads
+COMPONENT_FIELDS = {
+    'academic': [
+        'gpa_unweighted', 'gpa_trend', 'sat_score', 'ap_scores', 'curriculum_difficulty',
+        'country', 'toefl_score', 'ielts_score'
+    ],
+    'extracurricular': ['research_experience', 'activity_roles', 'competition_levels'],
+    'application': ['lor_quality', 'essay_quality'],
+    'demographic': ['country', 'state_province', 'first_generation', 'legacy_status', 'recruited_athlete'],
+    # prepare_ml_features() inputs (ap_scores covers the AP course count)
+    'ml': [
+        'gpa_unweighted', 'gpa_weighted', 'sat_score', 'sat_math', 'sat_ebrw', 'act_score',
+        'ap_scores', 'ethnicity', 'gender', 'target_major', 'first_generation', 'legacy_status'
+    ],
+}
+
+
+def _component_key(profile: Dict, component: str) -> Tuple:
+    return tuple(
+        tuple(value) if isinstance(value, list) else value
+        for value in (profile[field] for field in COMPONENT_FIELDS[component])
+    )
+
+
+class PreviewSession:
+    """Last computed value of each component, for one user's edits"""
+
+    def __init__(self):
+        self.session_id = uuid.uuid4().hex
+        self.memo: Dict[str, Tuple[Tuple, object]] = {}
+        self.version = None
+        self.lock = threading.Lock()
+
+    def evaluate(self, evaluator, applicant) -> Tuple[Dict, List[str]]:
+        """evaluate() reusing unchanged components; also returns what was recomputed"""
+        with self.lock:
+            if evaluator.version != self.version:
+                # New school data or model: nothing cached is trustworthy
+                self.memo.clear()
+                self.version = evaluator.version
+
+            school = evaluator.school_table.get(applicant.target_school)
+            if not school:
+                return evaluator.evaluate(applicant), []
+
+            profile = canonical_profile(applicant)
+            recomputed = []
+
+            def memoized(component: str, extra_key: Tuple, compute):
+                key = _component_key(profile, component) + extra_key
+                cached = self.memo.get(component)
+                if cached is not None and cached[0] == key:
+                    return cached[1]
+                value = compute()
+                recomputed.append(component)
+                if value is not None:
+                    # None is an ML failure: retry next time instead of pinning it
+                    self.memo[component] = (key, value)
+                return value
+
+            scores = {
+                component: memoized(
+                    component,
+                    (school.name,) if component == 'academic' else (),
+                    lambda component=component: evaluator.component_score(component, applicant, school)
+                )
+                for component in ('academic', 'extracurricular', 'application', 'demographic')
+            }
+
+            predictor = evaluator.hybrid_predictor
+            if predictor and predictor.ml_available:
+                ml_probability = memoized('ml', (), lambda: predictor.get_ml_prediction(applicant))
+            else:
+                ml_probability = None
+
+            result = evaluator.evaluate_components(
+                applicant, school,
+                scores['academic'], scores['extracurricular'], scores['application'], scores['demographic'],
+                ml_probability
+            )
+            return result, recomputed
+
+
+class PreviewSessions:
+    """LRU of sessions, each expiring after `idle_ttl` seconds without use"""
+
+    def __init__(self, max_sessions: int = 1000, idle_ttl: float = 1800.0):
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self._sessions: "OrderedDict[str, Tuple[float, PreviewSession]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self) -> PreviewSession:
+        session = PreviewSession()
+        with self._lock:
+            self._sessions[session.session_id] = (time.monotonic(), session)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session
+
+    def get(self, session_id: str) -> Optional[PreviewSession]:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            last_used, session = entry
+            now = time.monotonic()
+            if now - last_used > self.idle_ttl:
+                del self._sessions[session_id]
+                return None
+            self._sessions[session_id] = (now, session)
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def __len__(self):
+        return len(self._sessions)
@@ -0,0 +1,144 @@
+"""
+LRU/TTL cache of evaluation results keyed by the scoring-relevant profile
+
+Re-submitting the same profile (or one that differs only in fields the
+evaluator never reads, like city or essay topics) returns the stored result
+instead of re-running the scoring, ML inference and narrative generation.
+
+The key is a SHA-256 of the canonicalized fields the evaluator and the ML
+features actually read, plus the evaluator version (school data cycle and
+model hash), so a hot swap can never serve a stale result. The cache is also
+cleared on every swap to free the memory. The key doubles as the
+evaluation ID clients use to fetch a cached result again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+# Scalar ApplicantData fields read by Top50AdmissionsEvaluator.evaluate()
+# (scores, probability and narrative) or by prepare_ml_features()
+SCORING_FIELDS = [
+    "target_school", "application_round", "target_major",
+    "country", "state_province", "gender",
+    "first_generation", "legacy_status", "recruited_athlete",
+    "gpa_unweighted", "gpa_weighted", "gpa_trend",
+    "sat_score", "sat_math", "sat_ebrw", "act_score",
+    "toefl_score", "ielts_score",
+    "curriculum_difficulty", "research_experience",
+    "lor_quality", "essay_quality",
+]
+
+
+def canonical_profile(applicant) -> Dict:
+    """
+    The parts of an applicant that can change an evaluation. List fields are
+    reduced to what is read from them, in a fixed order.
+    """
+    profile = {field: getattr(applicant, field) for field in SCORING_FIELDS}
+    profile["ethnicity"] = applicant.ethnicity[0] if applicant.ethnicity else None
+    profile["ap_scores"] = sorted(ap.score for ap in applicant.ap_courses)
+    profile["activity_roles"] = sorted(activity.role.lower() for activity in applicant.extracurriculars)
+    profile["competition_levels"] = sorted(comp.level.lower() for comp in applicant.competitions)
+    return profile
+
+
+class CachedEvaluation(NamedTuple):
+    """
+    A result plus what is needed to complete it later: results computed
+    without the narrative get it from evaluate(applicant, ml_probability)
+    when someone asks for it, without running the ML model again
+    """
+    result: Dict
+    applicant: Any
+    ml_probability: Optional[float]
+
+
+def profile_key(applicant, version: Dict) -> str:
+    """Stable hash of the canonical profile and the evaluator version"""
+    payload = json.dumps([canonical_profile(applicant), version], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache with a per-entry TTL. Cached results are shared
+    between requests and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 4096, ttl: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, result = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self.expired += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: str, result: Any):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self, *_):
+        """Drop every entry (used as a reloader listener on hot swap)"""
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    @property
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl,
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'expired': self.expired,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations
+        }
+
+
+def cache_from_env() -> ResultCache:
+    """RESULT_CACHE_SIZE (entries, default 4096; 0 disables) and RESULT_CACHE_TTL (seconds, default 3600)"""
+    return ResultCache(
+        max_entries=int(os.environ.get('RESULT_CACHE_SIZE', 4096)),
+        ttl=float(os.environ.get('RESULT_CACHE_TTL', 3600))
+    )
@@ -6,13 +6,14 @@ Run this file to start the server:
     python run_server.py
 """
 
-import uvicorn
 import sys
 import os
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from prefork import serve
+
 def main():
     print("=" * 70)
     print("COLLEGE ADMISSIONS SIMULATOR - ENHANCED VERSION")
@@ -34,14 +35,37 @@ def main():
     print("  GET  /ap-subjects   - List all 38 AP subjects")
     print("  GET  /countries     - List all countries")
     print("  GET  /us-states     - List all US states")
-    print("  POST /evaluate      - Evaluate applicant profile")
+    print("  POST /evaluate      - Evaluate applicant profile (?detail=summary or ?fields=... skips the narrative)")
+    print("  GET  /evaluations/{id}      - Fetch a cached result again, with its narrative")
+    print("  POST /evaluate/batch        - Evaluate a list of applicants")
+    print("  POST /evaluate/stream       - Stream NDJSON results for an NDJSON or CSV upload of any size")
+    print("  POST /evaluate/all-schools  - One applicant against every school")
+    print("  POST /evaluate/sweep        - Probability over a grid of SAT/GPA/AP/essay/LOR values")
+    print("  POST /evaluate/threshold    - Minimum SAT or GPA for a target probability, per school")
+    print("  POST /simulate/portfolio    - Monte Carlo outcomes for a whole college list")
+    print("  POST /recommend/list        - Best schools and rounds (ED/EA strategy) for a list size")
+    print("  GET  /schools/{name}/similar - Nearest schools (POST with an applicant: re-ranked by odds)")
+    print("  POST /preview/sessions[/{id}]  - Live preview (recomputes only edited parts)")
+    print("  POST /admin/reload  - Hot-reload school data and ML model")
+    print("  GET  /admin/metrics - Evaluation pool, result cache and ML batching metrics")
+    print("  GET  /ready         - 200 once the ML model has warmed up (503 before)")
+    print()
+    print("Set RELOAD_WATCH_INTERVAL=<seconds> to reload automatically when")
+    print("backend/data/schools or ml/admissions_model.pkl change.")
+    print("ML predictions are micro-batched across concurrent requests; tune with")
+    print("ML_BATCH_MAX_SIZE (rows, 1 disables) and ML_BATCH_MAX_WAIT_MS.")
+    print("Evaluation runs on EVALUATION_WORKERS threads; beyond EVALUATION_QUEUE_DEPTH")
+    print("waiting requests the API answers 503 with Retry-After.")
+    print("Set WEB_CONCURRENCY=<n> to fork n workers that share one loaded model.")
+    print("Repeat /evaluate profiles are cached (RESULT_CACHE_SIZE entries, RESULT_CACHE_TTL seconds).")
+    print("Set PORTFOLIO_PROCESSES=<n> to spread large /simulate/portfolio runs over n processes.")
     print()
     print("Press CTRL+C to stop the server")
     print("=" * 70)
     print()
 
     try:
-        uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=False)
+        serve(host="0.0.0.0", port=8000)
     except OSError as e:
         if "10048" in str(e) or "address already in use" in str(e).lower():
             print()
@@ -52,7 +76,7 @@ def main():
             print("Trying port 8001 instead...")
             print("Server will be available at: http://localhost:8001")
             print()
-            uvicorn.run("main:app", host="0.0.0.0", port=8001, reload=False)
+            serve(host="0.0.0.0", port=8001)
         else:
             raise
 
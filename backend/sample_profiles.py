@@ -0,0 +1,151 @@
+"""
+Sample applicant payloads (plain JSON-style dicts, validate with ApplicantData)
+Used for smoke evaluations when reloading the model or school data, and as
+synthetic load for the benchmarks
+"""
+
+import random
+from typing import Dict, List, Sequence
+
+
+def sample_applicant_payload() -> Dict:
+    """A complete, realistic applicant profile"""
+    return {
+        "country": "United States",
+        "state_province": "California",
+        "city": "San Jose",
+        "gender": "Female",
+        "ethnicity": ["Asian"],
+        "first_generation": False,
+        "legacy_status": False,
+        "recruited_athlete": False,
+        "target_school": "Stanford University",
+        "target_major": "Computer Science",
+        "target_degree": "Bachelor of Science (BS)",
+        "application_round": "Restrictive Early Action (REA)",
+        "family_income_bracket": "$150k-$250k",
+        "fee_waiver": False,
+        "high_school_name": "Lincoln High School",
+        "high_school_type": "public",
+        "high_school_ranking": "top 5%",
+        "class_size": 450,
+        "class_rank": 8,
+        "gpa_unweighted": 3.93,
+        "gpa_weighted": 4.45,
+        "gpa_trend": "upward",
+        "gpa_by_year": {"9th": 3.8, "10th": 3.9, "11th": 4.0},
+        "ap_courses": [
+            {"subject": "AP Calculus BC", "score": 5, "year_taken": "11th"},
+            {"subject": "AP Computer Science A", "score": 5, "year_taken": "10th"},
+            {"subject": "AP Physics C: Mechanics", "score": 4, "year_taken": "11th"},
+            {"subject": "AP English Language and Composition", "score": 4, "year_taken": "11th"},
+            {"subject": "AP Chemistry", "score": 5, "year_taken": "10th"},
+            {"subject": "AP United States History", "score": 4, "year_taken": "11th"},
+        ],
+        "honors_courses": 5,
+        "ib_diploma": False,
+        "sat_score": 1540,
+        "sat_math": 790,
+        "sat_ebrw": 750,
+        "curriculum_difficulty": "very_high",
+        "research_experience": "Summer research in a university machine learning lab under a professor, "
+                               "co-authored a paper submitted to a student journal and presented at a regional conference.",
+        "research_publications": [],
+        "research_presentations": ["Regional Science Conference 2024"],
+        "independent_projects": ["Open-source study planner app"],
+        "extracurriculars": [
+            {"activity_name": "Robotics Team", "role": "Team Captain", "years_participated": 3,
+             "hours_per_week": 10, "description": "Led a 20-person FRC team"},
+            {"activity_name": "Coding Club", "role": "Founder", "years_participated": 2,
+             "hours_per_week": 4, "description": "Weekly workshops for underclassmen"},
+            {"activity_name": "Math Tutoring", "role": "Tutor", "years_participated": 3,
+             "hours_per_week": 3, "description": "Volunteer tutoring at the local library"},
+            {"activity_name": "Orchestra", "role": "Section Leader", "years_participated": 4,
+             "hours_per_week": 5, "description": "First violin"},
+            {"activity_name": "Hackathons", "role": "Participant", "years_participated": 2,
+             "hours_per_week": 2, "description": "Regional hackathons"},
+        ],
+        "competitions": [
+            {"name": "USACO", "level": "national", "award": "Gold Division", "year": "2024"},
+            {"name": "Science Olympiad", "level": "state", "award": "2nd place", "year": "2023"},
+            {"name": "AMC 12", "level": "national", "award": "AIME qualifier", "year": "2024"},
+        ],
+        "academic_honors": ["National Merit Semifinalist", "AP Scholar with Distinction"],
+        "work_experience": [],
+        "community_service_hours": 150,
+        "community_service_description": "Tutoring and food bank volunteering",
+        "summer_activities": ["University research program"],
+        "lor_quality": 4,
+        "lor_sources": ["Math teacher", "Research mentor"],
+        "essay_quality": 4,
+        "essay_topics": ["Building a robot with a broken team"],
+        "supplemental_materials": [],
+        "campus_visit": True,
+        "interview_completed": False,
+        "contacted_admissions": False,
+        "attended_info_sessions": 1,
+    }
+
+
+# Vocabulary for synthetic free text; keyword-bearing words appear at
+# realistic rates so the keyword scorers have something to find
+_FILLER_WORDS = (
+    "the a and of to in with for on my our team project data model results analysis summer "
+    "university school community program built designed tested studied learned students weekly"
+).split()
+_RESEARCH_WORDS = ["published", "paper", "journal", "conference", "lab", "professor", "independent", "collaborated"]
+_ROLES = ["Member", "President", "Team Captain", "Co-Founder", "Volunteer", "Section Leader", "Treasurer",
+          "Tutor", "Editor-in-Chief", "Participant", "Vice Chair", "Director of Outreach"]
+_COMPETITION_LEVELS = ["school", "regional", "state", "national", "international", "State Olympiad"]
+_ROUNDS = ["Early Decision (ED)", "Early Action (EA)", "Restrictive Early Action (REA)", "Regular Decision (RD)"]
+_GENDERS = ["Female", "Male", "Non-binary", "Prefer not to say"]
+_AP_SUBJECTS = ["AP Calculus BC", "AP Computer Science A", "AP Chemistry", "AP Biology",
+                "AP United States History", "AP English Language and Composition", "AP Statistics"]
+
+
+def _synthetic_text(rng: random.Random, words: int, keyword_rate: float = 0.05) -> str:
+    return " ".join(
+        rng.choice(_RESEARCH_WORDS) if rng.random() < keyword_rate else rng.choice(_FILLER_WORDS)
+        for _ in range(words)
+    )
+
+
+def synthetic_applicant_payloads(count: int, seed: int = 0,
+                                 schools: Sequence[str] = ("Stanford University",),
+                                 max_research_words: int = 400) -> List[Dict]:
+    """
+    `count` varied applicant payloads (reproducible for a given seed), with
+    research descriptions of up to max_research_words words and up to 12
+    activities and 8 competitions each
+    """
+    rng = random.Random(seed)
+    payloads = []
+    for _ in range(count):
+        payload = sample_applicant_payload()
+        payload.update({
+            "gender": rng.choice(_GENDERS),
+            "target_school": rng.choice(schools),
+            "application_round": rng.choice(_ROUNDS),
+            "gpa_unweighted": round(rng.uniform(2.8, 4.0), 2),
+            "gpa_weighted": rng.choice([None, round(rng.uniform(3.0, 5.0), 2)]),
+            "gpa_trend": rng.choice(["upward", "stable", "downward"]),
+            "sat_score": rng.choice([None, rng.randrange(1000, 1610, 10)]),
+            "ap_courses": [
+                {"subject": rng.choice(_AP_SUBJECTS), "score": rng.randint(2, 5), "year_taken": "11th"}
+                for _ in range(rng.randint(0, 12))
+            ],
+            "research_experience": _synthetic_text(rng, rng.randint(0, max_research_words)),
+            "extracurriculars": [
+                {"activity_name": f"Activity {i}", "role": rng.choice(_ROLES), "years_participated": rng.randint(1, 4),
+                 "hours_per_week": rng.randint(1, 15), "description": _synthetic_text(rng, 12, 0.0)}
+                for i in range(rng.randint(0, 12))
+            ],
+            "competitions": [
+                {"name": f"Competition {i}", "level": rng.choice(_COMPETITION_LEVELS), "award": "Finalist", "year": "2024"}
+                for i in range(rng.randint(0, 8))
+            ],
+            "lor_quality": rng.randint(1, 5),
+            "essay_quality": rng.randint(1, 5),
+        })
+        payloads.append(payload)
+    return payloads
@@ -0,0 +1,155 @@
+"""
+Versioned, memory-mapped school dataset
+Each admissions cycle lives in its own directory under data/schools/:
+
+    data/schools/<cycle>/manifest.json   cycle, format, string table
+    data/schools/<cycle>/schools.npy     one structured row per school
+
+schools.npy is opened with mmap_mode='r', so every worker process maps the
+same pages instead of holding its own copy. The newest cycle directory is
+used unless SCHOOL_DATA_PATH points somewhere else, so dropping in a new
+cycle needs no code change.
+
+Usage:
+    python school_data.py dump <cycle> schools.json    # export for editing
+    python school_data.py build schools.json <cycle>   # compile a new cycle
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from school_table import SchoolTable
+
+DATA_DIR = Path(__file__).parent / 'data' / 'schools'
+FORMAT_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+ROWS_FILE = 'schools.npy'
+
+ROW_DTYPE = np.dtype([
+    ("rank", np.int32),
+    ("acceptance_rate", np.float64),
+    ("avg_gpa_unweighted", np.float64),
+    ("avg_gpa_weighted", np.float64),
+    ("sat_min", np.float64),
+    ("sat_max", np.float64),
+    ("act_min", np.float64),
+    ("act_max", np.float64),
+    ("selectivity", np.int8),
+    ("round_mask", np.int64),
+    ("values_demonstrated_interest", np.bool_),
+    ("need_blind", np.bool_),
+])
+
+
+def latest_cycle_dir(data_dir: Path = DATA_DIR) -> Path:
+    """Newest cycle directory (cycle names sort chronologically, e.g. 2024-25)"""
+    cycles = sorted(p for p in data_dir.iterdir() if (p / MANIFEST_FILE).exists())
+    if not cycles:
+        raise FileNotFoundError(f"No school data cycles found in {data_dir}")
+    return cycles[-1]
+
+
+def resolve_data_path(path: Optional[str] = None) -> Path:
+    """Explicit path, else SCHOOL_DATA_PATH, else the newest cycle in DATA_DIR"""
+    path = path or os.environ.get('SCHOOL_DATA_PATH')
+    if path:
+        path = Path(path)
+        return path.parent if path.name in (MANIFEST_FILE, ROWS_FILE) else path
+    return latest_cycle_dir()
+
+
+def load_school_table(path: Optional[str] = None) -> SchoolTable:
+    """Map a cycle directory into a SchoolTable without copying the columns"""
+    cycle_dir = resolve_data_path(path)
+    with open(cycle_dir / MANIFEST_FILE) as f:
+        manifest = json.load(f)
+
+    if manifest['format'] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported school data format {manifest['format']} in {cycle_dir}")
+
+    rows = np.load(cycle_dir / ROWS_FILE, mmap_mode='r')
+    if rows.dtype != ROW_DTYPE or len(rows) != len(manifest['names']):
+        raise ValueError(f"{cycle_dir / ROWS_FILE} does not match its manifest")
+
+    return SchoolTable(
+        manifest['names'],
+        {column: rows[column] for column in SchoolTable.COLUMNS},
+        manifest['selectivity_levels'],
+        manifest['round_tokens'],
+        manifest['cycle'],
+    )
+
+
+def _write_atomically(path: Path, write):
+    """
+    write(f) into a temporary file beside path, fsync it, then rename it
+    over path. A reader (or a process with the old file mapped) sees the
+    old file or the new one, never a partial one.
+    """
+    temporary = path.with_name(f".{path.name}.tmp")
+    with open(temporary, 'wb') as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+
+
+def write_school_table(table: SchoolTable, cycle: str, data_dir: Path = DATA_DIR) -> Path:
+    """
+    Write a table as a cycle directory. An existing cycle is replaced file
+    by file: the rows first, then the manifest, which load_school_table()
+    checks the rows against.
+    """
+    cycle_dir = Path(data_dir) / cycle
+    cycle_dir.mkdir(parents=True, exist_ok=True)
+
+    rows = np.zeros(table.size, dtype=ROW_DTYPE)
+    for column in SchoolTable.COLUMNS:
+        rows[column] = getattr(table, column)
+    _write_atomically(cycle_dir / ROWS_FILE, lambda f: np.save(f, rows))
+
+    manifest = {
+        'cycle': cycle,
+        'format': FORMAT_VERSION,
+        'names': table.names,
+        'selectivity_levels': table.selectivity_levels,
+        'round_tokens': table.round_tokens,
+    }
+    _write_atomically(cycle_dir / MANIFEST_FILE, lambda f: f.write(json.dumps(manifest, indent=2).encode('utf-8')))
+
+    # Make the renames themselves durable
+    if hasattr(os, 'O_DIRECTORY'):
+        fd = os.open(cycle_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    return cycle_dir
+
+
+def main():
+    if len(sys.argv) != 4 or sys.argv[1] not in ('dump', 'build'):
+        print(__doc__)
+        sys.exit(1)
+
+    if sys.argv[1] == 'dump':
+        _, _, cycle, json_path = sys.argv
+        table = load_school_table(str(DATA_DIR / cycle))
+        with open(json_path, 'w') as f:
+            json.dump(table.to_schools_data(), f, indent=2)
+        print(f"Wrote {table.size} schools from cycle {cycle} to {json_path}")
+    else:
+        _, _, json_path, cycle = sys.argv
+        with open(json_path) as f:
+            schools_data: Dict = json.load(f)
+        cycle_dir = write_school_table(SchoolTable.from_schools_data(schools_data), cycle)
+        print(f"Compiled {len(schools_data)} schools into {cycle_dir}")
+
+
+if __name__ == "__main__":
+    main()
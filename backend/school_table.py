@@ -0,0 +1,173 @@
+"""
+Columnar school table compiled from the nested schools_data dict
+Scorers index NumPy columns by row instead of doing string-keyed lookups
+into per-school dicts; SchoolRecord gives the scalar path the same data as
+plain Python values
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+SELECTIVITY_LEVELS = ["competitive", "very_competitive", "highly_competitive", "most_competitive"]
+ROUND_TOKEN_ORDER = ["ED", "ED1", "ED2", "EA", "REA", "SCEA", "RD", "Rolling"]
+
+
+class SchoolRecord(NamedTuple):
+    """One school, as the scalar evaluator reads it"""
+    row: int
+    name: str
+    rank: int
+    acceptance_rate: float
+    avg_gpa_unweighted: float
+    avg_gpa_weighted: float
+    sat_range: Tuple[int, int]
+    act_range: Tuple[int, int]
+    selectivity: str
+    available_rounds: Tuple[str, ...]
+    round_mask: int
+    values_demonstrated_interest: bool
+    need_blind: bool
+
+
+class SchoolTable:
+    """
+    Array-backed school data, one row per school.
+
+    Columns: rank, acceptance_rate, avg_gpa_unweighted, avg_gpa_weighted,
+    sat_min/sat_max, act_min/act_max, selectivity (integer code into
+    selectivity_levels), round_mask (bit i set when the school offers
+    round_tokens[i]), values_demonstrated_interest and need_blind.
+    """
+
+    COLUMNS = [
+        "rank", "acceptance_rate", "avg_gpa_unweighted", "avg_gpa_weighted",
+        "sat_min", "sat_max", "act_min", "act_max", "selectivity", "round_mask",
+        "values_demonstrated_interest", "need_blind",
+    ]
+
+    def __init__(self, names: List[str], columns: Dict[str, np.ndarray],
+                 selectivity_levels: List[str], round_tokens: List[str],
+                 version: Optional[str] = None):
+        self.names = names
+        self.version = version
+        self.index = {name: row for row, name in enumerate(names)}
+        self.selectivity_levels = selectivity_levels
+        self.round_tokens = round_tokens
+        for column in self.COLUMNS:
+            setattr(self, column, columns[column])
+        self.size = len(names)
+        self.sorted_names = sorted(names)
+        self._records = None
+        self._round_match_masks = {}
+
+    @classmethod
+    def from_schools_data(cls, schools_data: Dict[str, Dict]) -> "SchoolTable":
+        """Compile the nested dict returned by _load_schools_data"""
+        names = list(schools_data)
+        schools = [schools_data[name] for name in names]
+
+        selectivity_levels = list(SELECTIVITY_LEVELS)
+        round_tokens = list(ROUND_TOKEN_ORDER)
+        selectivity, round_mask = [], []
+        for school in schools:
+            if school["selectivity"] not in selectivity_levels:
+                selectivity_levels.append(school["selectivity"])
+            selectivity.append(selectivity_levels.index(school["selectivity"]))
+
+            mask = 0
+            for token in school.get("available_rounds", ["RD"]):
+                if token not in round_tokens:
+                    round_tokens.append(token)
+                mask |= 1 << round_tokens.index(token)
+            round_mask.append(mask)
+
+        columns = {
+            "rank": np.array([s["rank"] for s in schools], dtype=np.int32),
+            "acceptance_rate": np.array([s["acceptance_rate"] for s in schools], dtype=np.float64),
+            "avg_gpa_unweighted": np.array([s["avg_gpa_unweighted"] for s in schools], dtype=np.float64),
+            "avg_gpa_weighted": np.array([s["avg_gpa_weighted"] for s in schools], dtype=np.float64),
+            "sat_min": np.array([s["sat_range"][0] for s in schools], dtype=np.float64),
+            "sat_max": np.array([s["sat_range"][1] for s in schools], dtype=np.float64),
+            "act_min": np.array([s["act_range"][0] for s in schools], dtype=np.float64),
+            "act_max": np.array([s["act_range"][1] for s in schools], dtype=np.float64),
+            "selectivity": np.array(selectivity, dtype=np.int8),
+            "round_mask": np.array(round_mask, dtype=np.int64),
+            "values_demonstrated_interest": np.array(
+                [bool(s.get("values_demonstrated_interest")) for s in schools], dtype=bool),
+            "need_blind": np.array([bool(s.get("need_blind")) for s in schools], dtype=bool),
+        }
+        return cls(names, columns, selectivity_levels, round_tokens)
+
+    def _record(self, row: int) -> SchoolRecord:
+        mask = int(self.round_mask[row])
+        return SchoolRecord(
+            row=row,
+            name=self.names[row],
+            rank=int(self.rank[row]),
+            acceptance_rate=float(self.acceptance_rate[row]),
+            avg_gpa_unweighted=float(self.avg_gpa_unweighted[row]),
+            avg_gpa_weighted=float(self.avg_gpa_weighted[row]),
+            sat_range=(int(self.sat_min[row]), int(self.sat_max[row])),
+            act_range=(int(self.act_min[row]), int(self.act_max[row])),
+            selectivity=self.selectivity_levels[self.selectivity[row]],
+            available_rounds=tuple(t for i, t in enumerate(self.round_tokens) if mask & (1 << i)),
+            round_mask=mask,
+            values_demonstrated_interest=bool(self.values_demonstrated_interest[row]),
+            need_blind=bool(self.need_blind[row]),
+        )
+
+    @property
+    def records(self) -> List[SchoolRecord]:
+        if self._records is None:
+            self._records = [self._record(row) for row in range(self.size)]
+        return self._records
+
+    def get(self, name: str) -> Optional[SchoolRecord]:
+        row = self.index.get(name)
+        return self.records[row] if row is not None else None
+
+    def take(self, rows: Sequence[int]) -> "SchoolTable":
+        """Sub-table with the given rows, in the given order (rows may repeat)"""
+        rows = np.asarray(rows, dtype=np.intp)
+        return SchoolTable(
+            [self.names[row] for row in rows.tolist()],
+            {column: getattr(self, column)[rows] for column in self.COLUMNS},
+            self.selectivity_levels,
+            self.round_tokens,
+            self.version,
+        )
+
+    def to_schools_data(self) -> Dict[str, Dict]:
+        """Nested dict in the original _load_schools_data layout"""
+        return {
+            record.name: {
+                "rank": record.rank,
+                "acceptance_rate": record.acceptance_rate,
+                "avg_gpa_unweighted": record.avg_gpa_unweighted,
+                "avg_gpa_weighted": record.avg_gpa_weighted,
+                "sat_range": record.sat_range,
+                "sat_25th": record.sat_range[0], "sat_75th": record.sat_range[1],
+                "act_range": record.act_range,
+                "selectivity": record.selectivity,
+                "available_rounds": list(record.available_rounds),
+                "values_demonstrated_interest": record.values_demonstrated_interest,
+                "need_blind": record.need_blind
+            }
+            for record in self.records
+        }
+
+    def round_match_mask(self, round_name: str) -> int:
+        """
+        Bits of the available-round tokens that count as offering round_name,
+        e.g. "Early Decision (ED)" matches ED, ED1 and ED2 schools
+        """
+        mask = self._round_match_masks.get(round_name)
+        if mask is None:
+            round_type = round_name.split("(")[1].rstrip(")") if "(" in round_name else round_name
+            mask = 0
+            for i, token in enumerate(self.round_tokens):
+                if round_type in token or token in round_type:
+                    mask |= 1 << i
+            self._round_match_masks[round_name] = mask
+        return mask
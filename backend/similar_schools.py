@@ -0,0 +1,68 @@
+"""
+Nearest-neighbour index over the school table ("schools like Duke")
+
+Each school becomes a vector of standardized features: log acceptance rate,
+SAT range, average GPA, rank, selectivity, which kinds of early round it
+offers and need-blind admission. With ~100 schools the full pairwise
+distance matrix is tiny, so every school's neighbour order is computed once
+when the index is built and a query is a slice of a precomputed list.
+The server rebuilds the index whenever a reload swaps in new school data.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from school_table import SchoolTable
+
+# Round tokens grouped by what they mean for the applicant
+ROUND_GROUPS = {
+    'early_decision': ('ED', 'ED1', 'ED2'),
+    'early_action': ('EA',),
+    'restrictive_early_action': ('REA', 'SCEA'),
+}
+
+
+def school_features(table: SchoolTable) -> np.ndarray:
+    """(schools, features) matrix, each column standardized to mean 0 and std 1"""
+    columns = [
+        np.log(table.acceptance_rate),
+        table.sat_min,
+        table.sat_max,
+        table.avg_gpa_unweighted,
+        table.rank.astype(np.float64),
+        table.selectivity.astype(np.float64),
+        table.need_blind.astype(np.float64),
+    ]
+    for tokens in ROUND_GROUPS.values():
+        mask = 0
+        for token in tokens:
+            if token in table.round_tokens:
+                mask |= 1 << table.round_tokens.index(token)
+        columns.append(((table.round_mask & mask) != 0).astype(np.float64))
+
+    features = np.column_stack(columns)
+    std = features.std(axis=0)
+    return (features - features.mean(axis=0)) / np.where(std > 0, std, 1.0)
+
+
+class SimilarSchools:
+    """Precomputed distances and neighbour order for one school table"""
+
+    def __init__(self, table: SchoolTable):
+        self.table = table
+        features = school_features(table)
+        squared = (features ** 2).sum(axis=1)
+        distances = np.sqrt(np.maximum(squared[:, None] + squared[None, :] - 2 * features @ features.T, 0))
+        np.fill_diagonal(distances, np.inf)
+        self.distances = distances
+        # neighbours[i]: every other school, nearest first
+        self.neighbours = np.argsort(distances, axis=1, kind='stable')[:, :-1]
+
+    def similar(self, name: str, k: int) -> List[Dict]:
+        """The k schools nearest to `name` (raises KeyError for unknown schools)"""
+        row = self.table.index[name]
+        return [
+            {"school": self.table.names[other], "distance": round(float(self.distances[row, other]), 4)}
+            for other in self.neighbours[row, :k].tolist()
+        ]
@@ -1,8 +1,7 @@
 """
 Start the College Admissions Simulator API server
 """
-import uvicorn
-from main import app
+from prefork import serve
 
 if __name__ == "__main__":
     print("=" * 60)
@@ -19,8 +18,9 @@ if __name__ == "__main__":
     print("Server will start on: http://localhost:8000")
     print("API Documentation: http://localhost:8000/docs")
     print()
+    print("Set WEB_CONCURRENCY=<n> to fork n workers sharing one loaded model")
     print("Press CTRL+C to stop the server")
     print("=" * 60)
     print()
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    serve(host="0.0.0.0", port=8000)
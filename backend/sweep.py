@@ -0,0 +1,100 @@
+"""
+What-if sweeps: one applicant scored over a grid of values for one or two
+numeric fields ("what if my SAT were 1450..1600 and my GPA 3.7..4.0?"),
+and the grids behind the threshold solver ("what SAT do I need for 40%?")
+
+The grid is built directly as ApplicantColumns (the base applicant's row
+repeated, with the swept columns overwritten), so the rule-based scores
+for every cell come from one vectorized pass, and the ML features from
+one feature matrix and one model call. Every cell is identical to what
+evaluate() returns for the applicant with those values.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from batch_scoring import ApplicantColumns
+
+# field -> (minimum, maximum, integer-valued)
+SWEEP_FIELDS = {
+    'sat_score': (400, 1600, True),
+    'gpa_unweighted': (0.0, 4.0, False),
+    'ap_count': (0, 38, True),
+    'essay_quality': (1, 5, True),
+    'lor_quality': (1, 5, True),
+}
+
+# Largest number of values per axis (a 2-D sweep is at most this squared)
+MAX_SWEEP_STEPS = 100
+
+# Score assumed for hypothetical AP courses when the applicant has none yet;
+# otherwise added (or removed) courses keep the applicant's current average
+ASSUMED_AP_SCORE = 4.0
+
+# Swept field -> ApplicantColumns attribute / prepare_ml_features() key
+COLUMN_NAMES = {'sat_score': 'sat_score', 'gpa_unweighted': 'gpa_unweighted', 'ap_count': 'num_aps',
+                'essay_quality': 'essay_quality', 'lor_quality': 'lor_quality'}
+ML_FEATURE_NAMES = {'sat_score': 'sat_score', 'gpa_unweighted': 'gpa_unweighted', 'ap_count': 'num_ap_courses'}
+
+
+def axis_values(field: str, start: float, stop: float, steps: int) -> List:
+    """
+    `steps` evenly spaced values from start to stop (inclusive). Integer
+    fields are rounded and de-duplicated. Raises ValueError for unknown
+    fields and out-of-range bounds.
+    """
+    if field not in SWEEP_FIELDS:
+        raise ValueError(f"Cannot sweep {field!r}; choose one of {', '.join(SWEEP_FIELDS)}")
+    minimum, maximum, integer = SWEEP_FIELDS[field]
+    for bound in (start, stop):
+        if not minimum <= bound <= maximum:
+            raise ValueError(f"{field} range must lie within [{minimum}, {maximum}]")
+    if not 1 <= steps <= MAX_SWEEP_STEPS:
+        raise ValueError(f"steps must be between 1 and {MAX_SWEEP_STEPS}")
+
+    values = np.linspace(start, stop, steps).tolist()
+    if integer:
+        values = list(dict.fromkeys(int(round(value)) for value in values))
+    return values
+
+
+def grid_columns(applicant, axes: Sequence[Tuple[str, List]]) -> Tuple[ApplicantColumns, Dict[str, np.ndarray]]:
+    """
+    Rule-based inputs for every grid cell (row-major: the last axis varies
+    fastest) and the ML feature overrides for the same cells
+    """
+    grids = np.meshgrid(*[np.asarray(values, dtype=np.float64) for _, values in axes], indexing='ij')
+    cells = {field: grid.ravel() for (field, _), grid in zip(axes, grids)}
+    size = grids[0].size
+
+    columns = ApplicantColumns.from_applicants([applicant]).repeat(size)
+    for field, values in cells.items():
+        column = COLUMN_NAMES[field]
+        setattr(columns, column, values.astype(getattr(columns, column).dtype))
+
+    if 'ap_count' in cells:
+        average = columns.avg_ap_score[0] if applicant.ap_courses else ASSUMED_AP_SCORE
+        columns.avg_ap_score = np.where(columns.num_aps > 0, average, 0.0)
+
+    ml_overrides = {ML_FEATURE_NAMES[field]: values for field, values in cells.items() if field in ML_FEATURE_NAMES}
+    if 'num_ap_courses' in ml_overrides:
+        ml_overrides['num_ap_courses'] = ml_overrides['num_ap_courses'].astype(np.int64)
+    return columns, ml_overrides
+
+
+# Fields /evaluate/threshold can solve for -> grid resolution. SAT scores are
+# reported in steps of 10, GPAs to two decimals.
+THRESHOLD_RESOLUTION = {'sat_score': 10, 'gpa_unweighted': 0.01}
+
+
+def threshold_values(field: str) -> List:
+    """Every value of `field` on its reporting grid, ascending"""
+    if field not in THRESHOLD_RESOLUTION:
+        raise ValueError(f"Cannot solve for {field!r}; choose one of {', '.join(THRESHOLD_RESOLUTION)}")
+    minimum, maximum, integer = SWEEP_FIELDS[field]
+    if integer:
+        return list(range(minimum, maximum + 1, THRESHOLD_RESOLUTION[field]))
+    # i / 100 is the same float as the literal the user would type (3.93, ...)
+    scale = round(1 / THRESHOLD_RESOLUTION[field])
+    return [i / scale for i in range(round(minimum * scale), round(maximum * scale) + 1)]
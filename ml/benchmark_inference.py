@@ -0,0 +1,124 @@
+"""
+Correctness check and microbenchmark for HybridAdmissionsPredictor inference
+
+Compares the fused path (scaler folded into the input + booster.inplace_predict)
+and the compiled NumPy backend (tree_compiler.py) against the original sklearn
+path (LabelEncoder.transform -> scaler.transform -> predict_proba) on
+synthetic applicants, then reports per-row latency. The exact check against
+XGBoost's own booster.predict, with missing values, is inference_check.py.
+
+Run from the ml directory:
+    python benchmark_inference.py [num_applicants]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from ml_integration import HybridAdmissionsPredictor
+
+MODEL_PATH = Path(__file__).parent / 'admissions_model.pkl'
+
+ETHNICITIES = ["Asian", "White", "Hispanic/Latino", "Black/African American", "Other", "Martian"]
+GENDERS = ["Male", "Female", "Non-binary", "Prefer not to say"]
+MAJORS = ["Computer Science", "Biology", "Economics", "English", "Underwater Basket Weaving"]
+
+
+def synthetic_applicant(rng: random.Random) -> SimpleNamespace:
+    """Only the attributes prepare_ml_features reads"""
+    return SimpleNamespace(
+        gpa_unweighted=round(rng.uniform(2.5, 4.0), 2),
+        gpa_weighted=rng.choice([None, round(rng.uniform(3.0, 5.0), 2)]),
+        sat_score=rng.choice([None, rng.randrange(1000, 1610, 10)]),
+        sat_math=rng.choice([None, rng.randrange(500, 810, 10)]),
+        sat_ebrw=rng.choice([None, rng.randrange(500, 810, 10)]),
+        act_score=rng.choice([None, rng.randint(18, 36)]),
+        ap_courses=[None] * rng.randint(0, 14),
+        ethnicity=rng.choice([[], [rng.choice(ETHNICITIES)]]),
+        gender=SimpleNamespace(value=rng.choice(GENDERS)),
+        target_major=rng.choice(MAJORS),
+        first_generation=rng.random() < 0.2,
+        legacy_status=rng.random() < 0.1,
+    )
+
+
+def reference_prediction(predictor: HybridAdmissionsPredictor, applicant) -> float:
+    """The original per-request path through the sklearn/XGBoost wrappers"""
+    feature_dict = predictor.prepare_ml_features(applicant)
+    feature_vector = []
+    for feature_name in predictor.feature_names:
+        if feature_name.endswith('_encoded'):
+            original_col = feature_name.replace('_encoded', '')
+            value = feature_dict.get(original_col, 'Unknown')
+            if original_col in predictor.label_encoders:
+                try:
+                    encoded_value = predictor.label_encoders[original_col].transform([value])[0]
+                except ValueError:
+                    encoded_value = 0
+                feature_vector.append(encoded_value)
+            else:
+                feature_vector.append(0)
+        else:
+            feature_vector.append(feature_dict.get(feature_name, 0))
+
+    features_scaled = predictor.scaler.transform([feature_vector])
+    return predictor.ml_model.predict_proba(features_scaled)[0][1]
+
+
+def per_row_us(fn, rows: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) / rows * 1e6
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    predictor = HybridAdmissionsPredictor(str(MODEL_PATH))
+    if not predictor.ml_available:
+        print("ML model not available")
+        sys.exit(1)
+
+    rng = random.Random(42)
+    applicants = [synthetic_applicant(rng) for _ in range(n)]
+
+    numpy_predictor = HybridAdmissionsPredictor(str(MODEL_PATH), backend='numpy')
+    if not numpy_predictor.ml_available:
+        print("Compiled model not available; run tree_compiler.py first")
+        sys.exit(1)
+
+    # Correctness: every path must match the original bit for bit
+    reference = np.array([reference_prediction(predictor, a) for a in applicants])
+    paths = {
+        'fused single row': lambda: [predictor.get_ml_prediction(a) for a in applicants],
+        'fused batch': lambda: predictor.get_ml_predictions(applicants),
+        'numpy single row': lambda: [numpy_predictor.get_ml_prediction(a) for a in applicants],
+        'numpy batch': lambda: numpy_predictor.get_ml_predictions(applicants),
+    }
+    mismatches = 0
+    print(f"Correctness on {n} applicants:")
+    for name, fn in paths.items():
+        result = np.array(fn())
+        path_mismatches = int(np.sum(reference != result))
+        mismatches += path_mismatches
+        print(f"  {name:<20}{path_mismatches} mismatches (max abs diff {np.abs(reference - result).max():.2e})")
+
+    # Latency
+    reference_us = per_row_us(lambda: [reference_prediction(predictor, a) for a in applicants], n)
+
+    print()
+    print(f"{'path':<32}{'us/row':>10}{'speedup':>10}")
+    print(f"{'sklearn wrappers (original)':<32}{reference_us:>10.1f}{1:>10.1f}x")
+    for name, fn in paths.items():
+        us = per_row_us(fn, n)
+        print(f"{name:<32}{us:>10.1f}{reference_us / us:>10.1f}x")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Parity check for HybridAdmissionsPredictor inference against XGBoost itself
+
+Scores fixed raw feature rows (seeded; once complete and once with a fifth
+of the cells NaN, so the trees' default directions are exercised) through
+  - the fused path (scaler folded into the input + booster.inplace_predict)
+  - a TreeEnsemble compiled in memory from the booster (tree_compiler.py)
+  - the NumPy backend loading the compiled .npz next to the model, if any
+and compares every probability with booster.predict() on a DMatrix of the
+sklearn-scaled rows. Nothing is written; exits 1 on any mismatch.
+
+Run from the ml directory:
+    python inference_check.py [admissions_model.pkl]
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from ml_integration import HybridAdmissionsPredictor
+from tree_compiler import TreeEnsemble
+
+MODEL_PATH = Path(__file__).parent / 'admissions_model.pkl'
+NUM_ROWS = 20000
+
+
+def fixed_inputs(scaler, num_rows: int = NUM_ROWS) -> List[Tuple[str, np.ndarray]]:
+    """Raw (unscaled) float64 feature rows spread around the training data, without and with NaNs"""
+    rng = np.random.default_rng(0)
+    rows = scaler.mean_ + scaler.scale_ * rng.normal(size=(num_rows, len(scaler.mean_))) * 2
+    with_missing = rows.copy()
+    with_missing[rng.random(rows.shape) < 0.2] = np.nan
+    return [("complete", rows), ("20% NaN", with_missing)]
+
+
+def reference_probabilities(model_data: Dict, rows: np.ndarray, iteration_range) -> np.ndarray:
+    """booster.predict on the rows scaled by the pickled StandardScaler"""
+    import xgboost
+
+    model = model_data['model']
+    scaled = model_data['scaler'].transform(rows).astype(np.float32)
+    dmatrix = xgboost.DMatrix(scaled, missing=model.missing)
+    return model.get_booster().predict(dmatrix, iteration_range=iteration_range)
+
+
+def compare(label: str, expected: np.ndarray, actual: np.ndarray) -> bool:
+    mismatches = int(np.sum(expected != actual))
+    print(f"{label}: {mismatches} mismatches in {len(expected)} rows "
+          f"(max abs diff {np.max(np.abs(expected - actual)):.3g})")
+    return mismatches == 0
+
+
+def main():
+    import joblib
+
+    model_path = sys.argv[1] if len(sys.argv) > 1 else str(MODEL_PATH)
+    model_data = joblib.load(model_path)
+    fused = HybridAdmissionsPredictor(model_path, backend='xgboost')
+    if fused._booster is None:
+        print(f"{model_path} is not an XGBoost model; nothing to check")
+        sys.exit(1)
+
+    ensemble = TreeEnsemble.from_booster(fused._booster, fused._iteration_range)
+    compiled = None
+    if Path(model_path).with_suffix('.npz').exists():
+        compiled = HybridAdmissionsPredictor(model_path, backend='numpy')
+        if not compiled.ml_available:
+            print(f"{Path(model_path).with_suffix('.npz')} could not be loaded")
+            sys.exit(1)
+    else:
+        print(f"No compiled model next to {model_path}; skipping the NumPy backend")
+
+    passed = True
+    for label, rows in fixed_inputs(model_data['scaler']):
+        expected = reference_probabilities(model_data, rows, fused._iteration_range)
+        passed &= compare(f"fused path, {label}", expected, fused._predict_feature_matrix(rows.copy()))
+
+        scaled = model_data['scaler'].transform(rows).astype(np.float32)
+        passed &= compare(f"compiled in memory, {label}", expected, ensemble.predict_proba(scaled))
+        if compiled is not None:
+            passed &= compare(f"NumPy backend (.npz), {label}", expected, compiled._predict_feature_matrix(rows.copy()))
+
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
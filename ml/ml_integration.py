@@ -3,11 +3,27 @@ ML Model Integration with FastAPI Backend
 Combines rule-based system with trained ML model
 """
 
-import joblib
+import hashlib
+import os
+import threading
 import numpy as np
-from typing import Dict
+from typing import Dict, Optional
 from pathlib import Path
 
+# Code used for categories the label encoders never saw during training
+UNKNOWN_CATEGORY_CODE = 0
+
+# 'xgboost' loads the pickled XGBClassifier; 'numpy' loads the compiled
+# .npz next to it (see tree_compiler.py) and never imports xgboost or sklearn
+ML_BACKENDS = ('xgboost', 'numpy')
+DEFAULT_ML_BACKEND = os.environ.get('ML_BACKEND', 'xgboost')
+
+def model_file_version(model_path: str) -> str:
+    """Short content hash identifying a model file"""
+    with open(model_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
 class HybridAdmissionsPredictor:
     """
     Hybrid system that combines:
@@ -15,23 +31,90 @@ class HybridAdmissionsPredictor:
     2. ML model predictions (from trained model)
     """
 
-    def __init__(self, model_path: str = None):
+    def __init__(self, model_path: str = None, backend: str = None):
         self.ml_model = None
+        self.tree_ensemble = None
         self.ml_available = False
+        self.model_version = None
+        self.backend = backend or DEFAULT_ML_BACKEND
 
-        if model_path and Path(model_path).exists():
+        if self.backend not in ML_BACKENDS:
+            raise ValueError(f"Unknown ML backend {self.backend!r}, expected one of {ML_BACKENDS}")
+
+        if model_path and self._model_files_exist(model_path):
             try:
-                model_data = joblib.load(model_path)
-                self.ml_model = model_data['model']
-                self.scaler = model_data['scaler']
-                self.label_encoders = model_data['label_encoders']
-                self.feature_names = model_data['feature_names']
+                if self.backend == 'numpy':
+                    self._load_compiled(model_path)
+                else:
+                    self._load_pickle(model_path)
                 self.ml_available = True
-                print(f"ML model loaded successfully from {model_path}")
+                print(f"ML model loaded successfully from {model_path} ({self.backend} backend)")
             except Exception as e:
                 print(f"Failed to load ML model: {e}")
                 print("Falling back to rule-based system only")
 
+    def _model_files_exist(self, model_path: str) -> bool:
+        if self.backend == 'numpy':
+            # The API can be deployed with only the compiled .npz
+            return Path(model_path).with_suffix('.npz').exists()
+        return Path(model_path).exists()
+
+    def _load_pickle(self, model_path: str):
+        """Load the trained XGBClassifier, scaler and label encoders"""
+        import joblib
+
+        model_data = joblib.load(model_path)
+        self.ml_model = model_data['model']
+        self.scaler = model_data['scaler']
+        self.label_encoders = model_data['label_encoders']
+        self.feature_names = model_data['feature_names']
+        self.model_version = model_file_version(model_path)
+
+        scaler_mean = self.scaler.mean_ if self.scaler.with_mean else np.zeros(len(self.feature_names))
+        scaler_scale = self.scaler.scale_ if self.scaler.with_std else np.ones(len(self.feature_names))
+        self._compile_feature_plan(
+            {column: encoder.classes_.tolist() for column, encoder in self.label_encoders.items()},
+            scaler_mean, scaler_scale
+        )
+
+        # Call the XGBoost booster directly, skipping the sklearn wrappers
+        if hasattr(self.ml_model, 'get_booster'):
+            self._booster = self.ml_model.get_booster()
+            self._missing = self.ml_model.missing
+            try:
+                # Matches XGBClassifier.predict_proba when early stopping was used
+                self._iteration_range = (0, self._booster.best_iteration + 1)
+            except AttributeError:
+                self._iteration_range = (0, 0)
+        else:
+            self._booster = None
+
+    def _load_compiled(self, model_path: str):
+        """
+        Load the NumPy tree ensemble compiled from model_path (the .pkl or the
+        .npz itself). Refuses an .npz compiled from a different .pkl.
+        """
+        from tree_compiler import COMPILED_FORMAT_VERSION, TreeEnsemble
+
+        model_path = Path(model_path)
+        compiled_path = model_path.with_suffix('.npz')
+        with np.load(compiled_path) as compiled:
+            if int(compiled['format']) != COMPILED_FORMAT_VERSION:
+                raise ValueError(f"Unsupported compiled model format {compiled['format']} in {compiled_path}")
+
+            source_version = str(compiled['source_version'])
+            if model_path.suffix != '.npz' and model_path.exists() and model_file_version(model_path) != source_version:
+                raise ValueError(f"{compiled_path} is stale; re-run tree_compiler.py on {model_path}")
+
+            self.tree_ensemble = TreeEnsemble.from_arrays(compiled)
+            self.feature_names = compiled['feature_names'].tolist()
+            self.model_version = source_version
+            self._booster = None
+            self._compile_feature_plan(
+                {column: compiled[f'classes_{column}'].tolist() for column in compiled['encoder_columns'].tolist()},
+                compiled['scaler_mean'], compiled['scaler_scale']
+            )
+
     def prepare_ml_features(self, applicant) -> Dict:
         """Convert applicant data to ML model features"""
 
@@ -89,6 +172,73 @@ class HybridAdmissionsPredictor:
 
         return features
 
+    def _compile_feature_plan(self, encoder_classes: Dict[str, list],
+                              scaler_mean: np.ndarray, scaler_scale: np.ndarray):
+        """
+        Precompute how each model input is filled: categorical features get a
+        plain dict lookup table (class -> LabelEncoder code) instead of a
+        LabelEncoder.transform call per request.
+        """
+        self.category_codes = {
+            column: {value: code for code, value in enumerate(classes)}
+            for column, classes in encoder_classes.items()
+        }
+
+        # (feature_dict key, lookup table or None) in model input order
+        self._feature_plan = []
+        for feature_name in self.feature_names:
+            if feature_name.endswith('_encoded'):
+                original_col = feature_name.replace('_encoded', '')
+                # Columns without an encoder always encode to the unknown code
+                self._feature_plan.append((original_col, self.category_codes.get(original_col, {})))
+            else:
+                self._feature_plan.append((feature_name, None))
+
+        # StandardScaler folded into two arrays applied in place
+        self._scaler_mean = np.asarray(scaler_mean, dtype=np.float64)
+        self._scaler_scale = np.asarray(scaler_scale, dtype=np.float64)
+
+        self._row_buffers = threading.local()
+
+    def _fill_feature_row(self, applicant, row: np.ndarray):
+        """Write the applicant's model inputs into a preallocated row"""
+        feature_dict = self.prepare_ml_features(applicant)
+        for i, (key, codes) in enumerate(self._feature_plan):
+            if codes is None:
+                row[i] = feature_dict.get(key, 0)
+            else:
+                row[i] = codes.get(feature_dict.get(key, 'Unknown'), UNKNOWN_CATEGORY_CODE)
+
+    def _single_row(self) -> np.ndarray:
+        """Per-thread (1, n_features) buffer reused across requests"""
+        row = getattr(self._row_buffers, 'row', None)
+        if row is None:
+            row = self._row_buffers.row = np.zeros((1, len(self._feature_plan)))
+            self._row_buffers.row32 = np.zeros((1, len(self._feature_plan)), dtype=np.float32)
+        return row
+
+    def _predict_feature_matrix(self, features: np.ndarray, out32: np.ndarray = None) -> np.ndarray:
+        """
+        Positive-class probability for raw (unscaled) float64 feature rows.
+        features is scaled in place; out32 is an optional float32 buffer of
+        the same shape for the booster input.
+        """
+        if self._booster is None and self.tree_ensemble is None:
+            return self.ml_model.predict_proba(self.scaler.transform(features))[:, 1]
+
+        np.subtract(features, self._scaler_mean, out=features)
+        np.divide(features, self._scaler_scale, out=features)
+        if out32 is None:
+            out32 = np.empty(features.shape, dtype=np.float32)
+        np.copyto(out32, features, casting='same_kind')
+
+        if self.tree_ensemble is not None:
+            return self.tree_ensemble.predict_proba(out32)
+
+        return self._booster.inplace_predict(
+            out32, iteration_range=self._iteration_range, missing=self._missing
+        )
+
     def get_ml_prediction(self, applicant) -> float:
         """Get prediction from ML model"""
 
@@ -96,30 +246,12 @@ class HybridAdmissionsPredictor:
             return None
 
         try:
-            # Prepare features
-            feature_dict = self.prepare_ml_features(applicant)
-
             # Convert to feature vector in correct order
-            feature_vector = []
-            for feature_name in self.feature_names:
-                if feature_name.endswith('_encoded'):
-                    # Handle categorical features
-                    original_col = feature_name.replace('_encoded', '')
-                    value = feature_dict.get(original_col, 'Unknown')
-                    if original_col in self.label_encoders:
-                        try:
-                            encoded_value = self.label_encoders[original_col].transform([value])[0]
-                        except:
-                            encoded_value = 0
-                        feature_vector.append(encoded_value)
-                    else:
-                        feature_vector.append(0)
-                else:
-                    feature_vector.append(feature_dict.get(feature_name, 0))
+            feature_row = self._single_row()
+            self._fill_feature_row(applicant, feature_row[0])
 
             # Scale and predict
-            features_scaled = self.scaler.transform([feature_vector])
-            probability = self.ml_model.predict_proba(features_scaled)[0][1]
+            probability = self._predict_feature_matrix(feature_row, self._row_buffers.row32)[0]
 
             return probability
 
@@ -127,6 +259,80 @@ class HybridAdmissionsPredictor:
             print(f"ML prediction failed: {e}")
             return None
 
+    def get_ml_predictions(self, applicants) -> Optional[np.ndarray]:
+        """
+        Batch version of get_ml_prediction: one scaling pass and one model
+        call for all applicants
+        """
+
+        if not self.ml_available or not applicants:
+            return None
+
+        try:
+            feature_matrix = np.empty((len(applicants), len(self._feature_plan)))
+            for row, applicant in zip(feature_matrix, applicants):
+                self._fill_feature_row(applicant, row)
+            return self._predict_feature_matrix(feature_matrix)
+
+        except Exception as e:
+            print(f"ML batch prediction failed: {e}")
+            return None
+
+    def prepare_ml_feature_columns(self, applicant, overrides: Dict[str, np.ndarray]) -> Dict:
+        """
+        prepare_ml_features() for copies of one applicant whose gpa_unweighted,
+        sat_score and/or num_ap_courses are replaced by the equal-length arrays
+        in overrides. Features derived from them become arrays (same
+        arithmetic, so the same values); the rest stay scalars.
+        """
+        features = self.prepare_ml_features(applicant)
+
+        if 'gpa_unweighted' in overrides:
+            gpa = overrides['gpa_unweighted']
+            features['gpa_unweighted'] = gpa
+            if not applicant.gpa_weighted:
+                features['gpa_weighted'] = gpa * 1.1
+            features['gpa_difference'] = features['gpa_weighted'] - gpa
+
+        if 'sat_score' in overrides:
+            sat = overrides['sat_score']
+            features['sat_total'] = sat
+            features['standardized_test'] = np.where(sat > 0, sat, features['sat_equivalent'])
+
+        if 'num_ap_courses' in overrides:
+            features['num_ap_courses'] = overrides['num_ap_courses']
+
+        features['academic_index'] = (
+            (features['gpa_unweighted'] / 4.0) * 40 +
+            (features['standardized_test'] / 1600) * 40 +
+            np.minimum(features['num_ap_courses'] / 10, 1.0) * 20
+        )
+        return features
+
+    def get_sweep_predictions(self, applicant, overrides: Dict[str, np.ndarray], size: int) -> Optional[np.ndarray]:
+        """
+        ML probabilities for `size` variants of one applicant (see
+        prepare_ml_feature_columns), filled column by column and scored in
+        one model call
+        """
+
+        if not self.ml_available:
+            return None
+
+        try:
+            features = self.prepare_ml_feature_columns(applicant, overrides)
+            feature_matrix = np.empty((size, len(self._feature_plan)))
+            for i, (key, codes) in enumerate(self._feature_plan):
+                if codes is None:
+                    feature_matrix[:, i] = features.get(key, 0)
+                else:
+                    feature_matrix[:, i] = codes.get(features.get(key, 'Unknown'), UNKNOWN_CATEGORY_CODE)
+            return self._predict_feature_matrix(feature_matrix)
+
+        except Exception as e:
+            print(f"ML sweep prediction failed: {e}")
+            return None
+
     def get_hybrid_prediction(self, applicant, rule_based_probability: float) -> Dict:
         """
         Combine rule-based and ML predictions
@@ -137,6 +343,10 @@ class HybridAdmissionsPredictor:
         """
 
         ml_probability = self.get_ml_prediction(applicant)
+        return self.combine_predictions(ml_probability, rule_based_probability)
+
+    def combine_predictions(self, ml_probability: Optional[float], rule_based_probability: float) -> Dict:
+        """Blend an ML probability (or None) with the rule-based probability"""
 
         if ml_probability is not None:
             # Convert numpy types to Python native types
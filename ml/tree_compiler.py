@@ -0,0 +1,248 @@
+"""
+Pure-NumPy tree ensemble compiled from the trained XGBoost model
+
+compile_model() dumps the booster in admissions_model.pkl into flat arrays
+(feature index, threshold, left/right child, default direction and leaf
+value per node) and saves them, together with the scaler statistics,
+label-encoder classes and feature order, as admissions_model.npz.
+TreeEnsemble scores a batch by walking every (row, tree) pair one level
+per step, so the Python loop runs max_depth times instead of once per node.
+
+Loading the .npz needs only NumPy - no xgboost, sklearn or joblib.
+
+The output path is always given explicitly, so running the compiler never
+overwrites the committed .npz by accident. inference_check.py compares the
+compiled ensemble with XGBoost without writing anything.
+
+Usage:
+    python tree_compiler.py admissions_model.pkl admissions_model.npz
+"""
+
+import ctypes
+import ctypes.util
+import json
+import sys
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+COMPILED_FORMAT_VERSION = 1
+
+
+def _load_libm_expf():
+    """The C runtime's expf, which XGBoost uses for the logistic transform"""
+    for name in (ctypes.util.find_library('m'), 'ucrtbase', 'msvcrt'):
+        if not name:
+            continue
+        try:
+            expf = ctypes.CDLL(name).expf
+        except (OSError, AttributeError):
+            continue
+        expf.restype = ctypes.c_float
+        expf.argtypes = [ctypes.c_float]
+        return expf
+    return None
+
+
+_libm_expf = _load_libm_expf()
+
+
+def expf(x: np.ndarray) -> np.ndarray:
+    """
+    float32 exp matching the C library's expf bit for bit.
+
+    exp is computed in float64 and rounded to float32. That equals expf
+    everywhere except where the exact result lies very close to a float32
+    rounding midpoint (libm expf is accurate to ~0.502 ULP, not correctly
+    rounded). Those few elements are recomputed with the real expf.
+    """
+    x = np.asarray(x, dtype=np.float32)
+    exact = np.exp(x.astype(np.float64))
+    result = exact.astype(np.float32)
+
+    if _libm_expf is not None and result.size:
+        result64 = result.astype(np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ulps = np.abs(exact - result64) / np.spacing(result).astype(np.float64)
+        mantissa = result.view(np.uint32) & 0x7FFFFF
+        ambiguous = (np.abs(ulps - 0.5) < 0.01) | (mantissa == 0) | ~np.isfinite(ulps)
+        for i in np.flatnonzero(ambiguous):
+            result.flat[i] = _libm_expf(float(x.flat[i]))
+
+    return result
+
+
+class TreeEnsemble:
+    """Flat-array gradient boosted trees with a logistic output"""
+
+    ARRAYS = ['roots', 'feature', 'threshold', 'left', 'right', 'default_left', 'leaf_value']
+
+    def __init__(self, arrays: Dict[str, np.ndarray], base_margin: float, max_depth: int):
+        self.roots = arrays['roots'].astype(np.int32)
+        self.feature = arrays['feature'].astype(np.int32)
+        self.threshold = arrays['threshold'].astype(np.float32)
+        self.left = arrays['left'].astype(np.int32)
+        self.right = arrays['right'].astype(np.int32)
+        self.default_left = arrays['default_left'].astype(bool)
+        self.leaf_value = arrays['leaf_value'].astype(np.float32)
+        self.base_margin = np.float32(base_margin)
+        self.max_depth = int(max_depth)
+
+        # children[2 * node + go_right] is the next node
+        self.children = np.column_stack([self.left, self.right]).ravel()
+
+    @classmethod
+    def from_booster(cls, booster, iteration_range=(0, 0)) -> "TreeEnsemble":
+        """Flatten an xgboost.Booster (binary:logistic, numeric splits only)"""
+        model = json.loads(booster.save_raw(raw_format='json'))
+        learner = model['learner']
+        objective = learner['objective']['name']
+        if objective != 'binary:logistic':
+            raise ValueError(f"Unsupported objective {objective}")
+
+        trees = learner['gradient_booster']['model']['trees']
+        begin, end = iteration_range
+        if end:
+            trees = trees[begin:end]
+
+        roots, feature, threshold, left, right, default_left, leaf_value = [], [], [], [], [], [], []
+        max_depth = 0
+        for tree in trees:
+            if any(tree['split_type']):
+                raise ValueError("Categorical splits are not supported")
+
+            offset = len(feature)
+            roots.append(offset)
+            depth = {0: 0}
+            for node, (lc, rc) in enumerate(zip(tree['left_children'], tree['right_children'])):
+                if lc == -1:
+                    # Leaves point at themselves so extra traversal steps are no-ops
+                    feature.append(0)
+                    threshold.append(0.0)
+                    left.append(offset + node)
+                    right.append(offset + node)
+                    default_left.append(True)
+                    leaf_value.append(tree['split_conditions'][node])
+                else:
+                    feature.append(tree['split_indices'][node])
+                    threshold.append(tree['split_conditions'][node])
+                    left.append(offset + lc)
+                    right.append(offset + rc)
+                    default_left.append(bool(tree['default_left'][node]))
+                    leaf_value.append(0.0)
+                    depth[lc] = depth[rc] = depth[node] + 1
+            max_depth = max(max_depth, max(depth.values()))
+
+        # base_score is stored as a probability; XGBoost turns it into a
+        # margin in float32 as -log(1/p - 1)
+        base_score = np.float32(float(learner['learner_model_param']['base_score']))
+        base_margin = -np.log(np.float32(1.0) / base_score - np.float32(1.0))
+
+        arrays = {
+            'roots': np.array(roots), 'feature': np.array(feature),
+            'threshold': np.array(threshold, dtype=np.float32),
+            'left': np.array(left), 'right': np.array(right),
+            'default_left': np.array(default_left), 'leaf_value': np.array(leaf_value, dtype=np.float32),
+        }
+        return cls(arrays, base_margin, max_depth)
+
+    def leaf_indices(self, features: np.ndarray) -> np.ndarray:
+        """(n_rows, n_trees) node index of the leaf each row lands in"""
+        features = np.ascontiguousarray(features, dtype=np.float32)
+        n_rows, n_features = features.shape
+        flat = features.ravel()
+        row_offsets = (np.arange(n_rows) * n_features)[:, None]
+        has_missing = bool(np.isnan(flat).any())
+
+        nodes = np.tile(self.roots, (n_rows, 1))
+        for _ in range(self.max_depth):
+            values = flat.take(row_offsets + self.feature.take(nodes))
+            # XGBoost goes left on value < threshold; NaN follows default_left
+            go_right = values >= self.threshold.take(nodes)
+            if has_missing:
+                go_right |= np.isnan(values) & ~self.default_left.take(nodes)
+            nodes = self.children.take(2 * nodes + go_right)
+        return nodes
+
+    def predict_margin(self, features: np.ndarray) -> np.ndarray:
+        """
+        Raw float32 margins. Leaves are accumulated onto the base margin one
+        tree at a time in float32, the same order XGBoost's CPU predictor uses.
+        """
+        leaves = self.leaf_value[self.leaf_indices(features)]
+        terms = np.empty((leaves.shape[0], leaves.shape[1] + 1), dtype=np.float32)
+        terms[:, 0] = self.base_margin
+        terms[:, 1:] = leaves
+        return np.add.accumulate(terms, axis=1, dtype=np.float32)[:, -1]
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """Positive-class probability, XGBoost's float32 sigmoid"""
+        margin = self.predict_margin(features)
+        exp = expf(np.minimum(-margin, np.float32(88.7)))
+        return np.float32(1.0) / (exp + np.float32(1.0))
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        arrays = {name: getattr(self, name) for name in self.ARRAYS}
+        arrays['base_margin'] = np.array(self.base_margin, dtype=np.float32)
+        arrays['max_depth'] = np.array(self.max_depth)
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays) -> "TreeEnsemble":
+        return cls({name: arrays[name] for name in cls.ARRAYS},
+                   arrays['base_margin'][()], arrays['max_depth'][()])
+
+
+def compile_model(model_path: str, output_path: str) -> Path:
+    """
+    Compile admissions_model.pkl into an .npz with everything
+    HybridAdmissionsPredictor needs for the 'numpy' backend
+    """
+    import joblib
+    from ml_integration import model_file_version
+
+    output_path = Path(output_path)
+    model_data = joblib.load(model_path)
+    model = model_data['model']
+    booster = model.get_booster()
+    try:
+        iteration_range = (0, booster.best_iteration + 1)
+    except AttributeError:
+        iteration_range = (0, 0)
+
+    ensemble = TreeEnsemble.from_booster(booster, iteration_range)
+    scaler = model_data['scaler']
+    n_features = len(model_data['feature_names'])
+
+    arrays = ensemble.to_arrays()
+    arrays.update({
+        'format': np.array(COMPILED_FORMAT_VERSION),
+        'source_version': np.array(model_file_version(model_path)),
+        'feature_names': np.array(model_data['feature_names']),
+        'scaler_mean': scaler.mean_ if scaler.with_mean else np.zeros(n_features),
+        'scaler_scale': scaler.scale_ if scaler.with_std else np.ones(n_features),
+        'encoder_columns': np.array(list(model_data['label_encoders'])),
+    })
+    for column, encoder in model_data['label_encoders'].items():
+        arrays[f'classes_{column}'] = np.array(encoder.classes_.tolist())
+
+    np.savez(output_path, **arrays)
+    return output_path
+
+
+def main():
+    if len(sys.argv) != 3:
+        print(__doc__)
+        sys.exit(1)
+
+    output_path = compile_model(sys.argv[1], sys.argv[2])
+    with np.load(output_path) as compiled:
+        ensemble = TreeEnsemble.from_arrays(compiled)
+    print(f"Compiled {len(ensemble.roots)} trees ({len(ensemble.feature)} nodes, "
+          f"max depth {ensemble.max_depth}) into {output_path}")
+    print("Run inference_check.py to compare it with XGBoost")
+
+
+if __name__ == "__main__":
+    main()